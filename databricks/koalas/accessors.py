@@ -16,26 +16,34 @@
 """
 Koalas specific features.
 """
+import hashlib
 import inspect
 from distutils.version import LooseVersion
-from typing import Any, Optional, Tuple, Union, TYPE_CHECKING, cast
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING, cast
 import types
 
 import numpy as np  # noqa: F401
 import pandas as pd
+from pandas.api.types import CategoricalDtype, pandas_dtype
 import pyspark
+from pyspark import sql as spark
 from pyspark.sql import functions as F
 from pyspark.sql.functions import pandas_udf, PandasUDFType
 from pyspark.sql.types import StructField, StructType
 
+from databricks.koalas.config import get_option
 from databricks.koalas.internal import (
     InternalFrame,
+    NATURAL_ORDER_COLUMN_NAME,
     SPARK_INDEX_NAME_FORMAT,
     SPARK_DEFAULT_SERIES_NAME,
 )
 from databricks.koalas.typedef import infer_return_type, DataFrameType, ScalarType, SeriesType
 from databricks.koalas.spark.utils import as_nullable_spark_type, force_decimal_precision_scale
 from databricks.koalas.utils import (
+    default_session,
     is_name_like_value,
     is_name_like_tuple,
     name_like_string,
@@ -740,6 +748,379 @@ class KoalasFrameMethods(object):
                 )
                 return DataFrame(internal)
 
+    def build_index(
+        self,
+        columns: Optional[Union[Any, Tuple, List[Union[Any, Tuple]]]] = None,
+        kind: str = "hash",
+        num_partitions: Optional[int] = None,
+    ) -> "DataFrame":
+        """
+        Materialize a copy of the DataFrame laid out by its index, together with a key
+        directory kept in the driver, so that point lookups by the index only read the
+        partitions which can hold the key instead of scanning the whole DataFrame.
+
+        The lookups taking advantage of the directory are `DataFrame.at`, `Series.at`,
+        `DataFrame.loc` and `Series.loc` with a scalar key (or a tuple of keys for
+        a multi-index), `Series.get`, and `Series.asof` with a scalar for the 'sorted' kind.
+        Their results are the same as without the directory.
+
+        .. note:: The copy is checkpointed locally with `spark.local_checkpoint`, and the
+            directory is lost by any operation deriving a new DataFrame from it.
+
+        Parameters
+        ----------
+        columns : label or list of labels, optional
+            The column(s) to index by, set as the index like `DataFrame.set_index`.
+            If not specified, the current index is used.
+        kind : {'hash', 'sorted'}, default 'hash'
+            - 'hash' : hash-partition the rows by the index. A full key is resolved to its
+              partition without looking at the data.
+            - 'sorted' : range-partition the rows by the index. Keys and key prefixes are
+              resolved through the smallest and largest keys of each partition, and the
+              resulting DataFrame is sorted by the index.
+        num_partitions : int, optional
+            The number of partitions of the copy.
+            The default is `spark.sql.shuffle.partitions`.
+
+        Returns
+        -------
+        DataFrame
+            The indexed DataFrame.
+
+        Examples
+        --------
+        >>> df = ks.DataFrame({"id": ["c", "a", "b"], "x": [3, 1, 2]})
+        >>> indexed = df.koalas.build_index("id", kind="sorted", num_partitions=2)
+        >>> indexed  # doctest: +NORMALIZE_WHITESPACE
+            x
+        id
+        a   1
+        b   2
+        c   3
+
+        >>> indexed.at["b", "x"]
+        2
+
+        >>> indexed.x.get("d", -1)
+        -1
+        """
+        from databricks.koalas.frame import DataFrame
+        from databricks.koalas.key_directory import KeyDirectory
+
+        if kind not in ("hash", "sorted"):
+            raise ValueError("kind should be either 'hash' or 'sorted'")
+        if num_partitions is None:
+            num_partitions = int(
+                default_session().conf.get("spark.sql.shuffle.partitions")  # type: ignore
+            )
+        elif not isinstance(num_partitions, int) or num_partitions < 1:
+            raise ValueError("num_partitions should be a positive integer")
+
+        kdf = self._kdf if columns is None else self._kdf.set_index(columns)
+
+        internal = kdf._internal.resolved_copy
+        sdf = internal.spark_frame.drop(NATURAL_ORDER_COLUMN_NAME)
+        index_scols = [scol_for(sdf, col) for col in internal.index_spark_column_names]
+        if kind == "hash":
+            sdf = sdf.repartition(num_partitions, *index_scols)
+        else:
+            sdf = sdf.repartitionByRange(num_partitions, *index_scols)
+        sdf = sdf.sortWithinPartitions(*index_scols).localCheckpoint(eager=True)
+
+        internal = internal.with_new_sdf(sdf)
+        return DataFrame(
+            internal.with_key_directory(KeyDirectory.build(internal, kind, num_partitions))
+        )
+
+    def bucket_by(
+        self,
+        keys: Union[Any, Tuple, List[Union[Any, Tuple]]],
+        num_buckets: int,
+        name: str,
+        format: Optional[str] = None,
+        mode: str = "overwrite",
+        **options
+    ) -> "DataFrame":
+        """
+        Write the DataFrame as a Spark table bucketed and sorted by the given keys, and
+        return the DataFrame reading the table.
+
+        The table keeps the index, the column labels and the dtypes, and its bucketed layout is
+        recorded in the table metadata, so `DataFrame.merge` and `DataFrame.join` on exactly
+        the bucket keys do not shuffle the table: the other side is repartitioned in the same
+        way instead, unless it is small enough to be broadcast. The layout is also recognized
+        when the table is read again by `ks.read_table` with the index columns restored.
+
+        Parameters
+        ----------
+        keys : label or list of labels
+            The column labels or index level names to bucket by.
+        num_buckets : int
+            The number of buckets.
+        name : str
+            Table name in Spark.
+        format : string, optional
+            Specifies the output data source format. Some common ones are:
+
+            - 'parquet'
+            - 'orc'
+            - 'json'
+            - 'csv'
+
+            The default is `spark.sql.sources.default`.
+        mode : str {'append', 'overwrite', 'ignore', 'error', 'errorifexists'}, default
+            'overwrite'. Specifies the behavior of the save operation when the table exists
+            already.
+        options
+            Additional options passed directly to Spark.
+
+        Returns
+        -------
+        DataFrame
+            The DataFrame reading the bucketed table.
+
+        See Also
+        --------
+        DataFrame.to_table
+        read_table
+
+        Examples
+        --------
+        >>> df = ks.DataFrame({"id": [3, 1, 2], "x": ["c", "a", "b"]})
+        >>> bucketed = df.koalas.bucket_by("id", 4, "%s.bucketed_table" % db)
+        >>> bucketed.sort_values("id")  # doctest: +NORMALIZE_WHITESPACE
+           id  x
+        1   1  a
+        2   2  b
+        0   3  c
+        """
+        from databricks.koalas.frame import DataFrame
+
+        if not isinstance(num_buckets, int) or num_buckets < 1:
+            raise ValueError("num_buckets should be a positive integer")
+
+        if is_name_like_tuple(keys):
+            keys = [keys]
+        elif is_name_like_value(keys):
+            keys = [(keys,)]
+        else:
+            keys = [key if is_name_like_tuple(key) else (key,) for key in keys]
+        if len(keys) == 0:
+            raise ValueError("keys should not be empty")
+
+        internal = self._kdf._internal.resolved_copy
+        key_names = []
+        for key in keys:
+            if key in internal.column_labels:
+                key_names.append(internal.spark_column_name_for(key))
+            elif key in internal.index_names:
+                key_names.append(internal.index_spark_column_names[internal.index_names.index(key)])
+            else:
+                raise KeyError(name_like_string(key))
+
+        sdf = internal.spark_frame.drop(NATURAL_ORDER_COLUMN_NAME)
+        sdf.write.bucketBy(num_buckets, *key_names).sortBy(*key_names).saveAsTable(
+            name=name, format=format, mode=mode, **options
+        )
+        return DataFrame(internal.with_new_sdf(default_session().read.table(name)))
+
+    def cache_to_disk(self, key: Optional[str] = None, path: Optional[str] = None) -> "DataFrame":
+        """
+        Write the DataFrame to a Parquet cache on disk, or read it from the cache if it was
+        written before, and return the DataFrame reading the cache.
+
+        The cache keeps the index, the column labels and the dtypes, so the DataFrame read
+        from the cache is the same as the original one without computing it again or attaching
+        the default index. The cache persists across sessions in `path`.
+
+        By default, the cache is keyed by the logical plan of the DataFrame and the paths, sizes
+        and modification times of the files it reads, so the cache is invalidated when the
+        computation or the input files change. The DataFrames not read from files or tables,
+        e.g., the ones created from pandas, require `key`.
+
+        Parameters
+        ----------
+        key : str, optional
+            The key of the cache. If not specified, it is derived from the lineage of
+            the DataFrame.
+        path : str, optional
+            The directory to write the caches in. It should be a path that both the driver
+            and the executors can access. The default is `compute.disk_cache_path` option.
+
+        Returns
+        -------
+        DataFrame
+            The DataFrame reading the cache.
+
+        Examples
+        --------
+        >>> ks.range(3).to_parquet('%s/cache_to_disk/data.parquet' % path)
+        >>> df = ks.read_parquet('%s/cache_to_disk/data.parquet' % path)
+        >>> df = df[df.id > 0].rename(columns={'id': 'x'})
+        >>> df.koalas.cache_to_disk(path='%s/cache_to_disk/cache' % path).sort_index()
+        ... # doctest: +NORMALIZE_WHITESPACE
+           x
+        1  1
+        2  2
+        """
+        from databricks.koalas.frame import DataFrame
+
+        if path is None:
+            path = get_option("compute.disk_cache_path")
+            if path is None:
+                raise ValueError(
+                    "path should be specified or 'compute.disk_cache_path' option should be set."
+                )
+
+        internal = self._kdf._internal.resolved_copy
+        # The metadata is written as JSON so that reading a cache never runs any code.
+        metadata = dict(
+            index_names=[_label_to_json(name) for name in internal.index_names],
+            index_dtypes=[_dtype_to_json(dtype) for dtype in internal.index_dtypes],
+            column_labels=[_label_to_json(label) for label in internal.column_labels],
+            data_dtypes=[_dtype_to_json(dtype) for dtype in internal.data_dtypes],
+            column_label_names=[_label_to_json(name) for name in internal.column_label_names],
+        )  # type: Dict[str, Any]
+        sdf = internal.spark_frame.select(
+            [
+                scol.alias("_{}".format(i))
+                for i, scol in enumerate(internal.index_spark_columns + internal.data_spark_columns)
+            ]
+        )
+        if key is None:
+            key = _lineage_key(sdf, metadata)
+
+        spark_session = default_session()
+        jvm = spark_session.sparkContext._jvm
+        conf = spark_session._jsc.hadoopConfiguration()
+        cache_path = jvm.org.apache.hadoop.fs.Path(path, key)
+        data_path = jvm.org.apache.hadoop.fs.Path(cache_path, "data").toString()
+        # The metadata is written after the data, so the cache is complete if it exists.
+        metadata_path = jvm.org.apache.hadoop.fs.Path(cache_path, "_koalas_metadata.json")
+        fs = metadata_path.getFileSystem(conf)
+        if fs.exists(metadata_path):
+            stream = fs.open(metadata_path)
+            try:
+                metadata = json.loads(jvm.org.apache.commons.io.IOUtils.toString(stream, "UTF-8"))
+            finally:
+                stream.close()
+        else:
+            sdf.write.mode("overwrite").parquet(data_path)
+            stream = fs.create(metadata_path, True)
+            try:
+                stream.write(bytearray(json.dumps(metadata).encode("utf-8")))
+            finally:
+                stream.close()
+
+        sdf = spark_session.read.parquet(data_path)
+        num_index_columns = len(metadata["index_dtypes"])
+        return DataFrame(
+            InternalFrame(
+                spark_frame=sdf,
+                index_spark_columns=[scol_for(sdf, col) for col in sdf.columns[:num_index_columns]],
+                index_names=[_label_from_json(name) for name in metadata["index_names"]],
+                index_dtypes=[_dtype_from_json(dtype) for dtype in metadata["index_dtypes"]],
+                column_labels=[_label_from_json(label) for label in metadata["column_labels"]],
+                data_spark_columns=[scol_for(sdf, col) for col in sdf.columns[num_index_columns:]],
+                data_dtypes=[_dtype_from_json(dtype) for dtype in metadata["data_dtypes"]],
+                column_label_names=[
+                    _label_from_json(name) for name in metadata["column_label_names"]
+                ],
+            )
+        )
+
+
+# The leaf nodes of the logical plan which read the same data as long as the input files of
+# the plan are unchanged.
+_FILE_BASED_LEAF_NODES = ("LogicalRelation", "HiveTableRelation", "Range", "OneRowRelation")
+
+
+def _lineage_key(sdf: spark.DataFrame, metadata: Dict[str, Any]) -> str:
+    """
+    Derive the key of the disk cache of a DataFrame from the analyzed logical plan without
+    the expression ids, and the paths, sizes and modification times of the input files.
+
+    :param sdf: the Spark DataFrame to cache.
+    :param metadata: the metadata of the DataFrame such as the column labels and the dtypes.
+    :return: the key.
+    """
+    plan = sdf._jdf.queryExecution().analyzed()
+    leaves = plan.collectLeaves()
+    for i in range(leaves.size()):
+        if leaves.apply(i).getClass().getSimpleName() not in _FILE_BASED_LEAF_NODES:
+            raise ValueError(
+                "key should be specified for the DataFrame not read from files or tables."
+            )
+
+    spark_session = default_session()
+    jvm = spark_session.sparkContext._jvm
+    conf = spark_session._jsc.hadoopConfiguration()
+    files = []
+    for file in sdf._jdf.inputFiles():
+        file_path = jvm.org.apache.hadoop.fs.Path(file)
+        status = file_path.getFileSystem(conf).getFileStatus(file_path)
+        files.append([file, status.getLen(), status.getModificationTime()])
+
+    # Spark truncates the fields in the plan string after 'maxToStringFields' fields by default,
+    # which would give the same key to the plans only different in the later columns.
+    if LooseVersion(pyspark.__version__) < LooseVersion("3.0"):
+        env_conf = jvm.org.apache.spark.SparkEnv.get().conf()
+        max_fields_key = "spark.debug.maxToStringFields"
+        max_fields = env_conf.get(max_fields_key) if env_conf.contains(max_fields_key) else None
+        env_conf.set(max_fields_key, str(jvm.java.lang.Integer.MAX_VALUE))
+        try:
+            plan_string = plan.treeString(False, False)
+        finally:
+            if max_fields is None:
+                env_conf.remove(max_fields_key)
+            else:
+                env_conf.set(max_fields_key, max_fields)
+    else:
+        plan_string = plan.treeString(False, False, jvm.java.lang.Integer.MAX_VALUE, False)
+
+    return hashlib.sha256(
+        json.dumps([re.sub(r"#\d+", "", plan_string), sorted(files), metadata]).encode("utf-8")
+    ).hexdigest()
+
+
+def _scalar_to_json(value: Any) -> Any:
+    """ Return the given label or category as a JSON value. """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    raise TypeError(
+        "cache_to_disk only supports strings, numbers, booleans and None as the labels and "
+        "the categories, but got {} of {}.".format(value, type(value).__name__)
+    )
+
+
+def _label_to_json(label: Optional[Tuple]) -> Optional[List]:
+    """ Return the given label as a JSON list. """
+    return None if label is None else [_scalar_to_json(value) for value in label]
+
+
+def _label_from_json(label: Optional[List]) -> Optional[Tuple]:
+    """ Return the label from the given JSON list. """
+    return None if label is None else tuple(label)
+
+
+def _dtype_to_json(dtype) -> Union[str, Dict[str, Any]]:
+    """ Return the given dtype as its name, or the categories and the order if categorical. """
+    if isinstance(dtype, CategoricalDtype):
+        return dict(
+            categories=[_scalar_to_json(value) for value in dtype.categories],
+            ordered=bool(dtype.ordered),
+        )
+    return str(dtype)
+
+
+def _dtype_from_json(dtype: Union[str, Dict[str, Any]]):
+    """ Return the dtype from the given JSON value. """
+    if isinstance(dtype, dict):
+        return CategoricalDtype(categories=dtype["categories"], ordered=dtype["ordered"])
+    return pandas_dtype(dtype)
+
 
 class KoalasSeriesMethods(object):
     """ Koalas specific features for Series. """
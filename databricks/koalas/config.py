@@ -181,6 +181,19 @@ _options = [
             "Index type should be one of 'sequence', 'distributed', 'distributed-sequence'.",
         ),
     ),
+    Option(
+        key="compute.lazy_default_index",
+        doc=(
+            "'compute.lazy_default_index' sets whether or not to attach the default index of "
+            "the DataFrames read from a data source, e.g., by `read_parquet`, after the rows "
+            "filtered and the columns selected by `loc` or `[]` before the index is used. "
+            "Spark can then push them into the scan, but the default index is renumbered over "
+            "the rows filtered. It applies to the 'sequence' and 'distributed' default index "
+            "types. Default is False."
+        ),
+        default=False,
+        types=bool,
+    ),
     Option(
         key="compute.ordered_head",
         doc=(
@@ -192,6 +205,17 @@ _options = [
         default=False,
         types=bool,
     ),
+    Option(
+        key="compute.disk_cache_path",
+        doc=(
+            "'compute.disk_cache_path' sets the default directory for "
+            "`DataFrame.koalas.cache_to_disk` to write the cached DataFrames in. It should be "
+            "a path that both the driver and the executors can access, such as a path in "
+            "a distributed file system. Default is None."
+        ),
+        default=None,
+        types=(str, type(None)),
+    ),
     Option(
         key="plotting.max_rows",
         doc=(
@@ -0,0 +1,497 @@
+#
+# Copyright (C) 2019 Databricks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+The one-hot encoder behind `ks.get_dummies`, which can be fitted once and reused.
+"""
+from distutils.version import LooseVersion
+from functools import reduce
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from pandas.api.types import is_list_like
+import pyspark
+from pyspark.sql import functions as F, Window
+from pyspark.sql.types import (
+    BooleanType,
+    ByteType,
+    DateType,
+    DecimalType,
+    DoubleType,
+    FloatType,
+    IntegerType,
+    LongType,
+    ShortType,
+    StringType,
+    TimestampType,
+)
+
+from databricks.koalas.frame import DataFrame, _reduce_spark_multi
+from databricks.koalas.series import Series
+from databricks.koalas.utils import (
+    is_name_like_tuple,
+    name_like_string,
+    scol_for,
+    verify_temp_column_name,
+)
+
+
+_get_dummies_default_accept_types = (DecimalType, StringType, DateType)
+_get_dummies_acceptable_types = _get_dummies_default_accept_types + (
+    ByteType,
+    ShortType,
+    IntegerType,
+    LongType,
+    FloatType,
+    DoubleType,
+    BooleanType,
+    TimestampType,
+)
+
+
+class DummyEncoder(object):
+    """
+    A one-hot encoder fitted by `ks.get_dummies.fit`, which keeps the categories of each
+    encoded column so that other DataFrames are encoded the same way without discovering
+    the categories again.
+
+    The encoder only holds the plain Python values given below, so it can be pickled, or
+    created again from the saved `categories`.
+
+    Parameters
+    ----------
+    column_labels : list of tuples
+        The labels of the columns to encode.
+    categories : list of lists
+        The sorted categories of each column to encode.
+    prefix : list of strings, optional
+        The prefix of the dummy columns of each column to encode.
+    prefix_sep : string, default '_'
+        The separator between the prefix and the category.
+    dummy_na : bool, default False
+        Whether to add a column to indicate NaNs.
+    drop_first : bool, default False
+        Whether to drop the first category.
+    dtype : dtype, default np.uint8
+        Data type for the dummy columns.
+
+    Examples
+    --------
+    >>> df = ks.DataFrame({'A': ['a', 'b', 'a'], 'B': ['b', 'a', 'c']},
+    ...                   columns=['A', 'B'])
+    >>> encoder = ks.get_dummies.fit(df, columns=['A'])
+    >>> encoder.categories
+    {'A': ['a', 'b']}
+
+    >>> encoder.transform(ks.DataFrame({'A': ['b', 'c'], 'B': ['x', 'y']}))
+       B  A_a  A_b
+    0  x    0    1
+    1  y    0    0
+    """
+
+    def __init__(
+        self,
+        column_labels: List[Tuple],
+        categories: List[List[Any]],
+        prefix: Optional[List[str]] = None,
+        prefix_sep: str = "_",
+        dummy_na: bool = False,
+        drop_first: bool = False,
+        dtype=None,
+    ):
+        assert len(column_labels) == len(categories)
+        assert prefix is None or len(prefix) == len(column_labels)
+        self._column_labels = column_labels
+        self._categories = categories
+        self._prefix = prefix
+        self._prefix_sep = prefix_sep
+        self._dummy_na = dummy_na
+        self._drop_first = drop_first
+        self._dtype = "byte" if dtype is None else dtype
+
+    @property
+    def categories(self) -> Dict[Union[Any, Tuple], List[Any]]:
+        """ The categories of each encoded column, keyed by the column name. """
+        return dict(
+            (label if len(label) > 1 else label[0], list(categories))
+            for label, categories in zip(self._column_labels, self._categories)
+        )
+
+    @staticmethod
+    def fit(
+        data,
+        prefix=None,
+        prefix_sep="_",
+        dummy_na=False,
+        columns=None,
+        drop_first=False,
+        dtype=None,
+        max_categories=None,
+    ) -> "DummyEncoder":
+        """
+        Discover the categories to encode, with the same parameters as `ks.get_dummies`.
+
+        Parameters
+        ----------
+        data : Series or DataFrame
+        prefix : string, list of strings, or dict of strings, default None
+            String to append DataFrame column names.
+        prefix_sep : string, default '_'
+            If appending prefix, separator/delimiter to use.
+        dummy_na : bool, default False
+            Add a column to indicate NaNs, if False NaNs are ignored.
+        columns : list-like, default None
+            Column names in the DataFrame to be encoded.
+            If `columns` is None then all the columns with
+            `object` or `category` dtype will be converted.
+        drop_first : bool, default False
+            Whether to get k-1 dummies out of k categorical levels by removing the
+            first level.
+        dtype : dtype, default np.uint8
+            Data type for new columns. Only a single dtype is allowed.
+        max_categories : int, optional
+            If set, only the `max_categories` most frequent categories of each column
+            are kept, and the rows of the other categories have no dummy set,
+            which prunes the long tails of high-cardinality columns.
+
+        Returns
+        -------
+        DummyEncoder
+
+        Examples
+        --------
+        >>> s = ks.Series(list('abcaa'))
+        >>> encoder = ks.get_dummies.fit(s, max_categories=2)
+        >>> encoder.transform(s)
+           a  b
+        0  1  0
+        1  0  1
+        2  0  0
+        3  1  0
+        4  1  0
+        """
+        if columns is not None:
+            if not is_list_like(columns):
+                raise TypeError("Input must be a list-like for parameter `columns`")
+
+        if max_categories is not None and (
+            not isinstance(max_categories, int) or max_categories < 1
+        ):
+            raise ValueError("max_categories must be a positive integer.")
+
+        if isinstance(data, Series):
+            if prefix is not None:
+                prefix = [str(prefix)]
+            kdf = data.to_frame()
+            column_labels = kdf._internal.column_labels
+        else:
+            if isinstance(prefix, str):
+                raise NotImplementedError(
+                    "get_dummies currently does not support prefix as string types"
+                )
+            kdf = data
+
+            if columns is None:
+                column_labels = [
+                    label
+                    for label in kdf._internal.column_labels
+                    if isinstance(
+                        kdf._internal.spark_type_for(label), _get_dummies_default_accept_types
+                    )
+                ]
+            else:
+                if is_name_like_tuple(columns):
+                    column_labels = [
+                        label
+                        for label in kdf._internal.column_labels
+                        if label[: len(columns)] == columns
+                    ]
+                    if len(column_labels) == 0:
+                        raise KeyError(name_like_string(columns))
+                    if prefix is None:
+                        prefix = [
+                            str(label[len(columns) :])
+                            if len(label) > len(columns) + 1
+                            else label[len(columns)]
+                            if len(label) == len(columns) + 1
+                            else ""
+                            for label in column_labels
+                        ]
+                elif any(isinstance(col, tuple) for col in columns) and any(
+                    not is_name_like_tuple(col) for col in columns
+                ):
+                    raise ValueError(
+                        "Expected tuple, got {}".format(
+                            type(set(col for col in columns if not is_name_like_tuple(col)).pop())
+                        )
+                    )
+                else:
+                    column_labels = [
+                        label
+                        for key in columns
+                        for label in kdf._internal.column_labels
+                        if label == key or label[0] == key
+                    ]
+            if len(column_labels) == 0:
+                if columns is None:
+                    return DummyEncoder([], [], None, prefix_sep, dummy_na, drop_first, dtype)
+                raise KeyError("{} not in index".format(columns))
+
+            if prefix is None:
+                prefix = [str(label) if len(label) > 1 else label[0] for label in column_labels]
+
+        if any(
+            not isinstance(kdf._internal.spark_type_for(label), _get_dummies_acceptable_types)
+            for label in column_labels
+        ):
+            raise NotImplementedError(
+                "get_dummies currently only accept {} values".format(
+                    ", ".join([t.typeName() for t in _get_dummies_acceptable_types])
+                )
+            )
+
+        if prefix is not None and len(column_labels) != len(prefix):
+            raise ValueError(
+                "Length of 'prefix' ({}) did not match the length of "
+                "the columns being encoded ({}).".format(len(prefix), len(column_labels))
+            )
+        elif isinstance(prefix, dict):
+            prefix = [prefix[column_label[0]] for column_label in column_labels]
+
+        if max_categories is None:
+            all_values = _reduce_spark_multi(
+                kdf._internal.spark_frame,
+                [F.collect_set(kdf._internal.spark_column_for(label)) for label in column_labels],
+            )
+        else:
+            all_values = _most_frequent_values(kdf, column_labels, max_categories)
+
+        categories = []
+        for values in all_values:
+            if isinstance(values, np.ndarray):
+                values = values.tolist()
+            categories.append(sorted(values))
+
+        return DummyEncoder(
+            list(column_labels), categories, prefix, prefix_sep, dummy_na, drop_first, dtype
+        )
+
+    def transform(self, data, sparse: bool = False) -> DataFrame:
+        """
+        Encode the given Series or DataFrame with the fitted categories.
+
+        The values which are not in the categories have no dummy set.
+
+        Parameters
+        ----------
+        data : Series or DataFrame
+            The data which has the columns this encoder was fitted with.
+        sparse : bool, default False
+            If True, each encoded column becomes a single column of
+            :class:`pyspark.ml.linalg.SparseVector` of the dummies as doubles, instead of
+            a column for each category.
+
+        Returns
+        -------
+        dummies : DataFrame
+
+        Examples
+        --------
+        >>> df = ks.DataFrame({'A': ['a', 'b', 'a'], 'C': [1, 2, 3]}, columns=['A', 'C'])
+        >>> encoder = ks.get_dummies.fit(df)
+        >>> encoder.transform(df, sparse=True).sort_index()  # doctest: +NORMALIZE_WHITESPACE
+           C                    A
+        0  1  (2,[0],[1.0])
+        1  2  (2,[1],[1.0])
+        2  3  (2,[0],[1.0])
+        """
+        if isinstance(data, Series):
+            kdf = data.to_frame()
+        else:
+            kdf = data.copy()
+
+        missing = [
+            name_like_string(label)
+            for label in self._column_labels
+            if label not in kdf._internal.column_labels
+        ]
+        if len(missing) > 0:
+            raise KeyError("{} not in index".format(missing))
+
+        if sparse and len(self._column_labels) > 0:
+            kdf, vector_labels = self._with_sparse_vectors(kdf)
+        else:
+            vector_labels = []
+
+        column_labels_set = set(self._column_labels + vector_labels)
+        remaining_columns = [
+            (
+                kdf[label]
+                if kdf._internal.column_labels_level == 1
+                else kdf[label].rename(name_like_string(label))
+            )
+            for label in kdf._internal.column_labels
+            if label not in column_labels_set
+        ]
+        if len(self._column_labels) == 0:
+            return kdf
+
+        prefix = self._prefix
+        for i, (label, categories) in enumerate(zip(self._column_labels, self._categories)):
+            values = categories[1:] if self._drop_first else categories
+
+            def column_name(value):
+                if prefix is None or prefix[i] == "":
+                    return value
+                else:
+                    return "{}{}{}".format(prefix[i], self._prefix_sep, value)
+
+            if sparse:
+                name = label[0] if prefix is None else prefix[i]
+                remaining_columns.append(kdf._kser_for(vector_labels[i]).rename(name))
+                continue
+
+            for value in values:
+                remaining_columns.append(
+                    (kdf[label].notnull() & (kdf[label] == value))
+                    .astype(self._dtype)
+                    .rename(column_name(value))
+                )
+            if self._dummy_na:
+                remaining_columns.append(
+                    kdf[label].isnull().astype(self._dtype).rename(column_name(np.nan))
+                )
+
+        return kdf[remaining_columns]
+
+    def _with_sparse_vectors(self, kdf: DataFrame) -> Tuple[DataFrame, List[Tuple]]:
+        """
+        Append the columns of the SparseVectors of the dummies of the encoded columns to the
+        given DataFrame, and return it with the labels of the appended columns.
+
+        The position of each category is looked up in a single map literal rather than
+        a comparison per category, so the plan does not grow with the categories. The vectors
+        are built from the positions by Spark ML's one-hot encoder in the JVM; the number of
+        the categories is given by the ML attribute of each position column, so fitting the
+        encoder does not scan the data.
+        """
+        if LooseVersion(pyspark.__version__) < LooseVersion("3.0"):
+            from pyspark.ml.feature import OneHotEncoderEstimator as OneHotEncoder
+        else:
+            from pyspark.ml.feature import OneHotEncoder
+
+        internal = kdf._internal.resolved_copy
+        sdf = internal.spark_frame
+
+        position_columns = []
+        vector_columns = []
+        positions = []
+        for i, (label, categories) in enumerate(zip(self._column_labels, self._categories)):
+            values = categories[1:] if self._drop_first else categories
+            size = len(values) + (1 if self._dummy_na else 0)
+
+            scol = scol_for(sdf, internal.spark_column_name_for(label))
+            if len(values) > 0:
+                position_map = F.create_map(
+                    *chain(*[(F.lit(value), F.lit(j)) for j, value in enumerate(values)])
+                )
+                position = F.when(scol.isNotNull(), position_map[scol])
+            else:
+                position = F.lit(None).cast("int")
+            if self._dummy_na:
+                position = F.when(scol.isNull(), F.lit(size - 1)).otherwise(position)
+            # The values with no dummy set are in an extra last category, which is dropped.
+            position = F.coalesce(position, F.lit(size)).cast("double")
+
+            position_column = verify_temp_column_name(sdf, "__dummies_position_{}__".format(i))
+            vector_column = verify_temp_column_name(sdf, "__dummies_vector_{}__".format(i))
+            positions.append(
+                position.alias(
+                    position_column, metadata={"ml_attr": {"type": "nominal", "num_vals": size + 1}}
+                )
+            )
+            position_columns.append(position_column)
+            vector_columns.append(vector_column)
+
+        sdf = sdf.select(F.col("*"), *positions)
+        encoder = OneHotEncoder(inputCols=position_columns, outputCols=vector_columns)
+        sdf = encoder.fit(sdf).transform(sdf)
+
+        level = internal.column_labels_level
+        vector_labels = [(col,) + ("",) * (level - 1) for col in vector_columns]
+        internal = internal.copy(
+            spark_frame=sdf,
+            index_spark_columns=[scol_for(sdf, col) for col in internal.index_spark_column_names],
+            column_labels=internal.column_labels + vector_labels,
+            data_spark_columns=[
+                scol_for(sdf, col) for col in internal.data_spark_column_names + vector_columns
+            ],
+            data_dtypes=internal.data_dtypes + [np.dtype("object")] * len(vector_columns),
+        )
+        return DataFrame(internal), vector_labels
+
+
+def _most_frequent_values(kdf: DataFrame, column_labels: List[Tuple], k: int) -> List[List]:
+    """
+    Return the `k` most frequent non-null values of each given column, counting all the
+    columns in a single aggregation.
+    """
+    internal = kdf._internal
+    column_index = verify_temp_column_name(kdf, "__dummies_column__")
+    count_column = verify_temp_column_name(kdf, "__dummies_count__")
+    value_columns = ["__dummies_value_{}__".format(i) for i in range(len(column_labels))]
+
+    # Pair each value with the position of its column, in the field of its own type.
+    pairs = F.explode(
+        F.array(
+            *[
+                F.struct(
+                    [F.lit(i).alias(column_index)]
+                    + [
+                        (
+                            internal.spark_column_for(label)
+                            if j == i
+                            else F.lit(None).cast(internal.spark_type_for(label))
+                        ).alias(value_column)
+                        for j, (label, value_column) in enumerate(zip(column_labels, value_columns))
+                    ]
+                )
+                for i in range(len(column_labels))
+            ]
+        )
+    ).alias("pairs")
+    sdf = internal.spark_frame.select(pairs).select("pairs.*")
+    sdf = sdf.filter(
+        reduce(lambda x, y: x | y, [scol_for(sdf, col).isNotNull() for col in value_columns])
+    )
+    sdf = sdf.groupBy([column_index] + value_columns).agg(F.count("*").alias(count_column))
+
+    rank_column = verify_temp_column_name(kdf, "__dummies_rank__")
+    sdf = sdf.withColumn(
+        rank_column,
+        F.row_number().over(
+            Window.partitionBy(column_index).orderBy(
+                [F.desc(count_column)] + [scol_for(sdf, col) for col in value_columns]
+            )
+        ),
+    )
+    rows = sdf.filter(scol_for(sdf, rank_column) <= k).collect()
+
+    all_values = [[] for _ in column_labels]  # type: List[List]
+    for row in rows:
+        i = row[column_index]
+        all_values[i].append(row[value_columns[i]])
+    return all_values
@@ -23,7 +23,6 @@ from distutils.version import LooseVersion
 import re
 import warnings
 import inspect
-import json
 import types
 from functools import partial, reduce
 import sys
@@ -43,6 +42,7 @@ from typing import (
     cast,
     TYPE_CHECKING,
 )
+from weakref import WeakKeyDictionary
 import datetime
 
 import numpy as np
@@ -109,6 +109,7 @@ from databricks.koalas.internal import (
     SPARK_DEFAULT_INDEX_NAME,
     SPARK_DEFAULT_SERIES_NAME,
 )
+from databricks.koalas.join_planner import plan_join, skew_join
 from databricks.koalas.missing.frame import _MissingPandasLikeDataFrame
 from databricks.koalas.ml import corr
 from databricks.koalas.typedef import (
@@ -1571,7 +1572,7 @@ class DataFrame(Frame, Generic[T]):
         """This is an alias of ``iteritems``."""
         return self.iteritems()
 
-    def to_clipboard(self, excel=True, sep=None, **kwargs) -> None:
+    def to_clipboard(self, excel=True, sep=None, batch_size=None, **kwargs) -> None:
         """
         Copy object to the system clipboard.
 
@@ -1591,6 +1592,9 @@ class DataFrame(Frame, Generic[T]):
 
         sep : str, default ``'\\t'``
             Field delimiter.
+        batch_size : int, optional
+            The number of the rows to write at a time when `excel` is True. If specified, only
+            a batch of the rows is loaded into the driver's memory at a time.
         **kwargs
             These parameters will be passed to DataFrame.to_csv.
 
@@ -1642,6 +1646,12 @@ class DataFrame(Frame, Generic[T]):
 
         args = locals()
         kdf = self
+
+        if batch_size is not None:
+            batches = kdf._to_internal_pandas_batches(batch_size)
+            _to_clipboard_in_batches(batches, excel, sep, kwargs)
+            return None
+
         return validate_arguments_and_invoke_function(
             kdf._to_internal_pandas(), self.to_clipboard, pd.DataFrame.to_clipboard, args
         )
@@ -1670,6 +1680,7 @@ class DataFrame(Frame, Generic[T]):
         border=None,
         table_id=None,
         render_links=False,
+        batch_size=None,
     ) -> Optional[str]:
         """
         Render a DataFrame as an HTML table.
@@ -1745,6 +1756,11 @@ class DataFrame(Frame, Generic[T]):
             A css id is included in the opening `<table>` tag if specified.
         render_links : bool, default False
             Convert URLs to HTML links (only works with pandas 0.24+).
+        batch_size : int, optional
+            The number of the rows to render at a time. If specified, only a batch of the rows
+            is loaded into the driver's memory at a time, and the rows of the batches are
+            rendered into a single table. The MultiIndex is sparsified within each batch.
+            `show_dimensions` is not supported.
 
         Returns
         -------
@@ -1762,6 +1778,21 @@ class DataFrame(Frame, Generic[T]):
         else:
             kdf = self
 
+        if batch_size is not None:
+            if show_dimensions:
+                raise ValueError("show_dimensions is not supported with batch_size.")
+
+            def render(pdf, first):
+                batch_args = dict(args, buf=None, batch_size=None)
+                if not first:
+                    batch_args["header"] = False
+                return validate_arguments_and_invoke_function(
+                    pdf, self.to_html, pd.DataFrame.to_html, batch_args
+                )
+
+            batches = kdf._to_internal_pandas_batches(batch_size)
+            return _write_texts(_render_in_batches(render, batches, "<tbody>\n", "</tbody>"), buf)
+
         return validate_arguments_and_invoke_function(
             kdf._to_internal_pandas(), self.to_html, pd.DataFrame.to_html, args
         )
@@ -1999,6 +2030,7 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         multicolumn=None,
         multicolumn_format=None,
         multirow=None,
+        batch_size=None,
     ) -> Optional[str]:
         r"""
         Render an object to a LaTeX tabular environment table.
@@ -2065,6 +2097,11 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
             LaTeX preamble. Will print centered labels (instead of top-aligned) across the contained
             rows, separating groups via clines. The default will be read from the pandas config
             module.
+        batch_size : int, optional
+            The number of the rows to render at a time. If specified, only a batch of the rows
+            is loaded into the driver's memory at a time, and the rows of the batches are
+            rendered into a single table. The MultiIndex is sparsified within each batch.
+            `longtable` is not supported.
 
         Returns
         -------
@@ -2098,6 +2135,24 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
 
         args = locals()
         kdf = self
+
+        if batch_size is not None:
+            if longtable:
+                raise ValueError("longtable is not supported with batch_size.")
+
+            def render(pdf, first):
+                batch_args = dict(args, buf=None, batch_size=None)
+                if not first:
+                    batch_args["header"] = False
+                return validate_arguments_and_invoke_function(
+                    pdf, self.to_latex, pd.DataFrame.to_latex, batch_args
+                )
+
+            batches = kdf._to_internal_pandas_batches(batch_size)
+            return _write_texts(
+                _render_in_batches(render, batches, "\\toprule\n", "\\bottomrule"), buf
+            )
+
         return validate_arguments_and_invoke_function(
             kdf._to_internal_pandas(), self.to_latex, pd.DataFrame.to_latex, args
         )
@@ -2114,18 +2169,10 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
 
         .. note:: This method is based on an expensive operation due to the nature
             of big data. Internally it needs to generate each row for each value, and
-            then group twice - it is a huge operation. To prevent misusage, this method
-            has the 'compute.max_rows' default limit of input length, and raises a ValueError.
-
-                >>> from databricks.koalas.config import option_context
-                >>> with option_context('compute.max_rows', 1000):  # doctest: +NORMALIZE_WHITESPACE
-                ...     ks.DataFrame({'a': range(1001)}).transpose()
-                Traceback (most recent call last):
-                  ...
-                ValueError: Current DataFrame has more then the given limit 1000 rows.
-                Please set 'compute.max_rows' by using 'databricks.koalas.config.set_option'
-                to retrieve to retrieve more than 1000 rows. Note that, before changing the
-                'compute.max_rows', this operation is considerably expensive.
+            then group them by the columns - it is a huge operation. If the DataFrame has
+            no more rows than the 'compute.max_rows' limit, it is transposed in pandas;
+            otherwise, or when the limit is not set, it is transposed in a distributed
+            manner.
 
         Returns
         -------
@@ -2208,16 +2255,20 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         max_compute_count = get_option("compute.max_rows")
         if max_compute_count is not None:
             pdf = self.head(max_compute_count + 1)._to_internal_pandas()
-            if len(pdf) > max_compute_count:
-                raise ValueError(
-                    "Current DataFrame has more then the given limit {0} rows. "
-                    "Please set 'compute.max_rows' by using 'databricks.koalas.config.set_option' "
-                    "to retrieve to retrieve more than {0} rows. Note that, before changing the "
-                    "'compute.max_rows', this operation is considerably expensive.".format(
-                        max_compute_count
-                    )
-                )
-            return DataFrame(pdf.transpose())
+            if len(pdf) <= max_compute_count:
+                return DataFrame(pdf.transpose())
+
+        # Number the rows with the sequence, which identifies the columns after the transpose.
+        # The index values are collected once as the new column labels, and the sequence
+        # numbers are passed to the pivot as the known values.
+        internal = self._internal.resolved_copy
+        sequence_column = verify_temp_column_name(self, "__transpose_sequence__")
+        sdf = InternalFrame.attach_distributed_sequence_column(
+            internal.spark_frame, column_name=sequence_column
+        )
+        sequence = scol_for(sdf, sequence_column)
+        index_scols = [scol_for(sdf, col) for col in internal.index_spark_column_names]
+        rows = sdf.select(sequence, *index_scols).orderBy(sequence).collect()
 
         # Explode the data to be pairs.
         #
@@ -2231,21 +2282,22 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         # |    y3|    z3|     3|     2|     1|
         # +------+------+------+------+------+
         #
-        # Output of `exploded_df` becomes as below:
+        # Output of `exploded_df` becomes as below, where the rows of `index1` and `index2`
+        # are collected as the column labels, (y1, z1), (y2, z2) and (y3, z3) for 0, 1 and 2:
         #
-        # +-----------------+-----------------+-----------------+-----+
-        # |            index|__index_level_0__|__index_level_1__|value|
-        # +-----------------+-----------------+-----------------+-----+
-        # |{"a":["y1","z1"]}|                a|               x1|    1|
-        # |{"a":["y1","z1"]}|                a|               x2|    0|
-        # |{"a":["y1","z1"]}|                b|               x3|    0|
-        # |{"a":["y2","z2"]}|                a|               x1|    0|
-        # |{"a":["y2","z2"]}|                a|               x2|   50|
-        # |{"a":["y2","z2"]}|                b|               x3|    0|
-        # |{"a":["y3","z3"]}|                a|               x1|    3|
-        # |{"a":["y3","z3"]}|                a|               x2|    2|
-        # |{"a":["y3","z3"]}|                b|               x3|    1|
-        # +-----------------+-----------------+-----------------+-----+
+        # +--------+-----------------+-----------------+-----+
+        # |sequence|__index_level_0__|__index_level_1__|value|
+        # +--------+-----------------+-----------------+-----+
+        # |       0|                a|               x1|    1|
+        # |       0|                a|               x2|    0|
+        # |       0|                b|               x3|    0|
+        # |       1|                a|               x1|    0|
+        # |       1|                a|               x2|   50|
+        # |       1|                b|               x3|    0|
+        # |       2|                a|               x1|    3|
+        # |       2|                a|               x2|    2|
+        # |       2|                b|               x3|    1|
+        # +--------+-----------------+-----------------+-----+
         pairs = F.explode(
             F.array(
                 *[
@@ -2254,54 +2306,43 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
                             F.lit(col).alias(SPARK_INDEX_NAME_FORMAT(i))
                             for i, col in enumerate(label)
                         ]
-                        + [self._internal.spark_column_for(label).alias("value")]
+                        + [scol_for(sdf, internal.spark_column_name_for(label)).alias("value")]
                     )
-                    for label in self._internal.column_labels
+                    for label in internal.column_labels
                 ]
             )
         )
 
-        exploded_df = self._internal.spark_frame.withColumn("pairs", pairs).select(
-            [
-                F.to_json(
-                    F.struct(
-                        F.array([scol for scol in self._internal.index_spark_columns]).alias("a")
-                    )
-                ).alias("index"),
-                F.col("pairs.*"),
-            ]
-        )
+        exploded_df = sdf.withColumn("pairs", pairs).select([sequence, F.col("pairs.*")])
 
-        # After that, executes pivot with key and its index column.
-        # Note that index column should contain unique values since column names
-        # should be unique.
+        # After that, executes pivot with key and the sequence numbers.
         internal_index_columns = [
-            SPARK_INDEX_NAME_FORMAT(i) for i in range(self._internal.column_labels_level)
+            SPARK_INDEX_NAME_FORMAT(i) for i in range(internal.column_labels_level)
         ]
-        pivoted_df = exploded_df.groupBy(internal_index_columns).pivot("index")
+        pivoted_df = exploded_df.groupBy(internal_index_columns).pivot(
+            sequence_column, [row[0] for row in rows]
+        )
 
         transposed_df = pivoted_df.agg(F.first(F.col("value")))
 
-        new_data_columns = list(
-            filter(lambda x: x not in internal_index_columns, transposed_df.columns)
-        )
-
         column_labels = [
             None if len(label) == 1 and label[0] is None else label
-            for label in (tuple(json.loads(col)["a"]) for col in new_data_columns)
+            for label in (tuple(row[1:]) for row in rows)
         ]
 
-        internal = InternalFrame(
-            spark_frame=transposed_df,
-            index_spark_columns=[scol_for(transposed_df, col) for col in internal_index_columns],
-            index_names=self._internal.column_label_names,
-            column_labels=column_labels,
-            data_spark_columns=[scol_for(transposed_df, col) for col in new_data_columns],
-            column_label_names=self._internal.index_names,
+        return DataFrame(
+            InternalFrame(
+                spark_frame=transposed_df,
+                index_spark_columns=[
+                    scol_for(transposed_df, col) for col in internal_index_columns
+                ],
+                index_names=internal.column_label_names,
+                column_labels=column_labels,
+                data_spark_columns=[scol_for(transposed_df, str(row[0])) for row in rows],
+                column_label_names=internal.index_names,
+            )
         )
 
-        return DataFrame(internal)
-
     T = property(transpose)
 
     def apply_batch(self, func, args=(), **kwds) -> "DataFrame":
@@ -5863,7 +5904,13 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         return cast(DataFrame, self.loc[:to_date])
 
     def pivot_table(
-        self, values=None, index=None, columns=None, aggfunc="mean", fill_value=None
+        self,
+        values=None,
+        index=None,
+        columns=None,
+        aggfunc="mean",
+        fill_value=None,
+        pivot_values=None,
     ) -> "DataFrame":
         """
         Create a spreadsheet-style pivot table as a DataFrame. The levels in
@@ -5885,6 +5932,11 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
             is function or list of functions.
         fill_value : scalar, default None
             Value to replace missing values with.
+        pivot_values : list, optional
+            The values of `columns` to become the columns of the result, in order.
+            If not given, the distinct values of `columns` are computed and cached for
+            the DataFrame, so that the following pivots over the same DataFrame do not
+            compute them again.
 
         Returns
         -------
@@ -5960,6 +6012,19 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         C
         large  5.5  2.000000  15   9
         small  5.5  2.333333  17  13
+
+        The values of the pivot column can be given in advance, which also selects
+        the columns of the result.
+
+        >>> table = df.pivot_table(values='D', index=['A', 'B'], columns='C',
+        ...                        aggfunc='sum', pivot_values=['small'])
+        >>> table.sort_index()  # doctest: +NORMALIZE_WHITESPACE
+        C        small
+        A   B
+        bar one      5
+            two      6
+        foo one      1
+            two      6
         """
         if not is_name_like_value(columns):
             raise ValueError("columns should be one column name.")
@@ -6036,11 +6101,18 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
             if set(agg_columns) != set(values):
                 raise ValueError("Columns in aggfunc must be the same as values.")
 
+        if pivot_values is None:
+            pivot_values = _pivot_values(self._internal, columns)
+        elif not is_list_like(pivot_values):
+            raise ValueError("pivot_values should be a list of values.")
+        else:
+            pivot_values = list(pivot_values)
+
         sdf = self._internal.resolved_copy.spark_frame
         if index is None:
             sdf = (
                 sdf.groupBy()
-                .pivot(pivot_col=self._internal.spark_column_name_for(columns))
+                .pivot(pivot_col=self._internal.spark_column_name_for(columns), values=pivot_values)
                 .agg(*agg_cols)
             )
 
@@ -6048,7 +6120,7 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
             index = [label if is_name_like_tuple(label) else (label,) for label in index]
             sdf = (
                 sdf.groupBy([self._internal.spark_column_name_for(label) for label in index])
-                .pivot(pivot_col=self._internal.spark_column_name_for(columns))
+                .pivot(pivot_col=self._internal.spark_column_name_for(columns), values=pivot_values)
                 .agg(*agg_cols)
             )
         else:
@@ -6266,6 +6338,7 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         if should_use_existing_index:
             df = self
             index = [index]
+            pivot_values = None
         else:
             # The index after `reset_index()` will never be used, so use "distributed" index
             # as a dummy to avoid overhead.
@@ -6273,7 +6346,17 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
                 df = self.reset_index()
             index = df._internal.column_labels[: self._internal.index_level]
 
-        df = df.pivot_table(index=index, columns=columns, values=values, aggfunc="first")
+            # Discover the pivot values over this DataFrame rather than the new one so that
+            # they are cached for this DataFrame.
+            label = columns if is_name_like_tuple(columns) else (columns,)
+            if label in self._internal.column_labels:
+                pivot_values = _pivot_values(self._internal, label)
+            else:
+                pivot_values = None
+
+        df = df.pivot_table(
+            index=index, columns=columns, values=values, aggfunc="first", pivot_values=pivot_values,
+        )
 
         if should_use_existing_index:
             return df
@@ -7463,6 +7546,7 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         left_index: bool = False,
         right_index: bool = False,
         suffixes: Tuple[str, str] = ("_x", "_y"),
+        skew: Optional[Union[str, List[Any]]] = None,
     ) -> "DataFrame":
         """
         Merge DataFrame objects with a database-style join.
@@ -7505,6 +7589,15 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
             left_index.
         suffixes: Suffix to apply to overlapping column names in the left and right side,
             respectively.
+        skew: 'auto' or list of the skewed keys, optional.
+            The join keys which are so frequent that their rows make straggler tasks.
+            The rows of the skewed keys are spread over `spark.sql.shuffle.partitions` tasks
+            on the larger side, and the rows of the skewed keys on the other side are replicated
+            for each task. The result is the same as without it.
+
+            'auto': find the skewed keys from a sample of the larger side with the frequent
+                items sketch, which runs a Spark job.
+            list: the values of the skewed keys, or tuples of the values for multiple keys.
 
         Returns
         -------
@@ -7594,6 +7687,9 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         if isinstance(right, ks.Series):
             right = right.to_frame()
 
+        if skew is not None and skew != "auto" and not is_list_like(skew):
+            raise ValueError("skew should be either 'auto' or a list of the skewed keys")
+
         if on:
             if left_on or right_on:
                 raise ValueError(
@@ -7662,19 +7758,21 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         left_internal = self._internal.resolved_copy
         right_internal = resolve(right._internal, "right")
 
-        left_table = left_internal.spark_frame.alias("left_table")
-        right_table = right_internal.spark_frame.alias("right_table")
+        prepare_left, prepare_right = plan_join(
+            left_internal.spark_frame,
+            left_key_names,
+            right._internal.resolved_copy.spark_frame,
+            [right_key_name[len(right_prefix) :] for right_key_name in right_key_names],
+            how,
+        )
+        left_table = prepare_left(left_internal.spark_frame, left_key_names).alias("left_table")
+        right_table = prepare_right(right_internal.spark_frame, right_key_names).alias(
+            "right_table"
+        )
 
         left_key_columns = [scol_for(left_table, label) for label in left_key_names]
         right_key_columns = [scol_for(right_table, label) for label in right_key_names]
 
-        join_condition = reduce(
-            lambda x, y: x & y,
-            [lkey == rkey for lkey, rkey in zip(left_key_columns, right_key_columns)],
-        )
-
-        joined_table = left_table.join(right_table, join_condition, how=how)
-
         # Unpack suffixes tuple for convenience
         left_suffix = suffixes[0]
         right_suffix = suffixes[1]
@@ -7769,7 +7867,16 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
             index_spark_column_names = []
             index_names = []
 
-        selected_columns = joined_table.select(*exprs)
+        if skew is None:
+            join_condition = reduce(
+                lambda x, y: x & y,
+                [lkey == rkey for lkey, rkey in zip(left_key_columns, right_key_columns)],
+            )
+            selected_columns = left_table.join(right_table, join_condition, how=how).select(*exprs)
+        else:
+            selected_columns = skew_join(
+                left_table, left_key_columns, right_table, right_key_columns, how, skew, exprs
+            )
 
         internal = InternalFrame(
             spark_frame=selected_columns,
@@ -7913,10 +8020,11 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
 
     def append(
         self,
-        other: "DataFrame",
+        other: Union["DataFrame", List["DataFrame"]],
         ignore_index: bool = False,
         verify_integrity: bool = False,
         sort: bool = False,
+        checkpoint_every: Optional[int] = None,
     ) -> "DataFrame":
         """
         Append rows of other to the end of caller, returning a new object.
@@ -7937,6 +8045,10 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         sort : boolean, default False
             Currently not supported.
 
+        checkpoint_every : int, optional
+            If set, the lineage is truncated by locally checkpointing the rows of every
+            `checkpoint_every` DataFrames. See also `ks.concat`.
+
         Returns
         -------
         appended : DataFrame
@@ -7958,31 +8070,62 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         1  3  4
         2  1  2
         3  3  4
+
+        >>> df.append([df, df], ignore_index=True)
+           A  B
+        0  1  2
+        1  3  4
+        2  1  2
+        3  3  4
+        4  1  2
+        5  3  4
         """
-        if isinstance(other, ks.Series):
+        others = list(other) if isinstance(other, list) else [other]
+        if any(isinstance(kdf, ks.Series) for kdf in others):
             raise ValueError("DataFrames.append() does not support appending Series to DataFrames")
         if sort:
             raise NotImplementedError("The 'sort' parameter is currently not supported")
 
         if not ignore_index:
             index_scols = self._internal.index_spark_columns
-            if len(index_scols) != other._internal.index_level:
+            if any(len(index_scols) != kdf._internal.index_level for kdf in others):
                 raise ValueError("Both DataFrames have to have the same number of index levels")
 
             if verify_integrity and len(index_scols) > 0:
-                if (
-                    self._internal.spark_frame.select(index_scols)
-                    .intersect(
-                        other._internal.spark_frame.select(other._internal.index_spark_columns)
-                    )
-                    .count()
-                ) > 0:
+                # Check the overlaps between the DataFrames at once, tagging the index values
+                # with the position of the DataFrame.
+                tag_column = verify_temp_column_name(self, "__append_tag__")
+                index_column_names = [
+                    SPARK_INDEX_NAME_FORMAT(i) for i in range(self._internal.index_level)
+                ]
+                tagged = reduce(
+                    lambda x, y: x.union(y),
+                    [
+                        kdf._internal.spark_frame.select(
+                            [
+                                scol.alias(name)
+                                for scol, name in zip(
+                                    kdf._internal.index_spark_columns, index_column_names
+                                )
+                            ]
+                            + [F.lit(i).alias(tag_column)]
+                        )
+                        for i, kdf in enumerate([self] + others)
+                    ],
+                )
+                counts = tagged.groupBy(index_column_names).agg(
+                    F.countDistinct(scol_for(tagged, tag_column)).alias(tag_column)
+                )
+                if len(counts.filter(scol_for(counts, tag_column) > 1).head(1)) > 0:
                     raise ValueError("Indices have overlapping values")
 
         # Lazy import to avoid circular dependency issues
         from databricks.koalas.namespace import concat
 
-        return cast(DataFrame, concat([self, other], ignore_index=ignore_index))
+        return cast(
+            DataFrame,
+            concat([self] + others, ignore_index=ignore_index, checkpoint_every=checkpoint_every),
+        )
 
     # TODO: add 'filter_func' and 'errors' parameter
     def update(self, other: "DataFrame", join: str = "left", overwrite: bool = True) -> None:
@@ -9148,8 +9291,6 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
 
         column_labels = [label for label in column_labels if label not in id_vars]
 
-        sdf = self._internal.spark_frame
-
         if var_name is None:
             if (
                 self._internal.column_labels_level == 1
@@ -9164,30 +9305,17 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         elif isinstance(var_name, str):
             var_name = [var_name]
 
-        pairs = F.explode(
-            F.array(
-                *[
-                    F.struct(
-                        *(
-                            [F.lit(c).alias(name) for c, name in zip(label, var_name)]
-                            + [self._internal.spark_column_for(label).alias(value_name)]
-                        )
-                    )
-                    for label in column_labels
-                    if label in value_vars
-                ]
-            )
-        )
-
-        columns = (
+        value_vars_set = set(value_vars)
+        exploded_df = _melt_spark_frame(
+            self._internal,
+            [label for label in column_labels if label in value_vars_set],
             [
                 self._internal.spark_column_for(label).alias(name_like_string(label))
                 for label in id_vars
-            ]
-            + [F.col("pairs.`%s`" % name) for name in var_name]
-            + [F.col("pairs.`%s`" % value_name)]
+            ],
+            var_name,
+            value_name,
         )
-        exploded_df = sdf.withColumn("pairs", pairs).select(columns)
 
         return DataFrame(
             InternalFrame(
@@ -9472,7 +9600,11 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
             index = df._internal.column_labels[: self._internal.index_level - 1]
             columns = df.columns[self._internal.index_level - 1]
             df = df.pivot_table(
-                index=index, columns=columns, values=self._internal.column_labels, aggfunc="first"
+                index=index,
+                columns=columns,
+                values=self._internal.column_labels,
+                aggfunc="first",
+                pivot_values=_pivot_values(self._internal, self._internal.index_spark_columns[-1]),
             )
             internal = df._internal.copy(
                 index_names=self._internal.index_names[:-1],
@@ -9488,35 +9620,12 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
             )
             return DataFrame(internal)
 
-        # TODO: Codes here are similar with melt. Should we deduplicate?
-        column_labels = self._internal.column_labels
-        ser_name = SPARK_DEFAULT_SERIES_NAME
-        sdf = self._internal.spark_frame
         new_index_columns = [
             SPARK_INDEX_NAME_FORMAT(i) for i in range(self._internal.column_labels_level)
         ]
 
         new_index_map = list(zip(new_index_columns, self._internal.column_label_names))
 
-        pairs = F.explode(
-            F.array(
-                *[
-                    F.struct(
-                        *(
-                            [F.lit(c).alias(name) for c, name in zip(idx, new_index_columns)]
-                            + [self._internal.spark_column_for(idx).alias(ser_name)]
-                        )
-                    )
-                    for idx in column_labels
-                ]
-            )
-        )
-
-        columns = [
-            F.col("pairs.%s" % name)
-            for name in new_index_columns[: self._internal.column_labels_level]
-        ] + [F.col("pairs.%s" % ser_name)]
-
         new_index_len = len(new_index_columns)
         existing_index_columns = []
         for i, index_name in enumerate(self._internal.index_names):
@@ -9527,7 +9636,13 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
                 )
             )
 
-        exploded_df = sdf.withColumn("pairs", pairs).select(existing_index_columns + columns)
+        exploded_df = _melt_spark_frame(
+            self._internal,
+            self._internal.column_labels,
+            existing_index_columns,
+            new_index_columns,
+            SPARK_DEFAULT_SERIES_NAME,
+        )
 
         index_spark_column_names, index_names = zip(*new_index_map)
         return first_series(
@@ -9723,19 +9838,23 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         Compute numerical data ranks (1 through n) along axis. Equal values are
         assigned a rank that is the average of the ranks of those values.
 
-        .. note:: the current implementation of rank uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
+        .. note:: the ranks are computed by counting the rows of each distinct value,
+            ranking the distinct values within range partitions in parallel, and joining
+            them back. This takes a few jobs per column, but never moves all data into
+            a single partition.
 
         Parameters
         ----------
-        method : {'average', 'min', 'max', 'first', 'dense'}
+        method : {'average', 'min', 'max', 'first', 'dense', 'approx'}
             * average: average rank of group
             * min: lowest rank in group
             * max: highest rank in group
             * first: ranks assigned in order they appear in the array
             * dense: like 'min', but rank always increases by 1 between groups
+            * approx: the rank estimated from 1000 approximate quantiles of numeric values,
+              within 0.11% of the number of rows plus one from the 'min' rank: 0.1% from
+              the quantiles and 0.01% from their accuracy. Missing values are not ranked.
+              It takes a single aggregation and no join.
         ascending : boolean, default True
             False for ranks by high (1) to low (N)
 
@@ -9787,8 +9906,57 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         2  2.0  2.0
         3  3.0  1.0
         """
-        return self._apply_series_op(
-            lambda kser: kser._rank(method=method, ascending=ascending), should_resolve=True
+        if method not in ["average", "min", "max", "first", "dense", "approx"]:
+            msg = "method must be one of 'average', 'min', 'max', 'first', 'dense', 'approx'"
+            raise ValueError(msg)
+
+        internal = self._internal.resolved_copy
+        sdf = internal.spark_frame
+        rank_columns = []
+        for i, col in enumerate(internal.data_spark_column_names):
+            rank_column = "__rank_{}__".format(i)
+            scol = scol_for(sdf, col)
+            if method == "approx":
+                if not isinstance(internal.spark_type_for(scol), NumericType):
+                    raise TypeError("method 'approx' only supports numeric columns.")
+                sdf = sdf.withColumn(rank_column, _approx_rank(sdf, col, ascending))
+            else:
+                value_column = "__rank_value_{}__".format(i)
+                ranks = _distinct_value_ranks(
+                    sdf, scol, method, ascending, value_column, rank_column
+                )
+                sdf = sdf.join(
+                    ranks, scol_for(sdf, col).eqNullSafe(scol_for(ranks, value_column)), "left"
+                ).drop(value_column)
+                if method == "first":
+                    # The rows of the same value are ranked in order they appear.
+                    window = Window.partitionBy(scol_for(sdf, col)).orderBy(
+                        scol_for(sdf, NATURAL_ORDER_COLUMN_NAME).asc()
+                        if ascending
+                        else scol_for(sdf, NATURAL_ORDER_COLUMN_NAME).desc()
+                    )
+                    sdf = sdf.withColumn(
+                        rank_column, scol_for(sdf, rank_column) + F.row_number().over(window) - 1,
+                    )
+            rank_columns.append(rank_column)
+
+        sdf = sdf.select(
+            internal.index_spark_column_names
+            + [
+                scol_for(sdf, rank_column).cast("double").alias(col)
+                for rank_column, col in zip(rank_columns, internal.data_spark_column_names)
+            ]
+            + list(HIDDEN_COLUMNS)
+        )
+        return DataFrame(
+            internal.copy(
+                spark_frame=sdf,
+                index_spark_columns=[
+                    scol_for(sdf, col) for col in internal.index_spark_column_names
+                ],
+                data_spark_columns=[scol_for(sdf, col) for col in internal.data_spark_column_names],
+                data_dtypes=[np.dtype("float64")] * len(rank_columns),
+            )
         )
 
     def filter(self, items=None, like=None, regex=None, axis=None) -> "DataFrame":
@@ -11648,6 +11816,17 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         """
         return self._internal.to_pandas_frame
 
+    def _to_internal_pandas_batches(self, batch_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Return pandas DataFrames of at most `batch_size` rows in order, loading only a partition
+        into the driver at a time.
+
+        This method is for internal use only.
+        """
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer.")
+        return self._internal.to_pandas_frame_batches(batch_size)
+
     def _get_or_create_repr_pandas_cache(self, n):
         if not hasattr(self, "_repr_pandas_cache") or n not in self._repr_pandas_cache:
             object.__setattr__(
@@ -11913,6 +12092,311 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         is_dataframe = None
 
 
+def _render_in_batches(
+    render: Callable[[Any, bool], str], batches: Iterator, body_start: str, body_end: str
+) -> Iterator[str]:
+    """
+    Render the pandas objects in batches, and return the text of the first batch up to the end
+    of its body, the bodies of the following batches, and the rest of the first batch.
+
+    :param render: the function to render a pandas object, which takes whether it is the first.
+    :param batches: the pandas objects to render.
+    :param body_start: the text just before the body in the text rendered.
+    :param body_end: the text just after the body in the text rendered.
+    :return: the texts in order.
+    """
+    tail = None
+    for pobj in batches:
+        text = render(pobj, tail is None)
+        end = text.rindex(body_end)
+        if tail is None:
+            yield text[:end]
+            tail = text[end:]
+        else:
+            yield text[text.index(body_start) + len(body_start) : end]
+    if tail is not None:
+        yield tail
+
+
+def _to_clipboard_in_batches(
+    batches: Iterator, excel: bool, sep: Optional[str], kwargs: Dict[str, Any]
+) -> None:
+    """
+    Copy the pandas objects in batches to the system clipboard in the CSV format, as
+    `to_clipboard` of pandas does with `excel=True`.
+    """
+    from pandas.io.clipboard import clipboard_set
+
+    if not excel:
+        raise ValueError("excel=False is not supported with batch_size.")
+    kwargs = dict(kwargs)
+    header = kwargs.pop("header", True)
+    texts = (
+        pobj.to_csv(sep="\t" if sep is None else sep, header=header if i == 0 else False, **kwargs)
+        for i, pobj in enumerate(batches)
+    )
+    clipboard_set("".join(texts))
+
+
+def _write_texts(texts: Iterator[str], buf) -> Optional[str]:
+    """
+    Write the texts to the buffer or the file path, or return the concatenated text if the
+    buffer is None.
+    """
+    if buf is None:
+        return "".join(texts)
+    elif isinstance(buf, str):
+        with open(buf, "w") as f:
+            for text in texts:
+                f.write(text)
+    else:
+        for text in texts:
+            buf.write(text)
+    return None
+
+
+def _melt_spark_frame(
+    internal: InternalFrame,
+    column_labels: List[Tuple],
+    keep_scols: List[spark.Column],
+    label_column_names: List[str],
+    value_column_name: str,
+) -> spark.DataFrame:
+    """
+    Melt the given columns into the rows of their labels and values.
+
+    The values are exploded from a single array with their positions, and the labels are
+    picked from the literal arrays of the levels by the positions, so the plan has a single
+    expression for each melted column however many levels the labels have.
+
+    :param internal: the InternalFrame to melt.
+    :param column_labels: the labels of the columns to melt.
+    :param keep_scols: the aliased Spark columns kept in each row.
+    :param label_column_names: the column names of the levels of the labels.
+    :param value_column_name: the column name of the values.
+    :return: the Spark DataFrame of the columns kept, the labels and the values.
+    """
+    sdf = internal.spark_frame
+    position_column = verify_temp_column_name(sdf, "__melt_position__")
+    sdf = sdf.select(
+        keep_scols
+        + [
+            F.posexplode(
+                F.array(*[internal.spark_column_for(label) for label in column_labels])
+            ).alias(position_column, value_column_name)
+        ]
+    )
+    position = scol_for(sdf, position_column)
+    return sdf.select(
+        [scol_for(sdf, col) for col in sdf.columns[: len(keep_scols)]]
+        + [
+            F.array(*[F.lit(label[i]) for label in column_labels])[position].alias(name)
+            for i, name in enumerate(label_column_names)
+        ]
+        + [scol_for(sdf, value_column_name)]
+    )
+
+
+# The number of the quantiles to estimate the ranks with in `DataFrame.rank(method="approx")`.
+_APPROX_RANK_QUANTILES = 1000
+
+
+def _distinct_value_ranks(
+    sdf: spark.DataFrame,
+    scol: spark.Column,
+    method: str,
+    ascending: bool,
+    value_column: str,
+    rank_column: str,
+) -> spark.DataFrame:
+    """
+    Return the Spark DataFrame of the distinct values of the given column and their ranks.
+
+    The rows of each value are counted, and the distinct values are range-partitioned
+    as `sortBy` does with sampled boundaries. Each partition ranks its values locally,
+    and the numbers of the rows and the values in the preceding partitions are added as
+    offsets. All the rows of a value are counted in one row of a single partition, so the
+    ties are never split across partitions. For 'first', the 'min' rank is returned.
+    """
+    count_column = "__rank_count__"
+    partition_column = "__rank_partition__"
+    if ascending:
+        asc_func = lambda scol: scol.asc()
+    else:
+        asc_func = lambda scol: scol.desc()
+
+    counts = sdf.groupBy(scol.alias(value_column)).agg(F.count(F.lit(1)).alias(count_column))
+    counts = (
+        counts.repartitionByRange(asc_func(scol_for(counts, value_column)))
+        .withColumn(partition_column, F.spark_partition_id())
+        .localCheckpoint(eager=True)
+    )
+
+    # The partition ids follow the order of the ranges.
+    totals = sorted(
+        counts.groupBy(partition_column).agg(F.sum(count_column), F.count(F.lit(1))).collect()
+    )
+    row_offsets = []  # type: List[Any]
+    value_offsets = []  # type: List[Any]
+    num_rows = num_values = 0
+    for partition, partition_rows, partition_values in totals:
+        row_offsets.extend([F.lit(partition), F.lit(num_rows)])
+        value_offsets.extend([F.lit(partition), F.lit(num_values)])
+        num_rows += partition_rows
+        num_values += partition_values
+    if len(totals) == 0:
+        return counts.select(
+            scol_for(counts, value_column), F.lit(None).cast("long").alias(rank_column)
+        )
+
+    partition = scol_for(counts, partition_column)
+    count = scol_for(counts, count_column)
+    local = (
+        Window.partitionBy(partition)
+        .orderBy(asc_func(scol_for(counts, value_column)))
+        .rowsBetween(Window.unboundedPreceding, Window.currentRow)
+    )
+    preceding = F.create_map(*row_offsets)[partition] + F.sum(count).over(local) - count
+    if method in ("min", "first"):
+        rank = preceding + 1
+    elif method == "max":
+        rank = preceding + count
+    elif method == "average":
+        rank = preceding + (count + 1) / 2
+    else:
+        assert method == "dense", method
+        rank = F.create_map(*value_offsets)[partition] + F.row_number().over(local)
+
+    return counts.select(scol_for(counts, value_column), rank.alias(rank_column))
+
+
+def _approx_rank(sdf: spark.DataFrame, column_name: str, ascending: bool) -> spark.Column:
+    """
+    Return the Spark Column of the ranks of the given column estimated from its approximate
+    quantiles, which are computed with the number of the values in a single job.
+    """
+    probabilities = ", ".join(
+        str(i / _APPROX_RANK_QUANTILES) for i in range(1, _APPROX_RANK_QUANTILES)
+    )
+    quantiles, count = sdf.select(
+        F.expr(
+            "percentile_approx(`{}`, array({}), {})".format(
+                column_name, probabilities, _APPROX_RANK_QUANTILES * 10
+            )
+        ),
+        F.count(scol_for(sdf, column_name)),
+    ).head()
+    if count == 0:
+        return F.lit(None).cast("double")
+
+    # The rank is estimated by the number of the quantiles before the value.
+    preceding = F.expr(
+        "size(filter(array({}), q -> q {} `{}`))".format(
+            ", ".join("CAST('{}' AS DOUBLE)".format(_double_literal(q)) for q in quantiles),
+            "<" if ascending else ">",
+            column_name,
+        )
+    )
+    return F.when(
+        scol_for(sdf, column_name).isNotNull(),
+        F.floor(F.lit(count) * preceding / _APPROX_RANK_QUANTILES) + 1,
+    )
+
+
+def _double_literal(value: Any) -> str:
+    """ Return the string which Spark casts to the given value as a double. """
+    value = float(value)
+    if np.isnan(value):
+        return "NaN"
+    elif np.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    else:
+        return repr(value)
+
+
+# The distinct values of the pivot columns, keyed by the Spark DataFrame, with the input
+# files they were computed from and the values by the string of the pivot column in it.
+_PIVOT_VALUES = (
+    WeakKeyDictionary()
+)  # type: WeakKeyDictionary[spark.DataFrame, Tuple[List[Tuple], Dict[str, List]]]
+
+# The leaf nodes of the logical plans whose data does not change except through files.
+_IMMUTABLE_LEAF_NODES = ("LocalRelation", "LogicalRDD", "Range", "OneRowRelation")
+
+
+def _input_files(sdf: spark.DataFrame) -> Optional[List[Tuple[str, int, int]]]:
+    """
+    Return the paths, sizes and modification times of the input files of the Spark DataFrame,
+    or None if its data can change otherwise, e.g., when it reads a JDBC table.
+    """
+    leaves = sdf._jdf.queryExecution().analyzed().collectLeaves()
+    for i in range(leaves.size()):
+        leaf = leaves.apply(i)
+        if leaf.getClass().getSimpleName() == "LogicalRelation":
+            if leaf.relation().getClass().getSimpleName() != "HadoopFsRelation":
+                return None
+        elif leaf.getClass().getSimpleName() not in _IMMUTABLE_LEAF_NODES:
+            return None
+
+    spark_session = default_session()
+    jvm = spark_session.sparkContext._jvm
+    conf = spark_session._jsc.hadoopConfiguration()
+    files = []
+    for file in sdf._jdf.inputFiles():
+        file_path = jvm.org.apache.hadoop.fs.Path(file)
+        status = file_path.getFileSystem(conf).getFileStatus(file_path)
+        files.append((file, status.getLen(), status.getModificationTime()))
+    return sorted(files)
+
+
+def _pivot_values(internal: InternalFrame, label_or_scol: Union[Tuple, spark.Column]) -> List:
+    """
+    Return the distinct values of the given column in the order Spark's `pivot` uses.
+
+    The values are cached for the Spark DataFrame of the InternalFrame, which is shared by
+    the DataFrames derived from the same DataFrame by projections, as long as its input files
+    keep their sizes and modification times. They are not cached if the data of the Spark
+    DataFrame can change otherwise.
+    """
+    sdf = internal.spark_frame
+    if isinstance(label_or_scol, spark.Column):
+        scol = label_or_scol
+        label = (internal.spark_column_name_for(scol),)
+    else:
+        label = label_or_scol
+        scol = internal.spark_column_for(label)
+    key = scol._jc.toString()
+
+    files = _input_files(sdf)
+    cached = _PIVOT_VALUES.get(sdf)
+    if files is not None and cached is not None and cached[0] == files:
+        cache = cached[1]
+    else:
+        cache = {}
+        if files is not None:
+            _PIVOT_VALUES[sdf] = (files, cache)
+    if key not in cache:
+        max_values = int(default_session().conf.get("spark.sql.pivotMaxValues"))  # type: ignore
+        column_name = "__pivot_value__"
+        rows = (
+            sdf.select(scol.alias(column_name))
+            .distinct()
+            .orderBy(column_name)
+            .limit(max_values + 1)
+            .collect()
+        )
+        if len(rows) > max_values:
+            raise ValueError(
+                "The pivot column {} has more than {} distinct values. If this was intended, "
+                "set 'spark.sql.pivotMaxValues' to at least the number of distinct values of "
+                "the pivot column, or pass 'pivot_values'.".format(
+                    name_like_string(label), max_values
+                )
+            )
+        cache[key] = [row[0] for row in rows]
+    return cache[key]
+
+
 def _reduce_spark_multi(sdf, aggs):
     """
     Performs a reduction on a spark DataFrame, the functions being known sql aggregate functions.
@@ -18,11 +18,12 @@
 A base class of DataFrame/Column to behave similar to pandas DataFrame/Series.
 """
 from abc import ABCMeta, abstractmethod
-from collections import Counter
+from collections import Counter, defaultdict
 from collections.abc import Iterable
 from distutils.version import LooseVersion
 from functools import reduce
-from typing import Any, List, Optional, Tuple, Union, TYPE_CHECKING, cast
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING, cast
+import uuid
 import warnings
 
 import numpy as np  # noqa: F401
@@ -30,6 +31,7 @@ import pandas as pd
 from pandas.api.types import is_list_like
 
 import pyspark
+from pyspark import sql as spark
 from pyspark.sql import functions as F
 from pyspark.sql.types import (
     BooleanType,
@@ -38,6 +40,9 @@ from pyspark.sql.types import (
     IntegralType,
     LongType,
     NumericType,
+    StringType,
+    StructField,
+    StructType,
 )
 
 from databricks import koalas as ks  # For running doctests and reference resolution in PyCharm.
@@ -46,6 +51,7 @@ from databricks.koalas.internal import InternalFrame
 from databricks.koalas.spark import functions as SF
 from databricks.koalas.typedef import Scalar, spark_type_to_pandas_dtype
 from databricks.koalas.utils import (
+    default_session,
     is_name_like_tuple,
     is_name_like_value,
     name_like_string,
@@ -63,6 +69,10 @@ if TYPE_CHECKING:
     from databricks.koalas.series import Series
 
 
+# The default number of rows in a batch written into a file-like object.
+_DEFAULT_WRITE_BATCH_SIZE = 10000
+
+
 class Frame(object, metaclass=ABCMeta):
     """
     The base class for both DataFrame and Series.
@@ -107,6 +117,10 @@ class Frame(object, metaclass=ABCMeta):
     def _to_internal_pandas(self):
         pass
 
+    @abstractmethod
+    def _to_internal_pandas_batches(self, batch_size: int):
+        pass
+
     @abstractmethod
     def head(self, n: int = 5):
         pass
@@ -617,6 +631,8 @@ class Frame(object, metaclass=ABCMeta):
         mode: str = "overwrite",
         partition_cols: Optional[Union[str, List[str]]] = None,
         index_col: Optional[Union[str, List[str]]] = None,
+        single_file: bool = False,
+        batch_size: Optional[int] = None,
         **options
     ) -> Optional[str]:
         r"""
@@ -628,12 +644,16 @@ class Frame(object, metaclass=ABCMeta):
         .. note:: Koalas writes CSV files into the directory, `path`, and writes
             multiple `part-...` files in the directory when `path` is specified.
             This behaviour was inherited from Apache Spark. The number of files can
-            be controlled by `num_files`.
+            be controlled by `num_files`. Set `single_file` to write one file instead.
 
         Parameters
         ----------
-        path : str, default None
-            File path. If None is provided the result is returned as a string.
+        path : str or file-like object, default None
+            File path or object. If None is provided the result is returned as a string.
+            If a file-like object is provided, the rows are written into it in batches of
+            `batch_size` rows without collecting all the data into the driver at once;
+            `num_files`, `mode`, `partition_cols`, `index_col`, `single_file` and `options`
+            are not supported then.
         sep : str, default ','
             String of length 1. Field delimiter for the output file.
         na_rep : str, default ''
@@ -666,6 +686,15 @@ class Frame(object, metaclass=ABCMeta):
         index_col: str or list of str, optional, default: None
             Column names to be used in Spark to represent Koalas' index. The index name
             in Koalas is ignored. By default, the index is always lost.
+        single_file : bool, default False
+            Write a single CSV file at `path` instead of a directory. The part files are
+            written in parallel, and then concatenated into the file with a single header.
+            The compression such as 'gzip', 'bzip2' or 'zstd' in `options` is applied to
+            each part file, and the compressed part files are concatenated as they are.
+            `mode='append'` and `partition_cols` are not supported.
+        batch_size : int, optional
+            The number of rows in a batch written into `path` when it is a file-like object.
+            10000 by default.
         options: keyword arguments for additional options specific to PySpark.
             This kwargs are specific to PySpark's CSV options to pass. Check
             the options in PySpark's API documentation for spark.write.csv(...).
@@ -743,10 +772,55 @@ class Frame(object, metaclass=ABCMeta):
         ...    ...    2012-01-31 12:00:00
         ...    ...    2012-02-29 12:00:00
         ...    ...    2012-03-31 12:00:00
+
+        The part files can be written in parallel into a single file.
+
+        >>> df.date.to_csv(path=r'%s/to_csv/baz.csv' % path, single_file=True)
+        >>> ks.read_csv(
+        ...     path=r'%s/to_csv/baz.csv' % path
+        ... ).sort_values(by="date")  # doctest: +ELLIPSIS, +NORMALIZE_WHITESPACE
+                           date
+        ... 2012-01-31 12:00:00
+        ... 2012-02-29 12:00:00
+        ... 2012-03-31 12:00:00
         """
         if "options" in options and isinstance(options.get("options"), dict) and len(options) == 1:
             options = options.get("options")  # type: ignore
 
+        if path is not None and hasattr(path, "write"):
+            unsupported = [
+                name
+                for name, value, default in [
+                    ("num_files", num_files, None),
+                    ("mode", mode, "overwrite"),
+                    ("partition_cols", partition_cols, None),
+                    ("index_col", index_col, None),
+                    ("single_file", single_file, False),
+                ]
+                if value != default
+            ] + sorted(options)
+            if len(unsupported) > 0:
+                raise ValueError(
+                    "{} cannot be specified when path is a file-like object.".format(
+                        ", ".join(unsupported)
+                    )
+                )
+            if batch_size is None:
+                batch_size = _DEFAULT_WRITE_BATCH_SIZE
+            for i, pobj in enumerate(self._to_internal_pandas_batches(batch_size)):
+                pobj.to_csv(
+                    path,
+                    sep=sep,
+                    na_rep=na_rep,
+                    columns=columns,
+                    header=header if i == 0 else False,
+                    quotechar=quotechar,
+                    date_format=date_format,
+                    escapechar=escapechar,
+                    index=False,
+                )
+            return None
+
         if path is None:
             # If path is none, just collect and use pandas's to_csv.
             kdf_or_ser = self
@@ -824,10 +898,7 @@ class Frame(object, metaclass=ABCMeta):
         if num_files is not None:
             sdf = sdf.repartition(num_files)
 
-        builder = sdf.write.mode(mode)
-        if partition_cols is not None:
-            builder.partitionBy(partition_cols)
-        builder._set_opts(
+        opts = dict(
             sep=sep,
             nullValue=na_rep,
             header=header,
@@ -835,7 +906,19 @@ class Frame(object, metaclass=ABCMeta):
             dateFormat=date_format,
             charToEscapeQuoteEscaping=escapechar,
         )
-        builder.options(**options).format("csv").save(path)
+        opts.update(options)
+
+        if single_file:
+            if partition_cols is not None:
+                raise ValueError("partition_cols is not supported with single_file=True.")
+            _save_as_single_file(sdf, path, "csv", mode, opts)
+            return None
+
+        builder = sdf.write.mode(mode)
+        if partition_cols is not None:
+            builder.partitionBy(partition_cols)
+        builder._set_opts(**opts)
+        builder.format("csv").save(path)
         return None
 
     def to_json(
@@ -848,6 +931,7 @@ class Frame(object, metaclass=ABCMeta):
         lines=True,
         partition_cols: Optional[Union[str, List[str]]] = None,
         index_col: Optional[Union[str, List[str]]] = None,
+        single_file: bool = False,
         **options
     ) -> Optional[str]:
         """
@@ -859,7 +943,7 @@ class Frame(object, metaclass=ABCMeta):
         .. note:: Koalas writes JSON files into the directory, `path`, and writes
             multiple `part-...` files in the directory when `path` is specified.
             This behaviour was inherited from Apache Spark. The number of files can
-            be controlled by `num_files`.
+            be controlled by `num_files`. Set `single_file` to write one file instead.
 
         .. note:: output JSON format is different from pandas'. It always use `orient='records'`
             for its output. This behaviour might have to change in the near future.
@@ -898,6 +982,11 @@ class Frame(object, metaclass=ABCMeta):
         index_col: str or list of str, optional, default: None
             Column names to be used in Spark to represent Koalas' index. The index name
             in Koalas is ignored. By default, the index is always lost.
+        single_file : bool, default False
+            Write a single JSON lines file at `path` instead of a directory. The part files
+            are written in parallel, and then concatenated into the file. The `compression`
+            is applied to each part file, and the compressed part files are concatenated as
+            they are. `mode='append'` and `partition_cols` are not supported.
         options: keyword arguments for additional options specific to PySpark.
             It is specific to PySpark's JSON options to pass. Check
             the options in PySpark's API documentation for `spark.write.json(...)`.
@@ -962,11 +1051,20 @@ class Frame(object, metaclass=ABCMeta):
         if num_files is not None:
             sdf = sdf.repartition(num_files)
 
+        opts = dict(compression=compression)
+        opts.update(options)
+
+        if single_file:
+            if partition_cols is not None:
+                raise ValueError("partition_cols is not supported with single_file=True.")
+            _save_as_single_file(sdf, path, "json", mode, opts)
+            return None
+
         builder = sdf.write.mode(mode)
         if partition_cols is not None:
             builder.partitionBy(partition_cols)
-        builder._set_opts(compression=compression)
-        builder.options(**options).format("json").save(path)
+        builder._set_opts(**opts)
+        builder.format("json").save(path)
         return None
 
     def to_excel(
@@ -987,6 +1085,7 @@ class Frame(object, metaclass=ABCMeta):
         inf_rep="inf",
         verbose=True,
         freeze_panes=None,
+        batch_size=None,
     ) -> None:
         """
         Write object to an Excel sheet.
@@ -1047,6 +1146,11 @@ class Frame(object, metaclass=ABCMeta):
         freeze_panes : tuple of int (length 2), optional
             Specifies the one-based bottommost row and rightmost column that
             is to be frozen.
+        batch_size : int, optional
+            The number of the rows to write at a time. If specified, only a batch of the rows
+            is loaded into the driver's memory at a time, and the rows are appended to a new
+            .xlsx file by openpyxl in the write-only mode. `excel_writer` should be a file path,
+            and the cells are written without the styles or the merged cells.
 
         Notes
         -----
@@ -1089,6 +1193,28 @@ class Frame(object, metaclass=ABCMeta):
         args = locals()
         kdf = self
 
+        if batch_size is not None:
+            if not isinstance(excel_writer, str) or engine not in (None, "openpyxl"):
+                raise ValueError(
+                    "batch_size is only supported with a file path and the openpyxl engine."
+                )
+            _write_excel_in_batches(
+                kdf._to_internal_pandas_batches(batch_size),
+                excel_writer,
+                sheet_name=sheet_name,
+                na_rep=na_rep,
+                float_format=float_format,
+                columns=columns,
+                header=header,
+                index=index,
+                index_label=index_label,
+                startrow=startrow,
+                startcol=startcol,
+                inf_rep=inf_rep,
+                freeze_panes=freeze_panes,
+            )
+            return None
+
         if isinstance(self, ks.DataFrame):
             f = pd.DataFrame.to_excel
         elif isinstance(self, ks.Series):
@@ -3103,3 +3229,149 @@ class Frame(object, metaclass=ABCMeta):
             return F.count(F.nanvl(spark_column, F.lit(None)))
         else:
             return F.count(spark_column)
+
+
+def _save_as_single_file(
+    sdf: spark.DataFrame, path: str, format: str, mode: str, options: Dict[str, Any]
+) -> None:
+    """
+    Write the Spark DataFrame as a single file at the given path.
+
+    The part files are written in parallel into a hidden directory next to the path, and then
+    concatenated in order into the file through the Hadoop file system. For CSV with the header,
+    the parts are written without the header, and the header is written once as another part
+    with the same options. The compressed parts are concatenated as they are since gzip, bzip2
+    and zstd streams can be concatenated.
+
+    :param sdf: the Spark DataFrame to write.
+    :param path: the path of the file.
+    :param format: the data source format, 'csv' or 'json'.
+    :param mode: the save mode except 'append'.
+    :param options: the options of the data source.
+    """
+    mode = mode.lower()
+    if mode == "append":
+        raise ValueError("mode 'append' is not supported with single_file=True.")
+    options = dict(options)
+    if options.get("compression") == "zstd":
+        options["compression"] = "org.apache.hadoop.io.compress.ZStandardCodec"
+    header = options.get("header") in (True, "true", "True")
+    options["header"] = False
+
+    spark_session = default_session()
+    jvm = spark_session.sparkContext._jvm
+    conf = spark_session._jsc.hadoopConfiguration()
+    target = jvm.org.apache.hadoop.fs.Path(path)
+    fs = target.getFileSystem(conf)
+    if fs.exists(target):
+        if mode == "ignore":
+            return
+        elif mode in ("error", "errorifexists"):
+            raise FileExistsError("path {} already exists.".format(path))
+
+    # A checksum file system such as the local one would leave a checksum file of the output
+    # next to it, so the output is written and moved through the raw file system.
+    if jvm.org.apache.hadoop.fs.ChecksumFileSystem._java_lang_class.isInstance(fs):
+        raw_fs = fs.getRaw()
+    else:
+        raw_fs = fs
+
+    temp_dir = jvm.org.apache.hadoop.fs.Path(
+        target.getParent(), "._koalas_{}_{}".format(target.getName(), uuid.uuid4().hex)
+    )
+    try:
+        parts = []
+        if header:
+            header_sdf = spark_session.createDataFrame(
+                [tuple(sdf.columns)],
+                StructType([StructField(str(i), StringType()) for i in range(len(sdf.columns))]),
+            ).coalesce(1)
+            header_dir = jvm.org.apache.hadoop.fs.Path(temp_dir, "header").toString()
+            header_sdf.write._set_opts(**options).format(format).save(header_dir)
+            parts.append(header_dir)
+        data_dir = jvm.org.apache.hadoop.fs.Path(temp_dir, "data").toString()
+        sdf.write._set_opts(**options).format(format).save(data_dir)
+        parts.append(data_dir)
+
+        output = jvm.org.apache.hadoop.fs.Path(temp_dir, "output")
+        stream = raw_fs.create(output, True)
+        try:
+            for part in parts:
+                statuses = [
+                    status
+                    for status in fs.listStatus(jvm.org.apache.hadoop.fs.Path(part))
+                    if status.getPath().getName().startswith("part-")
+                ]
+                for status in sorted(statuses, key=lambda status: status.getPath().getName()):
+                    part_stream = fs.open(status.getPath())
+                    try:
+                        jvm.org.apache.hadoop.io.IOUtils.copyBytes(part_stream, stream, conf, False)
+                    finally:
+                        part_stream.close()
+        finally:
+            stream.close()
+
+        if fs.exists(target):
+            fs.delete(target, True)
+        if not raw_fs.rename(output, target):
+            raise IOError("Failed to write {}.".format(path))
+    finally:
+        fs.delete(temp_dir, True)
+
+
+def _write_excel_in_batches(
+    batches: Iterator,
+    path: str,
+    *,
+    sheet_name: str,
+    na_rep: str,
+    float_format: Optional[str],
+    columns,
+    header,
+    index: bool,
+    index_label,
+    startrow: int,
+    startcol: int,
+    inf_rep: str,
+    freeze_panes: Optional[Tuple[int, int]]
+) -> None:
+    """
+    Write the pandas objects in batches to a new Excel file, appending the rows to a write-only
+    worksheet of openpyxl. The cells of each batch are formatted by pandas' ExcelFormatter.
+    """
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+    from pandas.io.formats.excel import ExcelFormatter
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title=sheet_name)
+    if freeze_panes is not None:
+        worksheet.freeze_panes = "{}{}".format(
+            get_column_letter(freeze_panes[1] + 1), freeze_panes[0] + 1
+        )
+
+    for _ in range(startrow):
+        worksheet.append([])
+    for i, pobj in enumerate(batches):
+        formatter = ExcelFormatter(
+            pobj,
+            na_rep=na_rep,
+            float_format=float_format,
+            cols=columns,
+            header=header if i == 0 else False,
+            index=index,
+            index_label=index_label,
+            merge_cells=False,
+            inf_rep=inf_rep,
+        )
+        rows = defaultdict(dict)  # type: Dict[int, Dict[int, Any]]
+        for cell in formatter.get_formatted_cells():
+            rows[cell.row][cell.col] = cell.val
+        if len(rows) > 0:
+            for row in range(max(rows) + 1):
+                values = rows.get(row, {})
+                worksheet.append(
+                    [None] * startcol
+                    + [values.get(col) for col in range(max(values, default=-1) + 1)]
+                )
+    workbook.save(path)
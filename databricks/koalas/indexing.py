@@ -157,14 +157,18 @@ class AtIndexer(IndexerLike):
             if not is_name_like_tuple(col_sel):
                 col_sel = (col_sel,)
 
+        internal = self._internal
+        if internal.key_directory is not None:
+            internal = internal.key_directory.lookup(internal, row_sel) or internal
+
         cond = reduce(
             lambda x, y: x & y,
-            [scol == row for scol, row in zip(self._internal.index_spark_columns, row_sel)],
+            [scol == row for scol, row in zip(internal.index_spark_columns, row_sel)],
         )
         pdf = (
-            self._internal.spark_frame.drop(NATURAL_ORDER_COLUMN_NAME)
+            internal.spark_frame.drop(NATURAL_ORDER_COLUMN_NAME)
             .filter(cond)
-            .select(self._internal.spark_column_for(col_sel))
+            .select(internal.spark_column_for(col_sel))
             .toPandas()
         )
 
@@ -492,39 +496,44 @@ class LocIndexerLike(IndexerLike, metaclass=ABCMeta):
         else:
             column_label_names = self._internal.column_label_names
 
-        try:
-            sdf = self._internal.spark_frame
+        internal = None
+        if limit is None and remaining_index is None:
+            # With the lazy default index, filter the rows and select the columns before the
+            # default index is attached so that they reach the scan.
+            internal = self._internal.with_filter_before_default_index(
+                cond, column_labels, data_spark_columns, data_dtypes, column_label_names
+            )
 
-            if cond is not None:
-                index_columns = sdf.select(index_spark_columns).columns
-                data_columns = sdf.select(data_spark_columns).columns
-                sdf = sdf.filter(cond).select(index_spark_columns + data_spark_columns)
-                index_spark_columns = [scol_for(sdf, col) for col in index_columns]
-                data_spark_columns = [scol_for(sdf, col) for col in data_columns]
+        if internal is None:
+            try:
+                sdf = self._internal.spark_frame
 
-            if limit is not None:
-                if limit >= 0:
-                    sdf = sdf.limit(limit)
-                else:
-                    sdf = sdf.limit(sdf.count() + limit)
-                sdf = sdf.drop(NATURAL_ORDER_COLUMN_NAME)
-        except AnalysisException:
-            raise KeyError(
-                "[{}] don't exist in columns".format(
-                    [col._jc.toString() for col in data_spark_columns]
+                if cond is not None:
+                    index_columns = sdf.select(index_spark_columns).columns
+                    data_columns = sdf.select(data_spark_columns).columns
+                    sdf = sdf.filter(cond).select(index_spark_columns + data_spark_columns)
+                    index_spark_columns = [scol_for(sdf, col) for col in index_columns]
+                    data_spark_columns = [scol_for(sdf, col) for col in data_columns]
+
+                if limit is not None:
+                    sdf = sdf.limit(limit).drop(NATURAL_ORDER_COLUMN_NAME)
+            except AnalysisException:
+                raise KeyError(
+                    "[{}] don't exist in columns".format(
+                        [col._jc.toString() for col in data_spark_columns]
+                    )
                 )
-            )
 
-        internal = InternalFrame(
-            spark_frame=sdf,
-            index_spark_columns=index_spark_columns,
-            index_names=index_names,
-            index_dtypes=index_dtypes,
-            column_labels=column_labels,
-            data_spark_columns=data_spark_columns,
-            data_dtypes=data_dtypes,
-            column_label_names=column_label_names,
-        )
+            internal = InternalFrame(
+                spark_frame=sdf,
+                index_spark_columns=index_spark_columns,
+                index_names=index_names,
+                index_dtypes=index_dtypes,
+                column_labels=column_labels,
+                data_spark_columns=data_spark_columns,
+                data_dtypes=data_dtypes,
+                column_label_names=column_label_names,
+            )
         kdf = DataFrame(internal)
 
         if returns_series:
@@ -605,7 +614,7 @@ class LocIndexerLike(IndexerLike, metaclass=ABCMeta):
             if cond is None:
                 cond = F.lit(True)
             if limit is not None:
-                cond = cond & (self._internal.spark_frame[self._sequence_col] < F.lit(limit))
+                cond = cond & self._select_rows_by_limit(limit)
 
             if isinstance(value, (Series, spark.Column)):
                 if remaining_index is not None and remaining_index == 0:
@@ -686,7 +695,7 @@ class LocIndexerLike(IndexerLike, metaclass=ABCMeta):
             if cond is None:
                 cond = F.lit(True)
             if limit is not None:
-                cond = cond & (self._internal.spark_frame[self._sequence_col] < F.lit(limit))
+                cond = cond & self._select_rows_by_limit(limit)
 
             if isinstance(value, (Series, spark.Column)):
                 if remaining_index is not None and remaining_index == 0:
@@ -954,6 +963,35 @@ class LocIndexer(LocIndexerLike):
             spark_target_function="select, where",
         )
 
+    def __getitem__(self, key) -> Union["Series", "DataFrame"]:
+        from databricks.koalas.frame import DataFrame
+        from databricks.koalas.series import Series
+
+        key_directory = self._internal.key_directory
+        if key_directory is not None:
+            if self._is_df and isinstance(key, tuple):
+                rows_sel = key[0]
+            else:
+                rows_sel = key
+
+            if not (
+                rows_sel is None
+                or isinstance(rows_sel, (Series, spark.Column, slice))
+                or (not isinstance(rows_sel, tuple) and is_list_like(rows_sel))
+            ):
+                if not isinstance(rows_sel, tuple):
+                    rows_sel = (rows_sel,)
+                internal = key_directory.lookup(self._internal, rows_sel)
+                if internal is not None:
+                    # Resolve the key against the rows read from the matching partitions only.
+                    kdf = DataFrame(internal)
+                    if self._is_df:
+                        return LocIndexer(kdf)[key]
+                    else:
+                        return LocIndexer(kdf._kser_for(self._kdf_or_kser._column_label))[key]
+
+        return super().__getitem__(key)
+
     def _select_rows_by_series(
         self, rows_sel: "Series"
     ) -> Tuple[Optional[spark.Column], Optional[int], Optional[int]]:
@@ -982,6 +1020,14 @@ class LocIndexer(LocIndexerLike):
             start = rows_sel.start
             stop = rows_sel.stop
 
+            # If the index is sorted, the slice is simply the range of the index values, and
+            # we don't need to look up the natural order of `start` and `stop`.
+            # The sortedness is decided by the index statistics cached in InternalFrame.
+            if self._internal.is_index_monotonic("increasing"):
+                return self._select_rows_by_sorted_index_range(start, stop), None, None
+            elif self._internal.is_index_monotonic("decreasing"):
+                return self._select_rows_by_sorted_index_range(stop, start), None, None
+
             # get natural order from '__natural_order__' from start to stop
             # to keep natural order.
             start_and_stop = (
@@ -999,39 +1045,19 @@ class LocIndexer(LocIndexerLike):
             stop = [row[1] for row in start_and_stop if row[0] == stop]
             stop = stop[-1] if len(stop) > 0 else None
 
+            # if index order is not monotonic increasing or decreasing
+            # and specified values don't exist in index, raise KeyError
+            if start is None and rows_sel.start is not None:
+                raise KeyError(rows_sel.start)
+            if stop is None and rows_sel.stop is not None:
+                raise KeyError(rows_sel.stop)
+
             cond = []
             if start is not None:
                 cond.append(F.col(NATURAL_ORDER_COLUMN_NAME) >= F.lit(start).cast(LongType()))
             if stop is not None:
                 cond.append(F.col(NATURAL_ORDER_COLUMN_NAME) <= F.lit(stop).cast(LongType()))
 
-            # if index order is not monotonic increasing or decreasing
-            # and specified values don't exist in index, raise KeyError
-            if (start is None and rows_sel.start is not None) or (
-                stop is None and rows_sel.stop is not None
-            ):
-
-                inc = index_column.is_monotonic_increasing
-                if inc is False:
-                    dec = index_column.is_monotonic_decreasing
-
-                if start is None and rows_sel.start is not None:
-                    start = rows_sel.start
-                    if inc is not False:
-                        cond.append(index_column.spark.column >= F.lit(start).cast(index_data_type))
-                    elif dec is not False:
-                        cond.append(index_column.spark.column <= F.lit(start).cast(index_data_type))
-                    else:
-                        raise KeyError(rows_sel.start)
-                if stop is None and rows_sel.stop is not None:
-                    stop = rows_sel.stop
-                    if inc is not False:
-                        cond.append(index_column.spark.column <= F.lit(stop).cast(index_data_type))
-                    elif dec is not False:
-                        cond.append(index_column.spark.column >= F.lit(stop).cast(index_data_type))
-                    else:
-                        raise KeyError(rows_sel.stop)
-
             return reduce(lambda x, y: x & y, cond), None, None
         else:
             index = self._kdf_or_kser.index
@@ -1087,6 +1113,44 @@ class LocIndexer(LocIndexerLike):
 
             return reduce(lambda x, y: x & y, conds), None, None
 
+    def _select_rows_by_sorted_index_range(self, lower: Any, upper: Any) -> spark.Column:
+        """
+        Build the condition to select the rows between `lower` and `upper` (both inclusive) of
+        the sorted single index.
+
+        The partitions are pruned by the cached index statistics: if none of the partitions can
+        have the values in the range, it returns the condition that Spark can resolve to
+        an empty relation without scanning the data.
+        """
+        index_scol = self._internal.index_spark_columns[0]
+        index_data_type = self._internal.spark_type_for(index_scol)
+
+        stats = self._internal.index_statistics
+        mins, maxs = stats["min"].tolist(), stats["max"].tolist()
+
+        def out_of_range(value: Any, bound: Any, comp) -> bool:
+            try:
+                return bool(comp(value, bound))
+            except TypeError:
+                # Cannot compare without casting, e.g., a string for the timestamp index.
+                return False
+
+        if len(mins) == 0 or all(
+            (lower is not None and out_of_range(lower, mx, lambda v, b: v > b))
+            or (upper is not None and out_of_range(upper, mn, lambda v, b: v < b))
+            for mn, mx in zip(mins, maxs)
+        ):
+            return F.lit(False)
+
+        cond = []
+        if lower is not None:
+            cond.append(index_scol >= F.lit(lower).cast(index_data_type))
+        if upper is not None:
+            cond.append(index_scol <= F.lit(upper).cast(index_data_type))
+        if len(cond) == 0:
+            return F.lit(True)
+        return reduce(lambda x, y: x & y, cond)
+
     def _select_rows_by_iterable(
         self, rows_sel: Iterable
     ) -> Tuple[Optional[spark.Column], Optional[int], Optional[int]]:
@@ -1467,20 +1531,74 @@ class iLocIndexer(LocIndexerLike):
             spark_target_function="select, where",
         )
 
+    # `monotonically_increasing_id` puts the partition id in the upper 31 bits and the record
+    # number within each partition in the lower 33 bits.
+    _PARTITION_ID_SHIFT = 33
+
     @lazy_property
     def _internal(self):
         # Use resolved_copy to fix the natural order.
         internal = super()._internal.resolved_copy
-        sdf = InternalFrame.attach_distributed_sequence_column(
-            internal.spark_frame, column_name=self._sequence_col
-        )
-        return internal.with_new_sdf(spark_frame=sdf.orderBy(NATURAL_ORDER_COLUMN_NAME))
+        sdf = internal.spark_frame.withColumn(self._sequence_col, F.monotonically_increasing_id())
+        return internal.with_new_sdf(spark_frame=sdf)
 
     @lazy_property
     def _sequence_col(self):
         # Use resolved_copy to fix the natural order.
         internal = super()._internal.resolved_copy
-        return verify_temp_column_name(internal.spark_frame, "__distributed_sequence_column__")
+        return verify_temp_column_name(internal.spark_frame, "__monotonically_increasing_id__")
+
+    @lazy_property
+    def _partition_offsets(self) -> List[Tuple[int, int, int]]:
+        """
+        The tuples of the partition id, the position of its first row and the number of rows
+        for each non-empty partition, in the order of the partition id.
+
+        The row counts are cached in the InternalFrame of the indexed object, so the positions are
+        resolved without counting rows again while the object is not updated.
+        """
+        counts = super()._internal.partition_row_counts
+        offsets = []
+        offset = 0
+        for partition_id in sorted(counts):
+            offsets.append((partition_id, offset, counts[partition_id]))
+            offset += counts[partition_id]
+        return offsets
+
+    @lazy_property
+    def _row_count(self) -> int:
+        return sum(count for _, _, count in self._partition_offsets)
+
+    def _sequence_for(self, position: int) -> int:
+        """
+        Return the value of the sequence column for the given position.
+        If the position is out of the rows, returns the value larger than any sequence values.
+        """
+        assert position >= 0, position
+        for partition_id, offset, count in self._partition_offsets:
+            if position < offset + count:
+                return (partition_id << self._PARTITION_ID_SHIFT) + (position - offset)
+        if len(self._partition_offsets) == 0:
+            return 0
+        else:
+            return (self._partition_offsets[-1][0] + 1) << self._PARTITION_ID_SHIFT
+
+    @lazy_property
+    def _position_scol(self) -> spark.Column:
+        """ The Spark column to compute the position from the sequence column. """
+        offsets = [0] * (self._partition_offsets[-1][0] + 1)
+        for partition_id, offset, _ in self._partition_offsets:
+            offsets[partition_id] = offset
+        sequence_scol = self._internal.spark_frame[self._sequence_col]
+        partition_id = F.shiftRightUnsigned(sequence_scol, self._PARTITION_ID_SHIFT).cast("int")
+        return F.array(*[F.lit(offset) for offset in offsets])[partition_id] + (
+            sequence_scol.bitwiseAND(F.lit((1 << self._PARTITION_ID_SHIFT) - 1))
+        )
+
+    def _select_rows_by_limit(self, limit: int) -> spark.Column:
+        """ Build the condition to select the first `limit` rows. """
+        sequence_scol = self._internal.spark_frame[self._sequence_col]
+        return sequence_scol < F.lit(self._sequence_for(max(limit, 0)))
 
     def _select_rows_by_series(
         self, rows_sel: "Series"
@@ -1509,82 +1627,51 @@ class iLocIndexer(LocIndexerLike):
                     "cannot do slice indexing with these indexers [{}] of {}".format(i, type(i))
                 )
 
-        has_negative = False
-        start = rows_sel.start
-        if start is not None:
-            verify_type(start)
-            if start == 0:
-                start = None
-            elif start < 0:
-                has_negative = True
-        stop = rows_sel.stop
-        if stop is not None:
-            verify_type(stop)
-            if stop < 0:
-                has_negative = True
-
-        step = rows_sel.step
-        if step is not None:
-            verify_type(step)
-            if step == 0:
-                raise ValueError("slice step cannot be zero")
-        else:
-            step = 1
+        for i in (rows_sel.start, rows_sel.stop, rows_sel.step):
+            if i is not None:
+                verify_type(i)
+        if rows_sel.step == 0:
+            raise ValueError("slice step cannot be zero")
 
-        if start is None and step == 1:
-            return None, stop, None
-
-        sdf = self._internal.spark_frame
-        sequence_scol = sdf[self._sequence_col]
+        if (rows_sel.start is None or rows_sel.start == 0) and (
+            rows_sel.step is None or rows_sel.step == 1
+        ):
+            if rows_sel.stop is not None and rows_sel.stop < 0:
+                return None, max(rows_sel.stop + self._row_count, 0), None
+            return None, rows_sel.stop, None
 
-        if has_negative or (step < 0 and start is None):
-            cnt = sdf.count()
+        positions = range(*rows_sel.indices(self._row_count))
+        if len(positions) == 0:
+            return F.lit(False), None, None
 
-        cond = []
-        if start is not None:
-            if start < 0:
-                start = start + cnt
-            if step >= 0:
-                cond.append(sequence_scol >= F.lit(start).cast(LongType()))
-            else:
-                cond.append(sequence_scol <= F.lit(start).cast(LongType()))
-        if stop is not None:
-            if stop < 0:
-                stop = stop + cnt
-            if step >= 0:
-                cond.append(sequence_scol < F.lit(stop).cast(LongType()))
-            else:
-                cond.append(sequence_scol > F.lit(stop).cast(LongType()))
+        lower, upper = min(positions[0], positions[-1]), max(positions[0], positions[-1])
+        sequence_scol = self._internal.spark_frame[self._sequence_col]
+        cond = (sequence_scol >= F.lit(self._sequence_for(lower))) & (
+            sequence_scol <= F.lit(self._sequence_for(upper))
+        )
+        step = abs(positions.step)
         if step != 1:
-            if step > 0:
-                start = start or 0
-            else:
-                start = start or (cnt - 1)
-            cond.append(((sequence_scol - start) % F.lit(step).cast(LongType())) == F.lit(0))
-
-        return reduce(lambda x, y: x & y, cond), None, None
+            cond = cond & (((self._position_scol - lower) % F.lit(step)) == F.lit(0))
+        return cond, None, None
 
     def _select_rows_by_iterable(
         self, rows_sel: Iterable
     ) -> Tuple[Optional[spark.Column], Optional[int], Optional[int]]:
-        sdf = self._internal.spark_frame
-
-        if any(isinstance(key, (int, np.int, np.int64, np.int32)) and key < 0 for key in rows_sel):
-            offset = sdf.count()
-        else:
-            offset = 0
-
-        new_rows_sel = []
-        for key in list(rows_sel):
+        rows_sel = list(rows_sel)
+        for key in rows_sel:
             if not isinstance(key, (int, np.int, np.int64, np.int32)):
                 raise TypeError(
                     "cannot do positional indexing with these indexers [{}] of {}".format(
                         key, type(key)
                     )
                 )
-            if key < 0:
-                key = key + offset
-            new_rows_sel.append(key)
+
+        if any(key < 0 for key in rows_sel):
+            offset = self._row_count
+        else:
+            offset = 0
+
+        new_rows_sel = [int(key + offset) if key < 0 else int(key) for key in rows_sel]
 
         if len(new_rows_sel) != len(set(new_rows_sel)):
             raise NotImplementedError(
@@ -1592,21 +1679,26 @@ class iLocIndexer(LocIndexerLike):
                 "however, normalised index was [%s]" % new_rows_sel
             )
 
-        sequence_scol = sdf[self._sequence_col]
-        cond = []
-        for key in new_rows_sel:
-            cond.append(sequence_scol == F.lit(int(key)).cast(LongType()))
+        sequences = [self._sequence_for(key) for key in new_rows_sel if 0 <= key < self._row_count]
+        if len(sequences) == 0:
+            return F.lit(False), None, None
 
-        if len(cond) == 0:
-            cond = [F.lit(False)]
-        return reduce(lambda x, y: x | y, cond), None, None
+        sequence_scol = self._internal.spark_frame[self._sequence_col]
+        if len(sequences) == 1:
+            return sequence_scol == F.lit(sequences[0]), None, None
+        else:
+            return sequence_scol.isin([F.lit(seq) for seq in sequences]), None, None
 
     def _select_rows_else(
         self, rows_sel: Any
     ) -> Tuple[Optional[spark.Column], Optional[int], Optional[int]]:
         if isinstance(rows_sel, int):
+            if rows_sel < 0:
+                rows_sel = rows_sel + self._row_count
+            if not (0 <= rows_sel < self._row_count):
+                return F.lit(False), None, 0
             sdf = self._internal.spark_frame
-            return (sdf[self._sequence_col] == rows_sel), None, 0
+            return (sdf[self._sequence_col] == F.lit(self._sequence_for(rows_sel))), None, 0
         elif isinstance(rows_sel, tuple):
             raise SparkPandasIndexingError("Too many indexers")
         else:
@@ -19,8 +19,9 @@ An internal immutable DataFrame with some metadata to manage indexes.
 """
 from distutils.version import LooseVersion
 import re
-from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+from typing import Dict, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
 from itertools import accumulate
+from weakref import WeakKeyDictionary, WeakValueDictionary
 import py4j
 
 import numpy as np
@@ -31,7 +32,16 @@ from pyspark import sql as spark
 from pyspark._globals import _NoValue, _NoValueType
 from pyspark.sql import functions as F, Window
 from pyspark.sql.functions import PandasUDFType, pandas_udf
-from pyspark.sql.types import BooleanType, DataType, IntegralType, StructField, StructType, LongType
+from pyspark.sql.types import (
+    BooleanType,
+    DataType,
+    DoubleType,
+    FloatType,
+    IntegralType,
+    LongType,
+    StructField,
+    StructType,
+)
 
 try:
     from pyspark.sql.types import to_arrow_type
@@ -43,6 +53,7 @@ from databricks import koalas as ks  # noqa: F401
 
 if TYPE_CHECKING:
     # This is required in old Python 3.5 to prevent circular reference.
+    from databricks.koalas.key_directory import KeyDirectory
     from databricks.koalas.series import Series
 from databricks.koalas.config import get_option
 from databricks.koalas.typedef import (
@@ -65,6 +76,20 @@ from databricks.koalas.utils import (
 )
 
 
+# The analyzed fields of the Spark Columns per Spark DataFrame, keyed by the id of the Spark
+# Column, shared by the InternalFrames on the same Spark DataFrame. Each entry keeps the Spark
+# Column itself so that the id cannot be reused, and whether the nullability is exact.
+_SPARK_FIELD_CACHES = (
+    WeakKeyDictionary()
+)  # type: WeakKeyDictionary[spark.DataFrame, Dict[int, Tuple[spark.Column, StructField, bool]]]
+
+# The Spark DataFrames of the InternalFrames with the default index attached, keyed by the
+# expression id of the default index column, so that the unique index can be recognized in
+# the Spark DataFrames derived from them.
+_DEFAULT_INDEX_SPARK_FRAMES = (
+    WeakValueDictionary()
+)  # type: WeakValueDictionary[int, spark.DataFrame]
+
 # A function to turn given numbers to Spark columns that represent Koalas index.
 SPARK_INDEX_NAME_FORMAT = "__index_level_{}__".format
 SPARK_DEFAULT_INDEX_NAME = SPARK_INDEX_NAME_FORMAT(0)
@@ -469,8 +494,12 @@ class InternalFrame(object):
         """
 
         assert isinstance(spark_frame, spark.DataFrame)
-        assert not spark_frame.isStreaming, "Koalas does not support Structured Streaming."
+        # The Spark DataFrames already managed by another InternalFrame were checked before.
+        assert (
+            spark_frame in _SPARK_FIELD_CACHES or not spark_frame.isStreaming
+        ), "Koalas does not support Structured Streaming."
 
+        default_index_attached = not index_spark_columns
         if not index_spark_columns:
             if data_spark_columns is not None:
                 if column_labels is not None:
@@ -496,12 +525,20 @@ class InternalFrame(object):
                     if col != SPARK_DEFAULT_INDEX_NAME
                 ]
 
-        if NATURAL_ORDER_COLUMN_NAME not in spark_frame.columns:
+        if (
+            spark_frame not in _SPARK_FIELD_CACHES
+            and NATURAL_ORDER_COLUMN_NAME not in spark_frame.columns
+        ):
             spark_frame = spark_frame.withColumn(
                 NATURAL_ORDER_COLUMN_NAME, F.monotonically_increasing_id()
             )
 
         self._sdf = spark_frame  # type: spark.DataFrame
+        self._spark_field_cache = _SPARK_FIELD_CACHES.setdefault(spark_frame, {})
+        if default_index_attached:
+            _DEFAULT_INDEX_SPARK_FRAMES[
+                index_spark_columns[0]._jc.expr().exprId().id()
+            ] = spark_frame
 
         # index_spark_columns
         assert all(
@@ -533,12 +570,7 @@ class InternalFrame(object):
             len(index_dtypes),
         )
 
-        index_dtypes = [
-            spark_type_to_pandas_dtype(spark_frame.select(scol).schema[0].dataType)
-            if dtype is None or dtype == np.dtype("object")
-            else dtype
-            for dtype, scol in zip(index_dtypes, index_spark_columns)
-        ]
+        index_dtypes = self._infer_dtypes(index_spark_columns, index_dtypes)
 
         assert all(
             isinstance(dtype, DtypeDataTypes)
@@ -594,12 +626,7 @@ class InternalFrame(object):
             len(data_dtypes),
         )
 
-        data_dtypes = [
-            spark_type_to_pandas_dtype(spark_frame.select(scol).schema[0].dataType)
-            if dtype is None or dtype == np.dtype("object")
-            else dtype
-            for dtype, scol in zip(data_dtypes, data_spark_columns)
-        ]
+        data_dtypes = self._infer_dtypes(data_spark_columns, data_dtypes)
 
         assert all(
             isinstance(dtype, DtypeDataTypes)
@@ -628,6 +655,9 @@ class InternalFrame(object):
             ), column_label_names
             self._column_label_names = column_label_names
 
+        self._key_directory = None  # type: Optional[KeyDirectory]
+        self._lazy_default_index_frame = None  # type: Optional[spark.DataFrame]
+
     @staticmethod
     def attach_default_index(sdf, default_index_type=None):
         """
@@ -799,29 +829,112 @@ class InternalFrame(object):
             (sdf[offset_column] + sdf[row_number_column] - 1).alias(column_name), *scols
         )
 
-    def spark_column_for(self, label: Tuple) -> spark.Column:
-        """ Return Spark Column for the given column label. """
-        column_labels_to_scol = dict(zip(self.column_labels, self.data_spark_columns))
-        if label in column_labels_to_scol:
-            return column_labels_to_scol[label]
+    def _infer_dtypes(
+        self, spark_columns: List[spark.Column], dtypes: List[Optional[Dtype]]
+    ) -> List[Dtype]:
+        """ Fill in the missing dtypes from the Spark types, analyzing the columns at once. """
+        missing = [
+            scol
+            for dtype, scol in zip(dtypes, spark_columns)
+            if dtype is None or dtype == np.dtype("object")
+        ]
+        if len(missing) == 0:
+            return dtypes
+        fields = iter(self._analyze_spark_columns(missing))
+        return [
+            spark_type_to_pandas_dtype(next(fields).dataType)
+            if dtype is None or dtype == np.dtype("object")
+            else dtype
+            for dtype in dtypes
+        ]
+
+    def _analyze_spark_columns(self, spark_columns: List[spark.Column]) -> List[StructField]:
+        """
+        Return the analyzed fields of the given Spark Columns against the managed Spark DataFrame.
+
+        The fields are cached per Spark Column, and the columns not analyzed yet are analyzed
+        together in a single pass instead of one Py4J round trip per column.
+        """
+        cache = self._spark_field_cache
+        missing = [scol for scol in spark_columns if cache.get(id(scol), (None,))[0] is not scol]
+        if len(missing) > 0:
+            for scol, field in zip(missing, self.spark_frame.select(missing).schema.fields):
+                cache[id(scol)] = (scol, field, True)
+        return [cache[id(scol)][1] for scol in spark_columns]
+
+    def _spark_field_for(self, label_or_scol: Union[Tuple, spark.Column]) -> StructField:
+        """ Return the analyzed field for the given column label or Spark Column. """
+        if isinstance(label_or_scol, spark.Column):
+            scol = label_or_scol
+            entry = self._spark_field_cache.get(id(scol))
+            if entry is not None and entry[0] is scol:
+                return entry[1]
+            elif id(scol) in self._managed_spark_column_ids:
+                return self._analyze_spark_columns(self.spark_columns)[
+                    self._managed_spark_column_ids[id(scol)]
+                ]
+            else:
+                return self.spark_frame.select(scol).schema[0]
         else:
+            return self._data_spark_fields[self._column_label_position(label_or_scol)]
+
+    @lazy_property
+    def _managed_spark_column_ids(self) -> Dict[int, int]:
+        """ The positions in `spark_columns` of the managed Spark Columns, keyed by their ids. """
+        return {id(scol): i for i, scol in enumerate(self.spark_columns)}
+
+    @lazy_property
+    def _data_spark_fields(self) -> List[StructField]:
+        """ The analyzed fields of the data columns. """
+        return self._analyze_spark_columns(self.data_spark_columns)
+
+    @lazy_property
+    def _column_label_positions(self) -> Dict[Tuple, int]:
+        """ The positions of the column labels. The last one wins for duplicated labels. """
+        return {label: i for i, label in enumerate(self.column_labels)}
+
+    def _column_label_position(self, label: Tuple) -> int:
+        """ Return the position of the given column label. """
+        try:
+            return self._column_label_positions[label]
+        except KeyError:
             raise KeyError(name_like_string(label))
 
+    def _inherit_spark_fields(
+        self,
+        internal: "InternalFrame",
+        spark_columns: List[spark.Column],
+        exact_nullability: bool = True,
+    ) -> "InternalFrame":
+        """
+        Carry the analyzed fields over to the given InternalFrame derived from this one
+        on another Spark DataFrame. The InternalFrames on the same Spark DataFrame already share
+        the analyzed fields.
+
+        :param internal: the derived InternalFrame.
+        :param spark_columns: the Spark Columns of this InternalFrame which the index and data
+                              Spark Columns of `internal` are analyzed to, in the same order.
+        :param exact_nullability: whether the nullability is still exact in `internal`.
+        :return: the given InternalFrame.
+        """
+        cache = internal._spark_field_cache
+        fields = self._analyze_spark_columns(spark_columns)
+        for scol, field in zip(internal.index_spark_columns + internal.data_spark_columns, fields):
+            if cache.get(id(scol), (None,))[0] is not scol:
+                cache[id(scol)] = (scol, field, exact_nullability)
+        return internal
+
+    def spark_column_for(self, label: Tuple) -> spark.Column:
+        """ Return Spark Column for the given column label. """
+        return self.data_spark_columns[self._column_label_position(label)]
+
     def spark_column_name_for(self, label_or_scol: Union[Tuple, spark.Column]) -> str:
         """ Return the actual Spark column name for the given column label. """
-        if isinstance(label_or_scol, spark.Column):
-            scol = label_or_scol
-        else:
-            scol = self.spark_column_for(label_or_scol)
-        return self.spark_frame.select(scol).columns[0]
+        return self._spark_field_for(label_or_scol).name
 
     def spark_type_for(self, label_or_scol: Union[Tuple, spark.Column]) -> DataType:
         """ Return DataType for the given column label. """
-        if isinstance(label_or_scol, spark.Column):
-            scol = label_or_scol
-        else:
-            scol = self.spark_column_for(label_or_scol)
-        return self.spark_frame.select(scol).schema[0].dataType
+        return self._spark_field_for(label_or_scol).dataType
 
     def spark_column_nullable_for(self, label_or_scol: Union[Tuple, spark.Column]) -> bool:
         """ Return nullability for the given column label. """
@@ -829,15 +942,14 @@ class InternalFrame(object):
             scol = label_or_scol
         else:
             scol = self.spark_column_for(label_or_scol)
+        entry = self._spark_field_cache.get(id(scol))
+        if entry is not None and entry[0] is scol and entry[2]:
+            return entry[1].nullable
         return self.spark_frame.select(scol).schema[0].nullable
 
     def dtype_for(self, label: Tuple) -> Dtype:
         """ Return dtype for the given column label. """
-        column_labels_to_dtype = dict(zip(self.column_labels, self.data_dtypes))
-        if label in column_labels_to_dtype:
-            return column_labels_to_dtype[label]
-        else:
-            raise KeyError(name_like_string(label))
+        return self.data_dtypes[self._column_label_position(label)]
 
     @property
     def spark_frame(self) -> spark.DataFrame:
@@ -847,7 +959,7 @@ class InternalFrame(object):
     @lazy_property
     def data_spark_column_names(self) -> List[str]:
         """ Return the managed column field names. """
-        return self.spark_frame.select(self.data_spark_columns).columns
+        return [field.name for field in self._data_spark_fields]
 
     @property
     def data_spark_columns(self) -> List[spark.Column]:
@@ -857,7 +969,7 @@ class InternalFrame(object):
     @property
     def index_spark_column_names(self) -> List[str]:
         """ Return the managed index field names. """
-        return self.spark_frame.select(self.index_spark_columns).columns
+        return [field.name for field in self._analyze_spark_columns(self.index_spark_columns)]
 
     @property
     def index_spark_columns(self) -> List[spark.Column]:
@@ -867,7 +979,7 @@ class InternalFrame(object):
     @lazy_property
     def spark_column_names(self) -> List[str]:
         """ Return all the field names including index field names. """
-        return self.spark_frame.select(self.spark_columns).columns
+        return [field.name for field in self._analyze_spark_columns(self.spark_columns)]
 
     @lazy_property
     def spark_columns(self) -> List[spark.Column]:
@@ -914,6 +1026,207 @@ class InternalFrame(object):
         """ Return dtypes for the managed columns. """
         return self._data_dtypes
 
+    @lazy_property
+    def partition_row_counts(self) -> Dict[int, int]:
+        """
+        Return the number of rows per Spark partition id. Empty partitions are omitted.
+
+        The counts are computed by a single job when they are requested first, and cached
+        in this immutable InternalFrame.
+
+        >>> kdf = ks.DataFrame({"a": range(10)})
+        >>> counts = kdf._internal.partition_row_counts
+        >>> sum(counts.values())
+        10
+        >>> kdf._internal.partition_row_counts is counts
+        True
+        """
+        sdf = self.spark_frame.select(F.spark_partition_id().alias("__partition_id"))
+        return {row[0]: row[1] for row in sdf.groupby(F.col("__partition_id")).count().collect()}
+
+    @lazy_property
+    def index_statistics(self) -> Optional[pd.DataFrame]:
+        """
+        Return the statistics of the index per Spark partition.
+
+        The statistics are computed by a single job when they are requested first, and cached
+        in this immutable InternalFrame. This is only available for a single index; otherwise
+        returns None.
+
+        Each row represents a non-empty Spark partition in the order of the partition id:
+
+        * `count`: the number of rows in the partition.
+        * `null_count`: the number of null (or NaN) index values in the partition.
+        * `min` and `max`: the minimum and maximum index value in the partition.
+        * `increasing` and `decreasing`: whether or not the index values are sorted
+          in the natural order within the partition.
+
+        >>> kdf = ks.DataFrame({"a": [1, 2, 3]}, index=[10, 20, 30])
+        >>> stats = kdf._internal.index_statistics
+        >>> int(stats["count"].sum()), stats["min"].min(), stats["max"].max()
+        (3, 10, 30)
+        >>> kdf._internal.index_statistics is stats
+        True
+        >>> kdf.set_index("a", append=True)._internal.index_statistics is None
+        True
+        """
+        if self.index_level != 1:
+            return None
+
+        index_scol = self.index_spark_columns[0]
+        if isinstance(self.spark_type_for(index_scol), (FloatType, DoubleType)):
+            index_scol = F.when(~F.isnan(index_scol), index_scol)
+
+        sdf = self.spark_frame.select(
+            # Make sure we use the same partition id in the whole job.
+            F.spark_partition_id().alias("__partition_id"),
+            F.col(NATURAL_ORDER_COLUMN_NAME),
+            index_scol.alias("__index"),
+        )
+        window = (
+            Window.partitionBy(F.col("__partition_id"))
+            .orderBy(NATURAL_ORDER_COLUMN_NAME)
+            .rowsBetween(-1, -1)
+        )
+        prev = F.lag(F.col("__index"), 1).over(window)
+        sdf = (
+            sdf.select(
+                F.col("__partition_id"),
+                F.col("__index"),
+                (F.col("__index") >= prev).alias("__increasing"),
+                (F.col("__index") <= prev).alias("__decreasing"),
+            )
+            .groupby(F.col("__partition_id"))
+            .agg(
+                F.count(F.lit(1)).alias("count"),
+                (F.count(F.lit(1)) - F.count(F.col("__index"))).alias("null_count"),
+                F.min(F.col("__index")).alias("min"),
+                F.max(F.col("__index")).alias("max"),
+                F.min(F.coalesce(F.col("__increasing"), F.lit(True))).alias("increasing"),
+                F.min(F.coalesce(F.col("__decreasing"), F.lit(True))).alias("decreasing"),
+            )
+        )
+
+        columns = ["partition_id", "count", "null_count", "min", "max", "increasing", "decreasing"]
+        rows = sorted(sdf.collect(), key=lambda row: row[0])
+        return pd.DataFrame([tuple(row) for row in rows], columns=columns)
+
+    def is_index_monotonic(self, order: str) -> bool:
+        """
+        Return whether or not the index is monotonic in the given order, based on the cached
+        index statistics. Always returns False for a multi-index.
+
+        :param order: 'increasing' or 'decreasing'.
+
+        >>> kdf = ks.DataFrame({"a": [1, 2, 3]}, index=[10, 20, 30])
+        >>> kdf._internal.is_index_monotonic("increasing")
+        True
+        >>> kdf._internal.is_index_monotonic("decreasing")
+        False
+        """
+        assert order in ("increasing", "decreasing"), order
+
+        stats = self.index_statistics
+        if stats is None:
+            return False
+        if stats["null_count"].sum() > 0 or not stats[order].all():
+            return False
+
+        mins, maxs = stats["min"].tolist(), stats["max"].tolist()
+        if order == "increasing":
+            return all(prev <= cur for prev, cur in zip(maxs[:-1], mins[1:]))
+        else:
+            return all(prev >= cur for prev, cur in zip(mins[:-1], maxs[1:]))
+
+    @property
+    def key_directory(self) -> Optional["KeyDirectory"]:
+        """
+        Return the key directory built by `DataFrame.koalas.build_index`, or None.
+
+        The directory only describes this very Spark DataFrame, so it is not carried over to
+        the InternalFrames derived from this one.
+        """
+        return self._key_directory
+
+    def with_key_directory(self, key_directory: "KeyDirectory") -> "InternalFrame":
+        """ Copy the immutable InternalFrame with the given key directory attached. """
+        internal = self.copy()
+        internal._key_directory = key_directory
+        return internal
+
+    def with_lazy_default_index(self, spark_frame: spark.DataFrame) -> "InternalFrame":
+        """
+        Copy the immutable InternalFrame with the default index marked lazy, so that the rows
+        filtered and the columns selected by `loc` before the index is used are applied before
+        the default index is attached. See `with_filter_before_default_index`.
+
+        :param spark_frame: the Spark DataFrame read from a data source, which the default
+                            index of this InternalFrame was attached to.
+        :return: the copied InternalFrame.
+        """
+        internal = self.copy()
+        internal._lazy_default_index_frame = spark_frame
+        return internal
+
+    def with_filter_before_default_index(
+        self,
+        pred: Optional[spark.Column],
+        column_labels: List[Tuple],
+        data_spark_columns: Optional[List[spark.Column]],
+        data_dtypes: Optional[List[Dtype]],
+        column_label_names: Optional[List[Optional[Tuple]]],
+    ) -> Optional["InternalFrame"]:
+        """
+        Filter the rows and select the columns on the Spark DataFrame the lazy default index
+        is attached to, and attach the default index again to the rows filtered.
+
+        The default index, e.g., 'sequence', is computed over all the rows of the Spark
+        DataFrame it is attached to, so Spark cannot push the filters over it into the scan.
+        Applying them first lets the scan read only the columns and the rows needed, but the
+        default index is renumbered over the rows filtered.
+
+        :param pred: the predicate to filter, or None.
+        :param column_labels: the column labels to select.
+        :param data_spark_columns: the Spark Columns to select.
+        :param data_dtypes: the dtypes of the columns to select.
+        :param column_label_names: the names of the column index levels.
+        :return: the new InternalFrame, or None if the default index is not lazy, or the
+                 predicate or the columns refer to other than the columns of the Spark
+                 DataFrame the default index is attached to.
+        """
+        sdf = self._lazy_default_index_frame
+        if sdf is None or not data_spark_columns:
+            return None
+
+        try:
+            output = sdf._jdf.queryExecution().analyzed().outputSet()
+            for scol in data_spark_columns:
+                expr = scol._jc.expr()
+                is_attribute = expr.getClass().getSimpleName() == "AttributeReference"
+                if not is_attribute or not output.contains(expr):
+                    return None
+            if pred is not None and not pred._jc.expr().references().subsetOf(output):
+                return None
+        except py4j.protocol.Py4JError:
+            # e.g., the predicate refers to an unresolved column.
+            return None
+
+        if pred is not None:
+            sdf = sdf.filter(pred)
+        sdf = sdf.select(data_spark_columns)
+        if len(set(sdf.columns)) != len(sdf.columns):
+            return None
+
+        internal = InternalFrame(
+            spark_frame=sdf,
+            index_spark_columns=None,
+            column_labels=column_labels,
+            data_dtypes=data_dtypes,
+            column_label_names=column_label_names,
+        )
+        internal._lazy_default_index_frame = sdf
+        return internal
+
     @lazy_property
     def to_internal_spark_frame(self) -> spark.DataFrame:
         """
@@ -950,6 +1263,60 @@ class InternalFrame(object):
 
         return InternalFrame.restore_index(pdf, **self.arguments_for_restore_index)
 
+    def to_pandas_frame_batches(self, batch_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Return as pandas DataFrames of at most `batch_size` rows in order, pulling the partitions
+        into the driver one by one. At least one DataFrame is returned even if it is empty.
+        """
+        sdf = self.to_internal_spark_frame
+        arguments = self.arguments_for_restore_index
+
+        # The dtypes are chosen once so that all the batches have the same dtypes as
+        # `to_pandas_frame`; only the boolean and integral columns which actually contain
+        # missing values use the dtypes which can hold them.
+        nullable_fields = [
+            field
+            for field in sdf.schema
+            if field.nullable and isinstance(field.dataType, (BooleanType, IntegralType))
+        ]
+        if len(nullable_fields) > 0:
+            null_counts = sdf.select(
+                [
+                    F.count(F.when(scol_for(sdf, field.name).isNull(), 1))
+                    for field in nullable_fields
+                ]
+            ).head()
+            has_nulls = {
+                field.name: null_count > 0
+                for field, null_count in zip(nullable_fields, null_counts)
+            }
+        else:
+            has_nulls = {}
+
+        dtypes = {}
+        for field in sdf.schema:
+            if has_nulls.get(field.name, False) and isinstance(field.dataType, BooleanType):
+                dtypes[field.name] = np.dtype("object")
+            elif has_nulls.get(field.name, False) and isinstance(field.dataType, IntegralType):
+                dtypes[field.name] = np.dtype("float64")
+            else:
+                dtypes[field.name] = spark_type_to_pandas_dtype(field.dataType)
+
+        def to_pandas(rows):
+            pdf = pd.DataFrame.from_records(rows, columns=sdf.columns)
+            return InternalFrame.restore_index(pdf.astype(dtypes), **arguments)
+
+        rows = []
+        returned = False
+        for row in sdf.toLocalIterator():
+            rows.append(row)
+            if len(rows) == batch_size:
+                yield to_pandas(rows)
+                rows = []
+                returned = True
+        if len(rows) > 0 or not returned:
+            yield to_pandas(rows)
+
     @lazy_property
     def arguments_for_restore_index(self) -> Dict:
         """ Create arguments for `restore_index`. """
@@ -1186,27 +1553,32 @@ class InternalFrame(object):
                 len(data_dtypes),
             )
 
-        sdf = self.spark_frame
-        if not keep_order:
-            sdf = self.spark_frame.select(self.index_spark_columns + data_spark_columns)
-            index_spark_columns = [scol_for(sdf, col) for col in self.index_spark_column_names]
-            data_spark_columns = [
-                scol_for(sdf, col) for col in self.spark_frame.select(data_spark_columns).columns
-            ]
-        else:
-            index_spark_columns = self.index_spark_columns
-
         if column_label_names is _NoValue:
             column_label_names = self._column_label_names
 
-        return self.copy(
-            spark_frame=sdf,
-            index_spark_columns=index_spark_columns,
-            column_labels=column_labels,
-            data_spark_columns=data_spark_columns,
-            data_dtypes=data_dtypes,
-            column_label_names=column_label_names,
-        )
+        if not keep_order:
+            sdf = self.spark_frame.select(self.index_spark_columns + data_spark_columns)
+            internal = self.copy(
+                spark_frame=sdf,
+                index_spark_columns=[scol_for(sdf, col) for col in self.index_spark_column_names],
+                column_labels=column_labels,
+                data_spark_columns=[
+                    scol_for(sdf, field.name)
+                    for field in self._analyze_spark_columns(data_spark_columns)
+                ],
+                data_dtypes=data_dtypes,
+                column_label_names=column_label_names,
+            )
+            return self._inherit_spark_fields(
+                internal, self.index_spark_columns + data_spark_columns
+            )
+        else:
+            return self.copy(
+                column_labels=column_labels,
+                data_spark_columns=data_spark_columns,
+                data_dtypes=data_dtypes,
+                column_label_names=column_label_names,
+            )
 
     def with_filter(self, pred: Union[spark.Column, "Series"]) -> "InternalFrame":
         """ Copy the immutable InternalFrame with the updates by the predicate.
@@ -1223,7 +1595,11 @@ class InternalFrame(object):
             spark_type = self.spark_frame.select(pred).schema[0].dataType
             assert isinstance(spark_type, BooleanType), spark_type
 
-        return self.with_new_sdf(self.spark_frame.filter(pred).select(self.spark_columns))
+        internal = self.with_new_sdf(self.spark_frame.filter(pred).select(self.spark_columns))
+        # The filter keeps the columns as they are, but Spark may narrow their nullability.
+        return self._inherit_spark_fields(
+            internal, self.index_spark_columns + self.data_spark_columns, exact_nullability=False
+        )
 
     def with_new_spark_column(
         self,
@@ -1296,6 +1672,11 @@ class InternalFrame(object):
                                    If not specified, the original ones are used.
         :return: the copied immutable InternalFrame.
         """
+        # The lazy default index is kept only while the index and the Spark DataFrame are.
+        keeps_index = all(
+            value is _NoValue
+            for value in [spark_frame, index_spark_columns, index_names, index_dtypes]
+        )
         if spark_frame is _NoValue:
             spark_frame = self.spark_frame
         if index_spark_columns is _NoValue:
@@ -1312,7 +1693,7 @@ class InternalFrame(object):
             data_dtypes = self.data_dtypes
         if column_label_names is _NoValue:
             column_label_names = self.column_label_names
-        return InternalFrame(
+        internal = InternalFrame(
             spark_frame=spark_frame,
             index_spark_columns=index_spark_columns,
             index_names=index_names,
@@ -1322,6 +1703,9 @@ class InternalFrame(object):
             data_dtypes=data_dtypes,
             column_label_names=column_label_names,
         )
+        if keeps_index:
+            internal._lazy_default_index_frame = self._lazy_default_index_frame
+        return internal
 
     @staticmethod
     def from_pandas(pdf: pd.DataFrame) -> "InternalFrame":
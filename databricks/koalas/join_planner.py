@@ -0,0 +1,323 @@
+#
+# Copyright (C) 2019 Databricks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+A planner of the joins in `DataFrame.merge`, taking bucketed layouts, size statistics and
+skewed keys into account.
+"""
+from functools import reduce
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from pyspark import sql as spark
+from pyspark.sql import functions as F
+
+from databricks.koalas.utils import default_session, scol_for
+
+
+# The logical plan nodes which keep the partitioning of their child.
+_PARTITIONING_PRESERVING_NODES = ("Project", "Filter", "SubqueryAlias")
+
+# The fraction of the rows sampled to find the skewed keys.
+_SKEW_SAMPLE_FRACTION = 0.1
+
+SALT_COLUMN_NAME = "__skew_salt__"
+
+
+class BucketLayout(object):
+    """
+    The bucketed layout of a Spark DataFrame scanning a bucketed table, such as the tables
+    written by `DataFrame.koalas.bucket_by`.
+
+    The layout is read from the table metadata in the plan, so it is recognized in any
+    DataFrame scanning the table through projections and filters.
+
+    :param num_buckets: the number of buckets.
+    :param expr_ids: the expression ids of the bucket columns in the bucketing order.
+    """
+
+    def __init__(self, num_buckets: int, expr_ids: List[int]):
+        self.num_buckets = num_buckets
+        self._expr_ids = expr_ids
+
+    @staticmethod
+    def of(spark_frame: spark.DataFrame) -> Optional["BucketLayout"]:
+        """ Return the bucketed layout of the given Spark DataFrame, or None. """
+        plan = spark_frame._jdf.queryExecution().analyzed()
+        while plan.getClass().getSimpleName() in _PARTITIONING_PRESERVING_NODES:
+            plan = plan.child()
+        if plan.getClass().getSimpleName() != "LogicalRelation":
+            return None
+        relation = plan.relation()
+        if relation.getClass().getSimpleName() != "HadoopFsRelation":
+            return None
+        bucket_spec = relation.bucketSpec()
+        if not bucket_spec.isDefined():
+            return None
+        bucket_spec = bucket_spec.get()
+
+        output = plan.output()
+        expr_ids = {}
+        for i in range(output.size()):
+            attr = output.apply(i)
+            expr_ids[attr.name()] = attr.exprId().id()
+        bucket_column_names = bucket_spec.bucketColumnNames()
+        bucket_expr_ids = []
+        for i in range(bucket_column_names.size()):
+            name = bucket_column_names.apply(i)
+            if name not in expr_ids:
+                return None
+            bucket_expr_ids.append(expr_ids[name])
+        return BucketLayout(bucket_spec.numBuckets(), bucket_expr_ids)
+
+    def key_order(self, spark_frame: spark.DataFrame, key_names: List[str]) -> Optional[List[int]]:
+        """
+        Return the positions of the join keys in the order of the bucket columns, if the keys
+        are exactly the bucket columns; otherwise, None.
+
+        :param spark_frame: the Spark DataFrame with this layout.
+        :param key_names: the column names of the join keys in `spark_frame`.
+        """
+        expr_ids = [scol_for(spark_frame, name)._jc.expr().exprId().id() for name in key_names]
+        if len(set(expr_ids)) != len(expr_ids) or set(expr_ids) != set(self._expr_ids):
+            return None
+        return [expr_ids.index(expr_id) for expr_id in self._expr_ids]
+
+
+def plan_join(
+    left: spark.DataFrame,
+    left_key_names: List[str],
+    right: spark.DataFrame,
+    right_key_names: List[str],
+    how: str,
+) -> Tuple[
+    Callable[[spark.DataFrame, List[str]], spark.DataFrame],
+    Callable[[spark.DataFrame, List[str]], spark.DataFrame],
+]:
+    """
+    Plan the join of the given Spark DataFrames on the given keys.
+
+    - If a side can be broadcast for the join type and its estimated size is within
+      `spark.sql.autoBroadcastJoinThreshold`, it is broadcast.
+    - Otherwise, if a side has a bucketed layout on the join keys, the other side is
+      repartitioned in the same way unless it already is, so that the bucketed side is not
+      shuffled.
+
+    The sides explicitly broadcast, e.g., by `ks.broadcast`, are left as they are.
+
+    :param left: the left Spark DataFrame.
+    :param left_key_names: the column names of the join keys in `left`.
+    :param right: the right Spark DataFrame.
+    :param right_key_names: the column names of the join keys in `right`.
+    :param how: the join type, one of 'inner', 'left', 'right' and 'full'.
+    :return: the functions to prepare the left and the right sides for the join, which take
+             the Spark DataFrame of the side and the column names of the join keys in it.
+             They can be applied to the Spark DataFrames derived from `left` and `right` by
+             renaming the columns.
+    """
+    keep = lambda sdf, key_names: sdf
+
+    if _is_hinted(left) or _is_hinted(right):
+        return keep, keep
+
+    broadcast = lambda sdf, key_names: F.broadcast(sdf)
+
+    threshold = left.sql_ctx._jsparkSession.sessionState().conf().autoBroadcastJoinThreshold()
+    left_size = _estimated_size(left)
+    right_size = _estimated_size(right)
+    if threshold > 0:
+        left_broadcastable = how in ("inner", "right") and left_size <= threshold
+        right_broadcastable = how in ("inner", "left") and right_size <= threshold
+        if left_broadcastable and (not right_broadcastable or left_size < right_size):
+            return broadcast, keep
+        elif right_broadcastable:
+            return keep, broadcast
+
+    left_bucketing = _bucketing_on(left, left_key_names)
+    right_bucketing = _bucketing_on(right, right_key_names)
+
+    def repartition_like(bucketing):
+        num_buckets, order = bucketing
+        return lambda sdf, key_names: sdf.repartition(
+            num_buckets, *[scol_for(sdf, key_names[i]) for i in order]
+        )
+
+    if left_bucketing is not None and right_bucketing is not None:
+        if left_bucketing == right_bucketing:
+            return keep, keep
+        elif left_size >= right_size:
+            return keep, repartition_like(left_bucketing)
+        else:
+            return repartition_like(right_bucketing), keep
+    elif left_bucketing is not None:
+        return keep, repartition_like(left_bucketing)
+    elif right_bucketing is not None:
+        return repartition_like(right_bucketing), keep
+    else:
+        return keep, keep
+
+
+def _bucketing_on(
+    spark_frame: spark.DataFrame, key_names: List[str]
+) -> Optional[Tuple[int, List[int]]]:
+    """
+    Return the number of buckets and the positions of the keys in the order of the bucket
+    columns if the Spark DataFrame is bucketed exactly by the given keys; otherwise, None.
+    """
+    layout = BucketLayout.of(spark_frame)
+    if layout is None:
+        return None
+    order = layout.key_order(spark_frame, key_names)
+    if order is None:
+        return None
+    return layout.num_buckets, order
+
+
+def skew_join(
+    left: spark.DataFrame,
+    left_keys: List[spark.Column],
+    right: spark.DataFrame,
+    right_keys: List[spark.Column],
+    how: str,
+    skew: Union[str, List[Any]],
+    exprs: List[spark.Column],
+) -> spark.DataFrame:
+    """
+    Join the given Spark DataFrames on the given keys, spreading the rows of the skewed keys
+    over many tasks, and select the given expressions.
+
+    The skewed keys are salted on the larger side, and the rows of the skewed keys on the other
+    side are replicated for each salt. When the other side is preserved by the join type,
+    its rows of the skewed keys absent from the larger side are found by an anti join with
+    the distinct keys of the larger side. The join of the skewed keys is unioned with the join
+    of the rest. The result is the same as the plain join for any join type.
+
+    If either side is broadcast, the skew does not matter and the plain join is performed.
+
+    :param left: the left Spark DataFrame.
+    :param left_keys: the join keys in `left`.
+    :param right: the right Spark DataFrame.
+    :param right_keys: the join keys in `right`.
+    :param how: the join type, one of 'inner', 'left', 'right' and 'full'.
+    :param skew: 'auto' to find the skewed keys from a sample of the larger side with
+                 the frequent items sketch, or the list of the skewed keys; tuples for
+                 multiple join keys.
+    :param exprs: the expressions to select from the joined Spark DataFrame.
+    :return: the selected Spark DataFrame.
+    """
+    join_condition = reduce(
+        lambda x, y: x & y, [lkey == rkey for lkey, rkey in zip(left_keys, right_keys)]
+    )
+    joined = left.join(right, join_condition, how=how).select(*exprs)
+
+    if _is_hinted(left) or _is_hinted(right):
+        return joined
+
+    if _estimated_size(left) >= _estimated_size(right):
+        large, large_keys, small, small_keys = left, left_keys, right, right_keys
+    else:
+        large, large_keys, small, small_keys = right, right_keys, left, left_keys
+
+    if skew == "auto":
+        skewed_keys = _frequent_keys(large, large_keys)
+    else:
+        skewed_keys = [key if isinstance(key, tuple) else (key,) for key in skew]
+        if any(len(key) != len(large_keys) for key in skewed_keys):
+            raise ValueError("The skewed keys should match with the number of join keys.")
+    # Null keys never match with any key.
+    skewed_keys = [key for key in skewed_keys if all(k is not None for k in key)]
+    if len(skewed_keys) == 0:
+        return joined
+
+    def is_skewed(keys):
+        return F.coalesce(
+            reduce(
+                lambda x, y: x | y,
+                [
+                    reduce(lambda x, y: x & y, [k == F.lit(v) for k, v in zip(keys, key)])
+                    for key in skewed_keys
+                ],
+            ),
+            F.lit(False),
+        )
+
+    large_side, small_side = ("left", "right") if large is left else ("right", "left")
+    large_preserved = how in (large_side, "full")
+    small_preserved = how in (small_side, "full")
+
+    num_salts = int(default_session().conf.get("spark.sql.shuffle.partitions"))  # type: ignore
+    large_skewed = large.filter(is_skewed(large_keys))
+    small_skewed = small.filter(is_skewed(small_keys))
+    salted = large_skewed.withColumn(
+        SALT_COLUMN_NAME, F.pmod(F.monotonically_increasing_id(), F.lit(num_salts))
+    )
+    replicated = small_skewed.withColumn(
+        SALT_COLUMN_NAME, F.explode(F.array(*[F.lit(i) for i in range(num_salts)]))
+    )
+    salted_condition = join_condition & (
+        scol_for(salted, SALT_COLUMN_NAME) == scol_for(replicated, SALT_COLUMN_NAME)
+    )
+    # A replica of the other side missing the rows of some salts is not unmatched; only
+    # the large side is kept when not matched.
+    salted_how = large_side if large_preserved else "inner"
+    if large is left:
+        skewed_joined = salted.join(replicated, salted_condition, how=salted_how)
+    else:
+        skewed_joined = replicated.join(salted, salted_condition, how=salted_how)
+    skewed_joined = skewed_joined.select(*exprs)
+
+    if small_preserved:
+        # The rows of the other side are not matched only if their keys are absent from the
+        # large side. They are padded once by the join with an empty large side.
+        large_key_values = large_skewed.select(*large_keys).distinct()
+        unmatched = small_skewed.join(large_key_values, join_condition, how="left_anti")
+        empty = large_skewed.filter(F.lit(False))
+        if large is left:
+            padded = empty.join(unmatched, join_condition, how="right")
+        else:
+            padded = unmatched.join(empty, join_condition, how="left")
+        skewed_joined = skewed_joined.union(padded.select(*exprs))
+
+    left_rest = left.filter(~is_skewed(left_keys))
+    right_rest = right.filter(~is_skewed(right_keys))
+    return left_rest.join(right_rest, join_condition, how=how).select(*exprs).union(skewed_joined)
+
+
+def _frequent_keys(spark_frame: spark.DataFrame, keys: List[spark.Column]) -> List[Tuple]:
+    """
+    Find the keys which may be more frequent than a shuffle partition can hold evenly,
+    from a sample of the Spark DataFrame with the frequent items sketch. The result can
+    include some keys which are not frequent.
+    """
+    num_partitions = int(default_session().conf.get("spark.sql.shuffle.partitions"))  # type: ignore
+    support = max(1.0 / num_partitions, 1e-4)
+    key_column = "__skew_key__"
+    sdf = spark_frame.select(F.struct(*keys).alias(key_column)).sample(
+        withReplacement=False, fraction=_SKEW_SAMPLE_FRACTION, seed=0
+    )
+    items = sdf.stat.freqItems([key_column], support=support).head()[0]
+    return [tuple(item) for item in items]
+
+
+def _estimated_size(spark_frame: spark.DataFrame) -> int:
+    """ Return the size in bytes of the Spark DataFrame estimated by the optimizer. """
+    return int(spark_frame._jdf.queryExecution().optimizedPlan().stats().sizeInBytes().toString())
+
+
+def _is_hinted(spark_frame: spark.DataFrame) -> bool:
+    """ Check if the Spark DataFrame has a join hint such as broadcast. """
+    plan = spark_frame._jdf.queryExecution().analyzed()
+    while plan.getClass().getSimpleName() in _PARTITIONING_PRESERVING_NODES:
+        plan = plan.child()
+    return plan.getClass().getSimpleName() == "ResolvedHint"
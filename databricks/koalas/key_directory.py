@@ -0,0 +1,215 @@
+#
+# Copyright (C) 2019 Databricks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+A driver-side directory from index keys to the partitions holding them, used for point lookups.
+"""
+from collections import deque
+import datetime
+from functools import reduce
+from typing import Any, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+from pyspark import sql as spark
+from pyspark.sql import functions as F
+from pyspark.sql.types import (
+    BooleanType,
+    DataType,
+    DateType,
+    DoubleType,
+    FloatType,
+    NumericType,
+    StringType,
+    TimestampType,
+)
+
+from databricks.koalas.utils import default_session
+
+if TYPE_CHECKING:
+    from databricks.koalas.internal import InternalFrame
+
+
+class KeyDirectory(object):
+    """
+    The sparse key directory built by `DataFrame.koalas.build_index`.
+
+    The indexed Spark DataFrame is either hash-partitioned ('hash') or range-partitioned
+    ('sorted') by the index, sorted within each partition, and checkpointed, so its partitions
+    are stable. The directory keeps the smallest and the largest key of each non-empty
+    partition, which is enough to tell which partitions can hold a key without scanning the
+    others.
+
+    :param kind: 'hash' or 'sorted'.
+    :param index_spark_types: the Spark types of the index columns.
+    :param num_partitions: the number of hash partitions, or None if the key cannot be hashed
+                           to its partition.
+    :param bounds: list of tuples of the partition id, the smallest key and the largest key,
+                   ordered by the partition id.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        index_spark_types: List[DataType],
+        num_partitions: Optional[int],
+        bounds: List[Tuple[int, Tuple, Tuple]],
+    ):
+        assert kind in ("hash", "sorted"), kind
+        self._kind = kind
+        self._index_spark_types = index_spark_types
+        self._num_partitions = num_partitions
+        self._bounds = bounds
+
+    @staticmethod
+    def build(internal: "InternalFrame", kind: str, num_partitions: int) -> "KeyDirectory":
+        """
+        Build the directory of the given InternalFrame, which must already be laid out by
+        `DataFrame.koalas.build_index`. This runs a single aggregation job.
+        """
+        index_spark_types = [internal.spark_type_for(scol) for scol in internal.index_spark_columns]
+        key = F.struct(*internal.index_spark_columns)
+        sdf = internal.spark_frame.select(
+            F.spark_partition_id().alias("__partition_id"), key.alias("__key")
+        )
+        rows = sdf.groupby("__partition_id").agg(F.min("__key"), F.max("__key")).collect()
+        bounds = sorted((row[0], tuple(row[1]), tuple(row[2])) for row in rows)
+
+        # Only trust the hash layout if Spark kept the requested number of partitions.
+        if kind != "hash" or internal.spark_frame.rdd.getNumPartitions() != num_partitions:
+            num_partitions = None  # type: ignore
+
+        return KeyDirectory(kind, index_spark_types, num_partitions, bounds)
+
+    def partitions_for(self, key: Tuple) -> Optional[List[int]]:
+        """
+        Return the ids of the partitions which can hold the given key or key prefix,
+        or None if the directory cannot tell.
+        """
+        if len(key) > len(self._index_spark_types) or any(value is None for value in key):
+            return None
+
+        if (
+            self._num_partitions is not None
+            and len(key) == len(self._index_spark_types)
+            and all(
+                _is_hashable_as(value, spark_type)
+                for value, spark_type in zip(key, self._index_spark_types)
+            )
+        ):
+            # Evaluate the same hash expression Spark uses to hash-partition the rows.
+            scols = [
+                F.lit(value).cast(spark_type)
+                for value, spark_type in zip(key, self._index_spark_types)
+            ]
+            hash_value = F.hash(*scols)._jc.expr().eval(None)
+            return [hash_value % self._num_partitions]
+
+        partitions = []
+        for partition_id, lower, upper in self._bounds:
+            try:
+                if not (lower[: len(key)] <= key <= upper[: len(key)]):
+                    continue
+            except TypeError:
+                # Not comparable here; let Spark compare.
+                pass
+            partitions.append(partition_id)
+        return partitions
+
+    def lookup(self, internal: "InternalFrame", key: Tuple) -> Optional["InternalFrame"]:
+        """
+        Return the InternalFrame of the rows whose index starts with the given key, read only
+        from the partitions which can hold it, or None if the directory cannot prune any
+        partition.
+        """
+        partitions = self.partitions_for(key)
+        if partitions is None or len(partitions) == len(self._bounds):
+            return None
+
+        cond = reduce(
+            lambda x, y: x & y,
+            [scol == value for scol, value in zip(internal.index_spark_columns, key)],
+        )
+        sdf = _prune_partitions(internal.spark_frame.filter(cond), partitions)
+        return internal.with_new_sdf(sdf)
+
+    def asof(self, internal: "InternalFrame", spark_column: spark.Column, where: Any) -> Any:
+        """
+        Return the last non-null value of the given column whose index is not greater than
+        `where`, reading the partitions backwards from the one which can hold `where`.
+        Return None if the directory cannot answer, and NaN if there is no such value.
+        """
+        if self._kind != "sorted" or len(self._index_spark_types) != 1 or where is None:
+            return None
+
+        partitions = []
+        for partition_id, lower, _ in self._bounds:
+            try:
+                if not (lower[0] <= where):
+                    break
+            except TypeError:
+                return None
+            partitions.append(partition_id)
+
+        index_scol = internal.index_spark_columns[0]
+        cond = (index_scol <= F.lit(where).cast(self._index_spark_types[0])) & (
+            spark_column.isNotNull()
+        )
+        spark_type = internal.spark_frame.select(spark_column).schema[0].dataType
+        if isinstance(spark_type, (FloatType, DoubleType)):
+            cond = cond & ~F.isnan(spark_column)
+        sdf = internal.spark_frame.filter(cond).select(spark_column)
+
+        for partition_id in reversed(partitions):
+            rows = _run_on_partitions(sdf, lambda it: deque(it, maxlen=1), [partition_id])
+            if len(rows) > 0:
+                return rows[0][0]
+        return np.nan
+
+
+def _run_on_partitions(sdf: spark.DataFrame, func, partitions: List[int]) -> List:
+    """ Run `func` over the rows of the given partitions only, and return the results. """
+    return default_session().sparkContext.runJob(sdf.rdd, func, partitions)
+
+
+def _prune_partitions(sdf: spark.DataFrame, partitions: List[int]) -> spark.DataFrame:
+    """
+    Return the Spark DataFrame of the rows of the given partitions only. The rows stay
+    distributed: the other partitions are dropped from the RDD before any task is scheduled.
+    """
+    sql_ctx = sdf.sql_ctx
+    jvm = sql_ctx._jvm
+    # A Scala Set of the partition ids is the `Int => Boolean` filter PartitionPruningRDD takes.
+    partition_filter = jvm.PythonUtils.toSeq(partitions).toSet()
+    rdd = jvm.org.apache.spark.rdd.PartitionPruningRDD.create(
+        sdf._jdf.queryExecution().toRdd(), partition_filter
+    )
+    jdf = sql_ctx.sparkSession._jsparkSession.internalCreateDataFrame(rdd, sdf._jdf.schema(), False)
+    return spark.DataFrame(jdf, sql_ctx)
+
+
+def _is_hashable_as(value: Any, spark_type: DataType) -> bool:
+    """ Whether the Python value casts to the Spark type the same way Spark compares them. """
+    if isinstance(spark_type, StringType):
+        return isinstance(value, str)
+    elif isinstance(spark_type, BooleanType):
+        return isinstance(value, bool)
+    elif isinstance(spark_type, NumericType):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    elif isinstance(spark_type, TimestampType):
+        return isinstance(value, datetime.datetime)
+    elif isinstance(spark_type, DateType):
+        return isinstance(value, datetime.date) and not isinstance(value, datetime.datetime)
+    else:
+        return False
@@ -17,58 +17,73 @@
 """
 Wrappers around spark that correspond to common pandas functions.
 """
-from typing import Any, Optional, Union, List, Tuple, Sized, cast
+from typing import Any, Dict, Optional, Union, List, Tuple, Sized, cast
 from collections import OrderedDict
 from collections.abc import Iterable
 from distutils.version import LooseVersion
 from functools import reduce
+import datetime
+import decimal
+import hashlib
 from io import BytesIO
 import json
+import math
+import re
+from urllib.parse import unquote, urlparse
 
 import numpy as np
 import pandas as pd
-from pandas.api.types import is_datetime64_dtype, is_datetime64tz_dtype, is_list_like
-import pyarrow as pa
-import pyarrow.parquet as pq
+from pandas.api.types import (
+    is_datetime64_dtype,
+    is_datetime64tz_dtype,
+    is_list_like,
+    pandas_dtype,
+)
 import pyspark
-from pyspark import sql as spark
-from pyspark.sql import functions as F
-from pyspark.sql.functions import pandas_udf, PandasUDFType
+from pyspark import sql as spark, StorageLevel
+from pyspark.sql import functions as F, Window
 from pyspark.sql.types import (
-    ByteType,
-    ShortType,
+    ArrayType,
+    DoubleType,
+    DataType,
     IntegerType,
     LongType,
-    FloatType,
-    DoubleType,
-    BooleanType,
     TimestampType,
-    DecimalType,
-    StringType,
     DateType,
+    NumericType,
+    StringType,
+    StructField,
     StructType,
 )
 
 from databricks import koalas as ks  # noqa: F401
 from databricks.koalas.base import IndexOpsMixin
+from databricks.koalas.config import get_option
+from databricks.koalas.dummies import DummyEncoder
 from databricks.koalas.utils import (
     align_diff_frames,
+    combine_frames_on_index,
     default_session,
     is_name_like_tuple,
+    is_name_like_value,
     name_like_string,
     same_anchor,
     scol_for,
     validate_axis,
+    verify_temp_column_name,
 )
-from databricks.koalas.frame import DataFrame, _reduce_spark_multi
+from databricks.koalas.frame import DataFrame
 from databricks.koalas.internal import (
     InternalFrame,
     DEFAULT_SERIES_NAME,
     HIDDEN_COLUMNS,
+    NATURAL_ORDER_COLUMN_NAME,
+    SPARK_INDEX_NAME_FORMAT,
 )
 from databricks.koalas.series import Series, first_series
 from databricks.koalas.spark.utils import as_nullable_spark_type, force_decimal_precision_scale
 from databricks.koalas.indexes import Index, DatetimeIndex
+from databricks.koalas.typedef import as_spark_type
 
 
 __all__ = [
@@ -76,6 +91,7 @@ __all__ = [
     "range",
     "read_csv",
     "read_delta",
+    "read_delta_changes",
     "read_table",
     "read_spark_io",
     "read_parquet",
@@ -96,6 +112,7 @@ __all__ = [
     "read_sql",
     "read_json",
     "merge",
+    "merge_asof",
     "to_numeric",
     "broadcast",
     "read_orc",
@@ -200,6 +217,9 @@ def read_csv(
     quotechar=None,
     escapechar=None,
     comment=None,
+    infer_schema=True,
+    sampling_ratio=0.1,
+    schema_cache=None,
     **options
 ) -> Union[DataFrame, Series]:
     """Read CSV (comma-separated) file into DataFrame or Series.
@@ -241,10 +261,13 @@ def read_csv(
     dtype : Type name or dict of column -> type, default None
         Data type for data or columns. E.g. {‘a’: np.float64, ‘b’: np.int32} Use str or object
         together with suitable na_values settings to preserve and not interpret dtype.
+        The types which Spark can read are set in the schema to read the file with, and
+        the schema is not inferred if all the columns are specified.
     nrows : int, default None
         Number of rows to read from the CSV file.
     parse_dates : boolean or list of ints or names or list of lists or dict, default `False`.
-        Currently only `False` is allowed.
+        Currently only `False` or a list of ints or names is allowed. The columns are
+        read as timestamps.
     quotechar : str (length 1), optional
         The character used to denote the start and end of a quoted item. Quoted items can include
         the delimiter and it will be ignored.
@@ -252,6 +275,15 @@ def read_csv(
         One-character string used to escape delimiter
     comment: str, optional
         Indicates the line should not be parsed.
+    infer_schema : bool or 'sample', default True
+        Whether to infer the types of the columns from all the rows, from the rows sampled
+        with `sampling_ratio`, or not at all to read them as strings.
+    sampling_ratio : float, default 0.1
+        The fraction of the rows to infer the schema from, if `infer_schema` is 'sample'.
+    schema_cache : str, optional
+        The directory to persist the inferred schema in, in any file system Spark can access.
+        The schema is reused while the files matched by the path have the same sizes and
+        modification times, and the options are the same.
     options : dict
         All other options passed directly into Spark's data source.
 
@@ -272,58 +304,112 @@ def read_csv(
 
     if mangle_dupe_cols is not True:
         raise ValueError("mangle_dupe_cols can only be `True`: %s" % mangle_dupe_cols)
-    if parse_dates is not False:
-        raise ValueError("parse_dates can only be `False`: %s" % parse_dates)
+    if parse_dates is not False and not (
+        is_list_like(parse_dates) and all(isinstance(col, (int, str)) for col in parse_dates)
+    ):
+        raise ValueError(
+            "parse_dates can only be `False` or a list of ints or names: %s" % parse_dates
+        )
+    if infer_schema not in (True, False, "sample"):
+        raise ValueError("infer_schema should be one of True, False and 'sample'.")
 
     if usecols is not None and not callable(usecols):
         usecols = list(usecols)
 
+    astype_dtypes = OrderedDict()  # type: Dict[Any, Any]
     if usecols is None or callable(usecols) or len(usecols) > 0:
-        reader = default_session().read
-        reader.option("inferSchema", True)
-        reader.option("sep", sep)
+        reader_options = {"sep": sep}  # type: Dict[str, Any]
 
         if header == "infer":
             header = 0 if names is None else None
         if header == 0:
-            reader.option("header", True)
+            reader_options["header"] = True
         elif header is None:
-            reader.option("header", False)
+            reader_options["header"] = False
         else:
             raise ValueError("Unknown header argument {}".format(header))
 
         if quotechar is not None:
-            reader.option("quote", quotechar)
+            reader_options["quote"] = quotechar
         if escapechar is not None:
-            reader.option("escape", escapechar)
+            reader_options["escape"] = escapechar
 
         if comment is not None:
             if not isinstance(comment, str) or len(comment) != 1:
                 raise ValueError("Only length-1 comment characters supported")
-            reader.option("comment", comment)
+            reader_options["comment"] = comment
 
-        reader.options(**options)
+        reader_options.update(options)
+        reader = default_session().read.options(**reader_options)
 
-        if isinstance(names, str):
-            sdf = reader.schema(names).csv(path)
-            column_labels = OrderedDict((col, col) for col in sdf.columns)
-        else:
-            sdf = reader.csv(path)
+        def labels_of(schema):
             if is_list_like(names):
-                names = list(names)
                 if len(set(names)) != len(names):
                     raise ValueError("Found non-unique column index")
-                if len(names) != len(sdf.columns):
+                if len(names) != len(schema.names):
                     raise ValueError(
                         "The number of names [%s] does not match the number "
                         "of columns [%d]. Try names by a Spark SQL DDL-formatted "
-                        "string." % (len(sdf.schema), len(names))
+                        "string." % (len(schema.names), len(names))
                     )
-                column_labels = OrderedDict(zip(names, sdf.columns))
+                return OrderedDict(zip(names, schema.names))
             elif header is None:
-                column_labels = OrderedDict(enumerate(sdf.columns))
+                return OrderedDict(enumerate(schema.names))
             else:
-                column_labels = OrderedDict((col, col) for col in sdf.columns)
+                return OrderedDict((col, col) for col in schema.names)
+
+        if isinstance(names, str):
+            sdf = reader.schema(names).csv(path)
+            column_labels = OrderedDict((col, col) for col in sdf.columns)
+            if isinstance(dtype, dict):
+                astype_dtypes.update(dtype)
+            elif dtype is not None:
+                astype_dtypes.update((col, dtype) for col in column_labels)
+        else:
+            if is_list_like(names):
+                names = list(names)
+
+            # Reading the columns as strings only reads the header.
+            schema = _infer_spark_schema(path, "csv", dict(reader_options, inferSchema=False))
+            column_labels = labels_of(schema)
+            if dtype is not None:
+                dtypes = (
+                    dtype
+                    if isinstance(dtype, dict)
+                    else OrderedDict((label, dtype) for label in column_labels)
+                )
+            else:
+                dtypes = {}
+            if infer_schema is not False and not all(label in dtypes for label in column_labels):
+                inference_options = dict(reader_options, inferSchema=True)
+                if infer_schema == "sample":
+                    inference_options["samplingRatio"] = sampling_ratio
+                schema = _infer_spark_schema(path, "csv", inference_options, schema_cache)
+                column_labels = labels_of(schema)
+
+            # Read the columns with the types specified by `dtype` and `parse_dates`.
+            spark_types = {}  # type: Dict[str, DataType]
+            for label, tpe in dtypes.items():
+                if label not in column_labels:
+                    raise KeyError(label)
+                spark_type = _as_read_spark_type(tpe)
+                if spark_type is None:
+                    astype_dtypes[label] = tpe
+                else:
+                    spark_types[column_labels[label]] = spark_type
+            if parse_dates is not False:
+                for col in parse_dates:
+                    label = list(column_labels)[col] if isinstance(col, int) else col
+                    if label not in column_labels:
+                        raise KeyError(col)
+                    spark_types[column_labels[label]] = TimestampType()
+            schema = StructType(
+                [
+                    StructField(field.name, spark_types.get(field.name, field.dataType))
+                    for field in schema.fields
+                ]
+            )
+            sdf = reader.schema(schema).csv(path)
 
         if usecols is not None:
             if callable(usecols):
@@ -398,13 +484,9 @@ def read_csv(
         )
     )  # type: DataFrame
 
-    if dtype is not None:
-        if isinstance(dtype, dict):
-            for col, tpe in dtype.items():
-                kdf[col] = kdf[col].astype(tpe)
-        else:
-            for col in kdf.columns:
-                kdf[col] = kdf[col].astype(dtype)
+    for col, tpe in astype_dtypes.items():
+        if col in kdf.columns:
+            kdf[col] = kdf[col].astype(tpe)
 
     if squeeze and len(kdf.columns) == 1:
         return first_series(kdf)
@@ -413,7 +495,14 @@ def read_csv(
 
 
 def read_json(
-    path: str, lines: bool = True, index_col: Optional[Union[str, List[str]]] = None, **options
+    path: str,
+    lines: bool = True,
+    index_col: Optional[Union[str, List[str]]] = None,
+    infer_schema: Union[bool, str] = True,
+    sampling_ratio: float = 0.1,
+    schema_cache: Optional[str] = None,
+    split_size: Optional[int] = None,
+    **options
 ) -> DataFrame:
     """
     Convert a JSON string to DataFrame.
@@ -423,9 +512,24 @@ def read_json(
     path : string
         File path
     lines : bool, default True
-        Read the file as a json object per line. It should be always True for now.
+        Read the file as a json object per line. If False, each file is read as a JSON
+        array, and each element of the top-level array becomes a row.
     index_col : str or list of str, optional, default: None
         Index column of table in Spark.
+    infer_schema : bool or 'sample', default True
+        Whether to infer the types of the fields from all the rows, from the rows sampled
+        with `sampling_ratio`, or to read the primitive values as strings.
+    sampling_ratio : float, default 0.1
+        The fraction of the rows to infer the schema from, if `infer_schema` is 'sample'.
+    schema_cache : str, optional
+        The directory to persist the inferred schema in, in any file system Spark can access.
+        The schema is reused while the files matched by the path have the same sizes and
+        modification times, and the options are the same.
+    split_size : int, optional
+        The size in bytes of the byte ranges to split each file into, if `lines` is False.
+        The top-level array elements are tokenized in the byte ranges in parallel, so that
+        a large JSON array is not parsed in a single task. By default, each file is parsed
+        in a single task.
     options : dict
         All other options passed directly into Spark's data source.
 
@@ -460,14 +564,314 @@ def read_json(
     index
     0         a     b
     1         c     d
+
+    A JSON array can be read in parallel byte ranges.
+
+    >>> with open(r'%s/read_json/array.json' % path, 'w') as f:
+    ...     _ = f.write('[{"a": 1, "b": [1, 2]}, {"a": 2, "b": []}, {"a": 3, "b": [3]}]')
+    >>> ks.read_json(r'%s/read_json/array.json' % path, lines=False, split_size=16)
+       a       b
+    0  1  [1, 2]
+    1  2      []
+    2  3     [3]
     """
     if "options" in options and isinstance(options.get("options"), dict) and len(options) == 1:
         options = options.get("options")  # type: ignore
 
+    if infer_schema not in (True, False, "sample"):
+        raise ValueError("infer_schema should be one of True, False and 'sample'.")
+
+    if split_size is not None:
+        if lines:
+            raise ValueError("split_size is only supported with lines=False.")
+        if not isinstance(split_size, int) or split_size <= 0:
+            raise ValueError("split_size must be a positive integer.")
+        if schema_cache is not None:
+            raise ValueError("schema_cache is not supported with split_size.")
+        if infer_schema is False:
+            options["primitivesAsString"] = True
+        elif infer_schema == "sample":
+            options["samplingRatio"] = sampling_ratio
+        sdf = _read_json_array(path, split_size, options)
+        index_spark_columns, index_names = _get_index_map(sdf, index_col)
+        return DataFrame(
+            InternalFrame(
+                spark_frame=sdf, index_spark_columns=index_spark_columns, index_names=index_names
+            )
+        )
+
     if not lines:
-        raise NotImplementedError("lines=False is not implemented yet.")
+        options["multiLine"] = True
+
+    if infer_schema is True and schema_cache is None:
+        return read_spark_io(path, format="json", index_col=index_col, **options)
+
+    inference_options = dict(options)
+    if infer_schema is False:
+        inference_options["primitivesAsString"] = True
+    elif infer_schema == "sample":
+        inference_options["samplingRatio"] = sampling_ratio
+    schema = _infer_spark_schema(path, "json", inference_options, schema_cache)
+    return read_spark_io(path, format="json", schema=schema, index_col=index_col, **options)
+
+
+# The tokens changing the state of the JSON tokenizer: escaped characters, quotes and brackets.
+_JSON_TOKEN = re.compile(r'\\.|["\[\]{}]', re.S)
+
+
+def _json_transition(text: str, in_string: bool, depth: int) -> Tuple[bool, int]:
+    """
+    Return whether the JSON text ends in a string, and the depth of the brackets at its end,
+    given the state at its start.
+    """
+    for m in _JSON_TOKEN.finditer(text):
+        token = m.group()
+        if in_string:
+            if token == '"':
+                in_string = False
+        elif token == '"':
+            in_string = True
+        elif token in "[{":
+            depth += 1
+        elif token in "]}":
+            depth -= 1
+    return in_string, depth
+
+
+def _json_array_part(text: str, in_string: bool, depth: int) -> str:
+    """
+    Return the part of the JSON text inside the top-level array, given the state at its start.
+    """
+    start = 0 if depth > 0 else len(text)
+    for m in _JSON_TOKEN.finditer(text):
+        token = m.group()
+        if in_string:
+            if token == '"':
+                in_string = False
+        elif token == '"':
+            in_string = True
+        elif token in "[{":
+            depth += 1
+            if depth == 1:
+                start = m.end()
+        elif token in "]}":
+            depth -= 1
+            if depth == 0:
+                return text[start : m.start()]
+    return text[start:]
+
+
+def _read_json_array(path: str, split_size: int, options: Dict[str, Any]) -> spark.DataFrame:
+    """
+    Read the files of JSON arrays, splitting each file into byte ranges read in parallel.
+
+    The files are read as the records delimited by commas with their byte offsets, by Hadoop's
+    TextInputFormat, in the byte ranges of `split_size` bytes. A comma is a boundary of
+    the top-level array elements only if it is outside of strings at the depth 1, which depends
+    on all the text before it, so the elements are found in three passes over the records:
+
+    1. Each range computes how it changes the state, i.e., whether in a string and the depth,
+       for both states at its start: in a string or not.
+    2. The driver chains the changes to get the state at the start of each range, and each
+       range finds the offset of the last element starting in it.
+    3. Each record is keyed by the offset of the element it belongs to, and the records are
+       grouped and concatenated into the elements in the order of the offsets.
+
+    Since a comma can not be escaped in valid JSON, no record ends in the middle of an escape.
+
+    :param path: the path of the files, which can be a glob pattern or a directory.
+    :param split_size: the size in bytes of the byte ranges.
+    :param options: the options of the JSON data source to parse the elements with.
+    :return: the Spark DataFrame of the elements.
+    """
+    spark_session = default_session()
+    sc = spark_session.sparkContext
+    jvm = sc._jvm
+    conf = spark_session._jsc.hadoopConfiguration()
+    jpath = jvm.org.apache.hadoop.fs.Path(path)
+    fs = jpath.getFileSystem(conf)
+    files = []
+    for status in fs.globStatus(jpath) or []:
+        if status.isFile():
+            files.append(status.getPath().toString())
+        else:
+            iterator = fs.listFiles(status.getPath(), True)
+            while iterator.hasNext():
+                file_path = iterator.next().getPath()
+                if not file_path.getName().startswith(("_", ".")):
+                    files.append(file_path.toString())
+    if len(files) == 0:
+        raise ValueError("Path does not exist: {}".format(path))
+    files = sorted(files)
+
+    hadoop_conf = {
+        "textinputformat.record.delimiter": ",",
+        "mapreduce.input.fileinputformat.split.maxsize": str(split_size),
+    }
+    records = sc.union(
+        [
+            sc.newAPIHadoopFile(
+                file,
+                "org.apache.hadoop.mapreduce.lib.input.TextInputFormat",
+                "org.apache.hadoop.io.LongWritable",
+                "org.apache.hadoop.io.Text",
+                conf=hadoop_conf,
+            ).map(lambda kv, i=i: (i, kv[0], kv[1]))
+            for i, file in enumerate(files)
+        ]
+    ).persist(StorageLevel.MEMORY_AND_DISK)
+
+    try:
+        # 1. The changes of the state by each range, for the start in a string or not.
+        def transitions(iterator):
+            file = None
+            changes = [(False, 0), (True, 0)]
+            for file, _, text in iterator:
+                changes = [_json_transition(text, s, d) for s, d in changes]
+            yield file, changes
+
+        starts = []  # type: List[Optional[Tuple[bool, int]]]
+        file, state = None, (False, 0)
+        for range_file, changes in records.mapPartitions(transitions).collect():
+            if range_file is None:
+                starts.append(None)
+                continue
+            if range_file != file:
+                file, state = range_file, (False, 0)
+            starts.append(state)
+            in_string, depth = changes[int(state[0])]
+            state = (in_string, state[1] + depth)
+
+        def walk(index, iterator):
+            state = starts[index]
+            for file, offset, text in iterator:
+                # The records after a comma at the top level start the elements.
+                is_start = offset == 0 or state == (False, 1)
+                yield file, offset, text, state, is_start
+                state = _json_transition(text, state[0], state[1])
+
+        # 2. The offset of the last element starting in each range.
+        def last_starts(index, iterator):
+            file, last_start = None, None
+            for file, offset, _, _, is_start in walk(index, iterator):
+                if is_start:
+                    last_start = offset
+            yield file, last_start
+
+        carries = []  # type: List[Optional[int]]
+        file, carry = None, None
+        for range_file, last_start in records.mapPartitionsWithIndex(last_starts).collect():
+            if range_file is not None and range_file != file:
+                file, carry = range_file, None
+            carries.append(carry)
+            if last_start is not None:
+                carry = last_start
+
+        # 3. The elements concatenated from the records in order.
+        def keyed(index, iterator):
+            element = carries[index]
+            for file, offset, text, state, is_start in walk(index, iterator):
+                if is_start:
+                    element = offset
+                yield (file, element), (offset, _json_array_part(text, state[0], state[1]))
+
+        elements = (
+            records.mapPartitionsWithIndex(keyed)
+            .groupByKey()
+            .map(lambda kv: (kv[0], ",".join(part for _, part in sorted(kv[1]))))
+            .filter(lambda kv: len(kv[1].strip()) > 0)
+            .sortByKey()
+            .values()
+        )
+        sdf = spark_session.read.options(**options).json(elements)
+        return sdf.localCheckpoint(eager=True)
+    finally:
+        records.unpersist()
+
+
+# The schemas inferred from the files, keyed by the digest of the data source format, the
+# options, the path, and the paths, sizes and modification times of the files.
+_INFERRED_SCHEMAS = {}  # type: Dict[str, StructType]
+
+
+def _infer_spark_schema(
+    path: str, format: str, options: Dict[str, Any], schema_cache: Optional[str] = None
+) -> StructType:
+    """
+    Infer the schema of the files with the given data source format and options.
+
+    If `schema_cache` is specified, the schema is cached in memory and persisted in the
+    directory as a JSON file named by the digest of the format, the options, the path, and
+    the paths, sizes and modification times of the files matched by the path, so that it is
+    reused while the files are unchanged.
+
+    :param path: the path of the files, which can be a glob pattern.
+    :param format: the data source format.
+    :param options: the options of the data source.
+    :param schema_cache: the directory to persist the schema in, in any file system Spark
+                         can access.
+    :return: the schema inferred or cached.
+    """
+    spark_session = default_session()
+    if schema_cache is None:
+        return spark_session.read.format(format).options(**options).load(path).schema
+
+    jvm = spark_session.sparkContext._jvm
+    conf = spark_session._jsc.hadoopConfiguration()
+    jpath = jvm.org.apache.hadoop.fs.Path(path)
+    fs = jpath.getFileSystem(conf)
+    files = []
+    for status in fs.globStatus(jpath) or []:
+        if status.isFile():
+            files.append(
+                [status.getPath().toString(), status.getLen(), status.getModificationTime()]
+            )
+        else:
+            iterator = fs.listFiles(status.getPath(), True)
+            while iterator.hasNext():
+                status = iterator.next()
+                files.append(
+                    [status.getPath().toString(), status.getLen(), status.getModificationTime()]
+                )
+    key = hashlib.sha256(
+        json.dumps(
+            [format, sorted((k, str(v)) for k, v in options.items()), path, sorted(files)]
+        ).encode("utf-8")
+    ).hexdigest()
+
+    if key not in _INFERRED_SCHEMAS:
+        cache_path = jvm.org.apache.hadoop.fs.Path(schema_cache, "{}.json".format(key))
+        cache_fs = cache_path.getFileSystem(conf)
+        if cache_fs.exists(cache_path):
+            stream = cache_fs.open(cache_path)
+            try:
+                schema_json = jvm.org.apache.commons.io.IOUtils.toString(stream, "UTF-8")
+            finally:
+                stream.close()
+            schema = StructType.fromJson(json.loads(schema_json))
+        else:
+            schema = spark_session.read.format(format).options(**options).load(path).schema
+            stream = cache_fs.create(cache_path, True)
+            try:
+                stream.write(bytearray(schema.json().encode("utf-8")))
+            finally:
+                stream.close()
+        _INFERRED_SCHEMAS[key] = schema
+    return _INFERRED_SCHEMAS[key]
 
-    return read_spark_io(path, format="json", index_col=index_col, **options)
+
+def _as_read_spark_type(tpe) -> Optional[DataType]:
+    """
+    Return the Spark type to read the values of the given pandas dtype as, or None if the
+    values should be read and then cast, e.g., for categorical or extension dtypes.
+    """
+    try:
+        dtype = pandas_dtype(tpe)
+    except TypeError:
+        return None
+    if not isinstance(dtype, np.dtype) or dtype == np.dtype("object"):
+        return None
+    return as_spark_type(tpe, raise_error=False)
 
 
 def read_delta(
@@ -475,6 +879,8 @@ def read_delta(
     version: Optional[str] = None,
     timestamp: Optional[str] = None,
     index_col: Optional[Union[str, List[str]]] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Union[str, spark.Column, List]] = None,
     **options
 ) -> DataFrame:
     """
@@ -495,6 +901,10 @@ def read_delta(
         and sets Delta's 'timestampAsOf' option.
     index_col : str or list of str, optional, default: None
         Index column of table in Spark.
+    columns : list, default None
+        If not None, only these columns will be read from the table.
+    filters : str, Column or list, default None
+        The row filters applied when reading the table. See `read_parquet`.
     options
         Additional options that can be passed onto Delta.
 
@@ -550,7 +960,196 @@ def read_delta(
         options["versionAsOf"] = version
     if timestamp is not None:
         options["timestampAsOf"] = timestamp
-    return read_spark_io(path, format="delta", index_col=index_col, **options)
+    if columns is None and filters is None:
+        return read_spark_io(path, format="delta", index_col=index_col, **options)
+
+    sdf = default_session().read.load(path=path, format="delta", **options)
+    if columns is not None:
+        columns = _validate_columns_to_read(sdf, columns, index_col)
+    return _to_pruned_frame(sdf, index_col, columns, filters)
+
+
+def read_delta_changes(
+    path: str,
+    start_version: int,
+    end_version: Optional[int] = None,
+    index_col: Optional[Union[str, List[str]]] = None,
+) -> DataFrame:
+    """
+    Read the rows added or removed in a Delta Lake table between two versions.
+
+    Only the data files added or removed by the commits after `start_version` up to
+    `end_version` are read, based on the add and remove actions in the Delta log. The rows in
+    both the added and the removed files, e.g., the rows kept by a file rewritten by an update,
+    are cancelled out, so the result is the difference between the two snapshots.
+
+    The type of the change is in the '_change_type' column, 'insert' for the rows added and
+    'delete' for the rows removed. An updated row is a pair of a 'delete' and an 'insert' row.
+
+    .. note:: The removed files are read, so the versions must not be older than the files
+        deleted by `VACUUM`. Tables with deletion vectors are not supported.
+
+    Parameters
+    ----------
+    path : string
+        Path to the Delta Lake table.
+    start_version : int
+        The version of the snapshot to compare from.
+    end_version : int, optional
+        The version of the snapshot to compare to. The latest version by default.
+    index_col : str or list of str, optional, default: None
+        Index column of table in Spark.
+
+    Returns
+    -------
+    DataFrame
+
+    See Also
+    --------
+    read_delta
+
+    Examples
+    --------
+    >>> ks.DataFrame({'id': [1, 2]}).to_delta('%s/read_delta_changes/foo' % path)
+    >>> ks.DataFrame({'id': [3]}).to_delta('%s/read_delta_changes/foo' % path, mode='append')
+    >>> ks.read_delta_changes('%s/read_delta_changes/foo' % path, start_version=0)
+       id  _change_type
+    0   3        insert
+
+    >>> ks.DataFrame({'id': [1, 3]}).to_delta(
+    ...     '%s/read_delta_changes/foo' % path, mode='overwrite')
+    >>> ks.read_delta_changes(
+    ...     '%s/read_delta_changes/foo' % path, start_version=1, end_version=2)
+       id  _change_type
+    0   2        delete
+    """
+    spark_session = default_session()
+    jvm = spark_session.sparkContext._jvm
+    conf = spark_session._jsc.hadoopConfiguration()
+    table_path = jvm.org.apache.hadoop.fs.Path(path)
+    log_path = jvm.org.apache.hadoop.fs.Path(table_path, "_delta_log")
+    fs = log_path.getFileSystem(conf)
+
+    if end_version is None:
+        end_version = max(
+            int(status.getPath().getName()[:20])
+            for status in fs.listStatus(log_path)
+            if re.match(r"^\d{20}\.json$", status.getPath().getName())
+        )
+    if start_version > end_version:
+        raise ValueError("start_version must not be greater than end_version.")
+
+    # The data files added and removed, with their partition values.
+    added = OrderedDict()  # type: Dict[str, Optional[Dict[str, Optional[str]]]]
+    removed = OrderedDict()  # type: Dict[str, Optional[Dict[str, Optional[str]]]]
+    for version in _range(start_version + 1, end_version + 1):
+        stream = fs.open(jvm.org.apache.hadoop.fs.Path(log_path, "{:020d}.json".format(version)))
+        try:
+            commit = jvm.org.apache.commons.io.IOUtils.toString(stream, "UTF-8")
+        finally:
+            stream.close()
+        for line in commit.splitlines():
+            if len(line.strip()) == 0:
+                continue
+            action = json.loads(line)
+            if "add" in action:
+                file, files, others = action["add"], added, removed
+                if file.get("deletionVector") is not None:
+                    raise NotImplementedError("Tables with deletion vectors are not supported.")
+            elif "remove" in action:
+                file, files, others = action["remove"], removed, added
+            else:
+                continue
+            # The files rearranged without changing the data, e.g., by `OPTIMIZE`.
+            if not file.get("dataChange", True):
+                continue
+            if file["path"] in others:
+                del others[file["path"]]
+            else:
+                files[file["path"]] = file.get("partitionValues")
+
+    schema = spark_session.read.format("delta").option("versionAsOf", end_version).load(path).schema
+
+    def partition_values_of(file, partition_values):
+        if partition_values is not None:
+            return partition_values
+        # The partition values are in the Hive-style directories of the file.
+        partition_values = {}
+        for segment in file.split("/")[:-1]:
+            if "=" in segment:
+                name, value = segment.split("=", 1)
+                value = unquote(value)
+                partition_values[unquote(name)] = (
+                    None if value == "__HIVE_DEFAULT_PARTITION__" else value
+                )
+        return partition_values
+
+    added = OrderedDict((f, partition_values_of(f, pv)) for f, pv in added.items())
+    removed = OrderedDict((f, partition_values_of(f, pv)) for f, pv in removed.items())
+    partition_columns = set(
+        name for pv in list(added.values()) + list(removed.values()) for name in pv
+    )
+    data_schema = StructType([field for field in schema if field.name not in partition_columns])
+
+    def read_files(files):
+        if len(files) == 0:
+            return spark_session.createDataFrame([], schema)
+
+        # The paths as `input_file_name()` returns them, with the partition values of the files.
+        partition_names = sorted(partition_columns)
+        file_partitions = []
+        for file, partition_values in files.items():
+            file_path = jvm.org.apache.hadoop.fs.Path(jvm.java.net.URI(file))
+            if not file_path.isAbsolute():
+                file_path = jvm.org.apache.hadoop.fs.Path(table_path, file_path)
+            file_path = file_path.getFileSystem(conf).makeQualified(file_path)
+            file_partitions.append(
+                [file_path.toUri().toString()]
+                + [partition_values.get(name) for name in partition_names]
+            )
+
+        sdf = spark_session.read.schema(data_schema).parquet(*[row[0] for row in file_partitions])
+        if len(partition_columns) == 0:
+            return sdf.select([scol_for(sdf, field.name) for field in schema])
+
+        # All the files are read in one scan, and the partition values are attached by joining
+        # the file of each row against the small frame of the files and their partition values.
+        file_column = verify_temp_column_name(sdf, "__input_file__")
+        partitions = spark_session.createDataFrame(
+            file_partitions,
+            StructType(
+                [StructField(file_column, StringType())]
+                + [StructField(name, StringType()) for name in partition_names]
+            ),
+        )
+        sdf = sdf.withColumn(file_column, F.input_file_name()).join(
+            F.broadcast(partitions), on=file_column
+        )
+        return sdf.select(
+            [
+                scol_for(sdf, field.name).cast(field.dataType).alias(field.name)
+                if field.name in partition_columns
+                else scol_for(sdf, field.name)
+                for field in schema
+            ]
+        )
+
+    inserted = read_files(added)
+    deleted = read_files(removed)
+    if len(added) > 0 and len(removed) > 0:
+        # The rows kept in the files rewritten are both in the added and the removed files.
+        inserted, deleted = inserted.exceptAll(deleted), deleted.exceptAll(inserted)
+
+    sdf = inserted.withColumn("_change_type", F.lit("insert")).union(
+        deleted.withColumn("_change_type", F.lit("delete"))
+    )
+    index_spark_columns, index_names = _get_index_map(sdf, index_col)
+
+    return DataFrame(
+        InternalFrame(
+            spark_frame=sdf, index_spark_columns=index_spark_columns, index_names=index_names
+        )
+    )
 
 
 def read_table(name: str, index_col: Optional[Union[str, List[str]]] = None) -> DataFrame:
@@ -674,18 +1273,18 @@ def read_spark_io(
         options = options.get("options")  # type: ignore
 
     sdf = default_session().read.load(path=path, format=format, schema=schema, **options)
-    index_spark_columns, index_names = _get_index_map(sdf, index_col)
-
-    return DataFrame(
-        InternalFrame(
-            spark_frame=sdf, index_spark_columns=index_spark_columns, index_names=index_names
-        )
-    )
+    return _to_pruned_frame(sdf, index_col, None, None)
 
 
-def read_parquet(path, columns=None, index_col=None, pandas_metadata=False, **options) -> DataFrame:
+def read_parquet(
+    path, columns=None, index_col=None, pandas_metadata=False, filters=None, **options
+) -> DataFrame:
     """Load a parquet object from the file path, returning a DataFrame.
 
+    The columns and the row filters are applied to the scan before the default index is
+    attached, so that Spark prunes the columns and pushes the filters down into the files,
+    including skipping the partitions of partitioned data.
+
     Parameters
     ----------
     path : string
@@ -696,6 +1295,19 @@ def read_parquet(path, columns=None, index_col=None, pandas_metadata=False, **op
         Index column of table in Spark.
     pandas_metadata : bool, default: False
         If True, try to respect the metadata if the Parquet file is written from pandas.
+        Only the footer of the first file is read for the metadata.
+    filters : str, Column or list, default None
+        The row filters applied when reading the files, given as a Spark SQL expression
+        string, a Spark Column, or a list of ``(column, op, value)`` tuples in the style of
+        pyarrow. The tuples in a list are combined with AND, and a list of such lists is
+        combined with OR. The supported ops are '=', '==', '!=', '<', '<=', '>', '>=', 'in'
+        and 'not in'. The default index is attached to the filtered rows.
+
+        Without `index_col`, the rows filtered after reading, e.g., ``kdf[kdf.a > 1]``,
+        are filtered after the default index is attached to all the rows read, so such
+        filters do not reach the scan unless 'compute.lazy_default_index' is enabled; see
+        the examples below. With `index_col`, no default index is attached and the filters
+        after reading reach the scan too.
     options : dict
         All other options passed directly into Spark's data source.
 
@@ -725,6 +1337,24 @@ def read_parquet(path, columns=None, index_col=None, pandas_metadata=False, **op
            id
     index
     0       0
+
+    The rows can be filtered in the scan.
+
+    >>> ks.range(10).to_parquet('%s/read_spark_io/data.parquet' % path)
+    >>> ks.read_parquet(
+    ...     '%s/read_spark_io/data.parquet' % path, filters=[('id', '>', 3), ('id', '<', 6)]
+    ... ).sort_values(by='id')  # doctest: +NORMALIZE_WHITESPACE
+       id
+    0   4
+    1   5
+
+    With 'compute.lazy_default_index', the rows filtered and the columns selected before
+    the index is used reach the scan, and the default index is attached to the rows filtered.
+
+    >>> with ks.option_context('compute.lazy_default_index', True):
+    ...     kdf = ks.read_parquet('%s/read_spark_io/data.parquet' % path)
+    >>> kdf[kdf.id > 7].index.sort_values()
+    Int64Index([0, 1], dtype='int64')
     """
     if "options" in options and isinstance(options.get("options"), dict) and len(options) == 1:
         options = options.get("options")  # type: ignore
@@ -735,47 +1365,17 @@ def read_parquet(path, columns=None, index_col=None, pandas_metadata=False, **op
     index_names = None
 
     if index_col is None and pandas_metadata:
-        if LooseVersion(pyspark.__version__) < LooseVersion("3.0.0"):
-            raise ValueError("pandas_metadata is not supported with Spark < 3.0.")
-
-        # Try to read pandas metadata
-
-        @pandas_udf("index_col array<string>, index_names array<string>", PandasUDFType.SCALAR)
-        def read_index_metadata(pser):
-            binary = pser.iloc[0]
-            metadata = pq.ParquetFile(pa.BufferReader(binary)).metadata.metadata
-            if b"pandas" in metadata:
-                pandas_metadata = json.loads(metadata[b"pandas"].decode("utf8"))
-                if all(isinstance(col, str) for col in pandas_metadata["index_columns"]):
-                    index_col = []
-                    index_names = []
-                    for col in pandas_metadata["index_columns"]:
-                        index_col.append(col)
-                        for column in pandas_metadata["columns"]:
-                            if column["field_name"] == col:
-                                index_names.append(column["name"])
-                                break
-                        else:
-                            index_names.append(None)
-                    return pd.DataFrame({"index_col": [index_col], "index_names": [index_names]})
-            return pd.DataFrame({"index_col": [None], "index_names": [None]})
-
-        index_col, index_names = (
-            default_session()
-            .read.format("binaryFile")
-            .load(path)
-            .limit(1)
-            .select(read_index_metadata("content").alias("index_metadata"))
-            .select("index_metadata.*")
-            .head()
-        )
+        index_col, index_names = _read_parquet_pandas_metadata(path)
 
-    kdf = read_spark_io(path=path, format="parquet", options=options, index_col=index_col)
+    sdf = default_session().read.load(path=path, format="parquet", **options)
 
-    if columns is not None:
-        new_columns = [c for c in columns if c in kdf.columns]
+    if columns is None:
+        kdf = _to_pruned_frame(sdf, index_col, None, filters)
+    else:
+        index_cols = _index_col_list(index_col)
+        new_columns = [c for c in columns if c in sdf.columns and c not in index_cols]
         if len(new_columns) > 0:
-            kdf = kdf[new_columns]
+            kdf = _to_pruned_frame(sdf, index_col, new_columns, filters)
         else:
             sdf = default_session().createDataFrame([], schema=StructType())
             index_spark_columns, index_names = _get_index_map(sdf, index_col)
@@ -793,6 +1393,194 @@ def read_parquet(path, columns=None, index_col=None, pandas_metadata=False, **op
     return kdf
 
 
+def _index_col_list(index_col: Optional[Union[str, List[str]]]) -> List[str]:
+    if index_col is None:
+        return []
+    elif isinstance(index_col, str):
+        return [index_col]
+    else:
+        return list(index_col)
+
+
+def _validate_columns_to_read(
+    sdf: spark.DataFrame, columns, index_col: Optional[Union[str, List[str]]]
+) -> List[str]:
+    """ Check the columns to read exist in the Spark DataFrame as data columns. """
+    index_cols = _index_col_list(index_col)
+    data_columns = [col for col in sdf.columns if col not in index_cols]
+    new_columns = list()
+    for column in list(columns):
+        if column in data_columns:
+            new_columns.append(column)
+        else:
+            raise ValueError("Unknown column name '{}'".format(column))
+    return new_columns
+
+
+def _to_pruned_frame(
+    sdf: spark.DataFrame,
+    index_col: Optional[Union[str, List[str]]],
+    columns: Optional[List[str]],
+    filters: Optional[Union[str, spark.Column, List]],
+) -> DataFrame:
+    """
+    Create a DataFrame from the Spark DataFrame read from a data source, selecting the columns
+    and filtering the rows before the default index is attached.
+
+    The default index, e.g., 'sequence' or 'distributed-sequence', is computed over the rows of
+    the Spark DataFrame it is attached to, so Spark cannot push the projections and the filters
+    over it into the scan. Applying them first lets the scan read only the columns and the rows
+    needed. With 'compute.lazy_default_index', the default index is also marked lazy so that
+    the filters and the projections by `loc` afterwards are applied first as well.
+
+    :param sdf: the Spark DataFrame read from a data source.
+    :param index_col: the index columns.
+    :param columns: the data columns to select, or None for all the columns.
+    :param filters: the row filters. See `read_parquet`.
+    :return: the DataFrame.
+    """
+    if filters is not None:
+        sdf = sdf.filter(_filters_to_spark_column(sdf, filters))
+    if columns is not None:
+        index_cols = _index_col_list(index_col)
+        sdf = sdf.select(
+            [scol_for(sdf, col) for col in index_cols]
+            + [scol_for(sdf, col) for col in columns if col not in index_cols]
+        )
+    index_spark_columns, index_names = _get_index_map(sdf, index_col)
+
+    internal = InternalFrame(
+        spark_frame=sdf, index_spark_columns=index_spark_columns, index_names=index_names
+    )
+    if index_spark_columns is None and get_option("compute.lazy_default_index"):
+        internal = internal.with_lazy_default_index(sdf)
+    return DataFrame(internal)
+
+
+_FILTER_OPS = {
+    "=": lambda scol, value: scol == value,
+    "==": lambda scol, value: scol == value,
+    "!=": lambda scol, value: scol != value,
+    "<": lambda scol, value: scol < value,
+    "<=": lambda scol, value: scol <= value,
+    ">": lambda scol, value: scol > value,
+    ">=": lambda scol, value: scol >= value,
+    "in": lambda scol, value: scol.isin(list(value)),
+    "not in": lambda scol, value: ~scol.isin(list(value)),
+}
+
+
+def _filters_to_spark_column(
+    sdf: spark.DataFrame, filters: Union[str, spark.Column, List]
+) -> spark.Column:
+    """
+    Convert the row filters into a Spark Column.
+
+    :param sdf: the Spark DataFrame to filter.
+    :param filters: a Spark SQL expression string, a Spark Column, or a list of
+                    ``(column, op, value)`` tuples combined with AND, or a list of such lists
+                    combined with OR.
+    :return: the Spark Column of the condition.
+    """
+    if isinstance(filters, str):
+        return F.expr(filters)
+    elif isinstance(filters, spark.Column):
+        return filters
+    elif not isinstance(filters, list) or len(filters) == 0:
+        raise TypeError(
+            "filters should be a string, a Column or a non-empty list of tuples; "
+            "however, got {}.".format(filters)
+        )
+
+    if all(isinstance(f, tuple) for f in filters):
+        filters = [filters]
+
+    conditions = []
+    for conjunction in filters:
+        if not isinstance(conjunction, list) or len(conjunction) == 0:
+            raise TypeError(
+                "filters should be a list of tuples or a list of lists of tuples; "
+                "however, got {}.".format(conjunction)
+            )
+        predicates = []
+        for f in conjunction:
+            if not isinstance(f, tuple) or len(f) != 3:
+                raise TypeError(
+                    "A filter should be a tuple of (column, op, value); "
+                    "however, got {}.".format(f)
+                )
+            column, op, value = f
+            if op not in _FILTER_OPS:
+                raise ValueError(
+                    "op must be one of {}; however, got '{}'.".format(
+                        ", ".join("'{}'".format(op) for op in _FILTER_OPS), op
+                    )
+                )
+            predicates.append(_FILTER_OPS[op](scol_for(sdf, column), value))
+        conditions.append(reduce(lambda x, y: x & y, predicates))
+    return reduce(lambda x, y: x | y, conditions)
+
+
+# The index columns and names in the pandas metadata of the Parquet files, keyed by the path
+# and the modification time of the file.
+_PARQUET_PANDAS_METADATA = {}  # type: Dict[Tuple[str, int], Tuple[Optional[List], Optional[List]]]
+
+
+def _read_parquet_pandas_metadata(
+    path: str,
+) -> Tuple[Optional[List[str]], Optional[List[Optional[str]]]]:
+    """
+    Read the index columns and names from the pandas metadata of the first Parquet file in
+    the given path.
+
+    Only the footer of the file is read by the Parquet reader of Spark through the Hadoop
+    file system, and the result is cached by the path and the modification time of the file.
+    """
+    spark_session = default_session()
+    jvm = spark_session.sparkContext._jvm
+    conf = spark_session._jsc.hadoopConfiguration()
+    jpath = jvm.org.apache.hadoop.fs.Path(path)
+    fs = jpath.getFileSystem(conf)
+
+    def first_file(statuses):
+        for status in sorted(statuses, key=lambda status: status.getPath().getName()):
+            name = status.getPath().getName()
+            if name.startswith("_") or name.startswith("."):
+                continue
+            if status.isFile():
+                return status
+            status = first_file(fs.listStatus(status.getPath()))
+            if status is not None:
+                return status
+        return None
+
+    file_status = first_file(fs.globStatus(jpath) or [])
+    if file_status is None:
+        return None, None
+
+    key = (file_status.getPath().toString(), file_status.getModificationTime())
+    if key not in _PARQUET_PANDAS_METADATA:
+        footer = jvm.org.apache.parquet.hadoop.ParquetFileReader.readFooter(conf, file_status)
+        metadata = footer.getFileMetaData().getKeyValueMetaData().get("pandas")
+
+        index_col = index_names = None
+        if metadata is not None:
+            pandas_metadata = json.loads(metadata)
+            if all(isinstance(col, str) for col in pandas_metadata["index_columns"]):
+                index_col = []
+                index_names = []
+                for col in pandas_metadata["index_columns"]:
+                    index_col.append(col)
+                    for column in pandas_metadata["columns"]:
+                        if column["field_name"] == col:
+                            index_names.append(column["name"])
+                            break
+                    else:
+                        index_names.append(None)
+        _PARQUET_PANDAS_METADATA[key] = (index_col, index_names)
+    return _PARQUET_PANDAS_METADATA[key]
+
+
 def read_clipboard(sep=r"\s+", **kwargs) -> DataFrame:
     r"""
     Read text from clipboard and pass to read_csv. See read_csv for the
@@ -840,6 +1628,7 @@ def read_excel(
     skipfooter=0,
     convert_float=True,
     mangle_dupe_cols=True,
+    rows_per_task=None,
     **kwds
 ) -> Union[DataFrame, Series, OrderedDict]:
     """
@@ -857,6 +1646,9 @@ def read_excel(
             If the underlying Spark is below 3.0, the parameter as a string is not supported.
             You can use `ks.from_pandas(pd.read_excel(...))` as a workaround.
 
+        If it is a string, the files are read in Spark, and the schema is inferred from
+        the first `compute.shortcut_limit` rows of the first file.
+
     sheet_name : str, int, list, or None, default 0
         Strings are used for sheet names. Integers are used in zero-indexed
         sheet positions. Lists of strings/integers are used to request
@@ -972,6 +1764,18 @@ def read_excel(
         Duplicate columns will be specified as 'X', 'X.1', ...'X.N', rather than
         'X'...'X'. Passing in False will cause data to be overwritten if there
         are duplicate names in the columns.
+    rows_per_task : int, optional
+        The number of the rows of a sheet to read in a single task, when `io` is a path.
+        The number of the rows in each sheet is read from the sheet dimension with openpyxl.
+        The ranges are used only for the files openpyxl reads, if `header` is an integer or
+        None, `engine` is None or 'openpyxl', and `skiprows`, `nrows` and `skipfooter` are not
+        specified; otherwise, each sheet is read in a separate task. Each task opens the file
+        by its path, which should be a local, DBFS or pyarrow-supported path, and converts
+        only the rows of its range with openpyxl in the read-only mode. However, openpyxl
+        still decompresses and scans the XML of the sheet from its beginning to the end of
+        the range, so the total scan cost grows with the number of the ranges; the ranges
+        save the conversion of the cells and the memory, not the scan. The order of the rows
+        is not preserved. By default, each file is read in a single task.
     **kwds : optional
         Optional keyword arguments can be passed to ``TextFileReader``.
 
@@ -1042,7 +1846,7 @@ def read_excel(
     2     None    NaN
     """
 
-    def pd_read_excel(io_or_bin, sn, sq):
+    def pd_read_excel(io_or_bin, sn, sq, skiprows=skiprows, nrows=nrows):
         return pd.read_excel(
             io=BytesIO(io_or_bin) if isinstance(io_or_bin, (bytes, bytearray)) else io_or_bin,
             sheet_name=sn,
@@ -1071,82 +1875,328 @@ def read_excel(
             **kwds
         )
 
-    if isinstance(io, str):
-        if LooseVersion(pyspark.__version__) < LooseVersion("3.0.0"):
-            raise ValueError(
-                "The `io` parameter as a string is not supported if the underlying Spark is "
-                "below 3.0. You can use `ks.from_pandas(pd.read_excel(...))` as a workaround"
-            )
-        # 'binaryFile' format is available since Spark 3.0.0.
-        binaries = default_session().read.format("binaryFile").load(io).select("content").head(2)
-        io_or_bin = binaries[0][0]
-        single_file = len(binaries) == 1
-    else:
-        io_or_bin = io
-        single_file = True
-
-    pdf_or_psers = pd_read_excel(io_or_bin, sn=sheet_name, sq=squeeze)
-
-    if single_file:
+    if not isinstance(io, str):
+        pdf_or_psers = pd_read_excel(io, sn=sheet_name, sq=squeeze)
         if isinstance(pdf_or_psers, dict):
             return OrderedDict(
                 [(sn, from_pandas(pdf_or_pser)) for sn, pdf_or_pser in pdf_or_psers.items()]
             )
         else:
             return cast(Union[DataFrame, Series], from_pandas(pdf_or_psers))
-    else:
 
-        def read_excel_on_spark(pdf_or_pser, sn):
+    if LooseVersion(pyspark.__version__) < LooseVersion("3.0.0"):
+        raise ValueError(
+            "The `io` parameter as a string is not supported if the underlying Spark is "
+            "below 3.0. You can use `ks.from_pandas(pd.read_excel(...))` as a workaround"
+        )
+    if rows_per_task is not None and (not isinstance(rows_per_task, int) or rows_per_task <= 0):
+        raise ValueError("rows_per_task must be a positive integer.")
 
-            if isinstance(pdf_or_pser, pd.Series):
-                pdf = pdf_or_pser.to_frame()
-            else:
-                pdf = pdf_or_pser
+    # 'binaryFile' format is available since Spark 3.0.0.
+    binaries = default_session().read.format("binaryFile").load(io).select("path", "content")
 
-            kdf = from_pandas(pdf)
-            return_schema = force_decimal_precision_scale(
-                as_nullable_spark_type(kdf._internal.spark_frame.drop(*HIDDEN_COLUMNS).schema)
-            )
+    # Infer the schema from the first rows of the first file, read on an executor.
+    if skipfooter > 0:
+        sample_nrows = nrows
+    else:
+        limit = get_option("compute.shortcut_limit")
+        sample_nrows = limit if nrows is None else min(nrows, limit)
+    sample = (
+        binaries.limit(1)
+        .rdd.map(lambda row: pd_read_excel(row[1], sn=sheet_name, sq=squeeze, nrows=sample_nrows))
+        .first()
+    )
+    if isinstance(sample, dict):
+        sheets = list(sample.keys())
+        samples = list(sample.values())
+    else:
+        sheets = [sheet_name]
+        samples = [sample]
+
+    kdfs = [
+        from_pandas(pdf_or_pser.to_frame() if isinstance(pdf_or_pser, pd.Series) else pdf_or_pser)
+        for pdf_or_pser in samples
+    ]
+    return_schemas = [
+        force_decimal_precision_scale(
+            as_nullable_spark_type(kdf._internal.spark_frame.drop(*HIDDEN_COLUMNS).schema)
+        )
+        for kdf in kdfs
+    ]
+
+    # If `rows_per_task` is specified, the sheets, and the row ranges if possible, are read
+    # in separate tasks. All the sheets are read in the same pass over the files, tagged by
+    # the sheet position.
+    split_rows = (
+        rows_per_task is not None
+        and (header is None or isinstance(header, int))
+        and skiprows is None
+        and nrows is None
+        and skipfooter == 0
+        and engine in (None, "openpyxl")
+        and LooseVersion(pd.__version__) >= LooseVersion("0.25")
+    )
+    first_data_row = 0 if header is None else header + 1
+    multiple_sheets = len(sheets) > 1
+    sheet_column = "__sheet__"
+
+    if multiple_sheets:
+        return_schema = StructType(
+            [StructField(sheet_column, IntegerType(), nullable=False)]
+            + [
+                StructField("__{}_{}".format(i, field.name), field.dataType, nullable=True)
+                for i, schema in enumerate(return_schemas)
+                for field in schema.fields
+            ]
+        )
+    else:
+        return_schema = return_schemas[0]
 
-            def output_func(pdf):
-                pdf = pd.concat(
-                    [pd_read_excel(bin, sn=sn, sq=False) for bin in pdf[pdf.columns[0]]]
-                )
+    def excel_units(path):
+        if split_rows:
+            with _open_file(path) as f:
+                max_rows = _excel_sheet_rows(f, sheets)
+        else:
+            max_rows = [None] * len(sheets)
+        units = []
+        for i, max_row in enumerate(max_rows):
+            if max_row is None:
+                units.append((i, 0, None))
+            else:
+                num_rows = max(max_row - first_data_row, 0)
+                for start in _range(0, max(num_rows, 1), rows_per_task):
+                    end = start + rows_per_task
+                    units.append((i, start, end if end < num_rows else None))
+        return units
+
+    def read_unit(content_or_file, sheet, start, end):
+        if start == 0 and pd.isna(end):
+            return pd_read_excel(content_or_file, sn=sheets[sheet], sq=False)
+        return _read_excel_rows(
+            content_or_file,
+            sheets[sheet],
+            first_data_row,
+            start,
+            None if pd.isna(end) else int(end),
+            header=header,
+            names=names,
+            index_col=index_col,
+            usecols=usecols,
+            squeeze=False,
+            dtype=dtype,
+            converters=converters,
+            true_values=true_values,
+            false_values=false_values,
+            na_values=na_values,
+            keep_default_na=keep_default_na,
+            verbose=verbose,
+            parse_dates=parse_dates,
+            date_parser=date_parser,
+            thousands=thousands,
+            comment=comment,
+            convert_float=convert_float,
+            mangle_dupe_cols=mangle_dupe_cols,
+            **kwds
+        )
 
-                reset_index = pdf.reset_index()
+    def output_func(iterator):
+        for pdf in iterator:
+            for content_or_path, sheet, start, end in pdf.itertuples(index=False):
+                if isinstance(content_or_path, str):
+                    with _open_file(content_or_path) as f:
+                        chunk = read_unit(f, sheet, start, end)
+                else:
+                    chunk = read_unit(content_or_path, sheet, start, end)
+                if len(chunk) == 0:
+                    continue
+                if index_col is None and start > 0:
+                    chunk.index = chunk.index + start
+
+                reset_index = chunk.reset_index()
                 for name, col in reset_index.iteritems():
                     dt = col.dtype
                     if is_datetime64_dtype(dt) or is_datetime64tz_dtype(dt):
                         continue
                     reset_index[name] = col.replace({np.nan: None})
-                pdf = reset_index
+                chunk = reset_index
 
                 # Just positionally map the column names to given schema's.
-                return pdf.rename(columns=dict(zip(pdf.columns, return_schema.names)))
-
-            sdf = (
-                default_session()
-                .read.format("binaryFile")
-                .load(io)
-                .select("content")
-                .mapInPandas(lambda iterator: map(output_func, iterator), schema=return_schema)
+                if multiple_sheets:
+                    names = ["__{}_{}".format(sheet, name) for name in return_schemas[sheet].names]
+                    chunk = chunk.rename(columns=dict(zip(chunk.columns, names)))
+                    chunk.insert(0, sheet_column, sheet)
+                    for name in return_schema.names:
+                        if name not in chunk.columns:
+                            chunk[name] = pd.Series([None] * len(chunk), index=chunk.index)
+                    yield chunk[return_schema.names]
+                else:
+                    yield chunk.rename(columns=dict(zip(chunk.columns, return_schema.names)))
+
+    if rows_per_task is not None:
+        unit_type = ArrayType(
+            StructType(
+                [
+                    StructField("sheet", IntegerType()),
+                    StructField("start", LongType()),
+                    StructField("end", LongType()),
+                ]
             )
-
-            kdf = DataFrame(kdf._internal.with_new_sdf(sdf))
-            if squeeze and len(kdf.columns) == 1:
-                return first_series(kdf)
-            else:
-                return kdf
-
-        if isinstance(pdf_or_psers, dict):
-            return OrderedDict(
+        )
+        # Only the paths and the ranges are shuffled, and each task reads the file by the path;
+        # the 'binaryFile' data source does not read the contents for the paths only.
+        units = binaries.select(
+            "path", F.explode(F.udf(excel_units, unit_type)("path")).alias("unit")
+        )
+        units = units.select("path", "unit.*").repartition("path", "sheet", "start")
+    elif multiple_sheets:
+        units = binaries.select(
+            "content",
+            F.explode(F.array(*[F.lit(i) for i in _range(len(sheets))])).alias("sheet"),
+            F.lit(0).cast("long").alias("start"),
+            F.lit(None).cast("long").alias("end"),
+        )
+    else:
+        units = binaries.select(
+            "content",
+            F.lit(0).alias("sheet"),
+            F.lit(0).cast("long").alias("start"),
+            F.lit(None).cast("long").alias("end"),
+        )
+    sdf = units.mapInPandas(output_func, schema=return_schema)
+    if multiple_sheets:
+        # Read the files once for all the sheets.
+        sdf = sdf.localCheckpoint(eager=False)
+
+    results = []
+    for i, kdf in enumerate(kdfs):
+        if multiple_sheets:
+            sheet_sdf = sdf.filter(scol_for(sdf, sheet_column) == i).select(
                 [
-                    (sn, read_excel_on_spark(pdf_or_pser, sn))
-                    for sn, pdf_or_pser in pdf_or_psers.items()
+                    scol_for(sdf, "__{}_{}".format(i, name)).alias(name)
+                    for name in return_schemas[i].names
                 ]
             )
         else:
-            return read_excel_on_spark(pdf_or_psers, sheet_name)
+            sheet_sdf = sdf
+        kdf = DataFrame(kdf._internal.with_new_sdf(sheet_sdf))
+        if squeeze and len(kdf.columns) == 1:
+            results.append(first_series(kdf))
+        else:
+            results.append(kdf)
+
+    if isinstance(sample, dict):
+        return OrderedDict(zip(sheets, results))
+    else:
+        return results[0]
+
+
+def _excel_sheet_rows(f, sheets: List[Union[int, str]]) -> List[Optional[int]]:
+    """
+    Return the numbers of the rows of the given sheets in the Excel workbook, which openpyxl
+    reads from the dimensions of the sheets without reading the rows; None if unknown.
+    """
+    try:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(f, read_only=True)
+    except Exception:
+        return [None] * len(sheets)
+    try:
+        max_rows = []  # type: List[Optional[int]]
+        for sheet in sheets:
+            if isinstance(sheet, int):
+                max_rows.append(workbook.worksheets[sheet].max_row)
+            else:
+                max_rows.append(workbook[sheet].max_row)
+        return max_rows
+    finally:
+        workbook.close()
+
+
+def _read_excel_rows(
+    io, sheet_name: Union[int, str], first_row: int, start: int, end: Optional[int], **kwargs
+) -> pd.DataFrame:
+    """
+    Read the data rows from `start` until `end` of a sheet of an Excel workbook, where the data
+    rows follow the first `first_row` rows, i.e., the header.
+
+    The rows are read with openpyxl in the read-only mode, which converts only the cells of
+    the header and the range, but still scans the XML of the sheet from its beginning to
+    the end of the range.
+
+    :param io: the file or the content of the workbook.
+    :param sheet_name: the sheet name or position.
+    :param first_row: the number of the rows before the data rows.
+    :param start: the first data row to read, 0-indexed.
+    :param end: the data row to read until, exclusive, or None to read until the last row.
+    :param kwargs: the arguments of `pd.ExcelFile.parse` except for `skiprows`, `nrows` and
+                   `skipfooter`.
+    :return: the pandas DataFrame of the rows.
+    """
+    from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+
+    convert_float = kwargs.get("convert_float", True)
+
+    def convert_cell(cell):
+        # The same conversion as pandas' openpyxl reader.
+        if cell.value is None:
+            return ""
+        elif cell.data_type == TYPE_ERROR:
+            return np.nan
+        elif cell.data_type == TYPE_NUMERIC:
+            if not convert_float:
+                return float(cell.value)
+            elif int(cell.value) == cell.value:
+                return int(cell.value)
+        return cell.value
+
+    def get_sheet_data(sheet, *args):
+        rows = list(sheet.iter_rows(max_row=first_row)) if first_row > 0 else []
+        rows.extend(
+            sheet.iter_rows(
+                min_row=first_row + start + 1, max_row=None if end is None else first_row + end
+            )
+        )
+        data = []
+        for row in rows:
+            values = [convert_cell(cell) for cell in row]
+            while len(values) > 0 and values[-1] == "":
+                values.pop()
+            data.append(values)
+        if end is None:
+            # The trailing empty rows of the sheet are dropped as pandas does.
+            while len(data) > first_row and len(data[-1]) == 0:
+                data.pop()
+        width = max([len(values) for values in data] + [0])
+        return [values + [""] * (width - len(values)) for values in data]
+
+    if isinstance(io, (bytes, bytearray)):
+        io = BytesIO(io)
+    excel_file = pd.ExcelFile(io, engine="openpyxl")
+    try:
+        # `parse` reads the rows of the sheet by the reader's `get_sheet_data`.
+        excel_file._reader.get_sheet_data = get_sheet_data
+        return excel_file.parse(sheet_name=sheet_name, **kwargs)
+    finally:
+        excel_file.close()
+
+
+def _open_file(path: str):
+    """
+    Open the file of the given path, as listed by Spark's 'binaryFile' data source, for reading
+    in an executor. The local and DBFS files are opened directly, and the others by pyarrow's
+    file systems.
+    """
+    parsed = urlparse(path)
+    if parsed.scheme in ("", "file"):
+        return open(parsed.path, "rb")
+    elif parsed.scheme == "dbfs":
+        return open("/dbfs" + parsed.path, "rb")
+    else:
+        from pyarrow import fs
+
+        filesystem, file_path = fs.FileSystem.from_uri(path)
+        return filesystem.open_input_file(file_path)
 
 
 def read_html(
@@ -1165,6 +2215,7 @@ def read_html(
     na_values=None,
     keep_default_na=True,
     displayed_only=True,
+    distributed=False,
 ) -> List[DataFrame]:
     r"""Read HTML tables into a ``list`` of ``DataFrame`` objects.
 
@@ -1256,6 +2307,13 @@ def read_html(
     displayed_only : bool, default True
         Whether elements with "display: none" should be parsed
 
+    distributed : bool, default False
+        If True, `io` is the path of the HTML files, which can be a glob pattern or
+        a directory, in any file system Spark can access. The pages are parsed in
+        the executors, and the i-th tables of all the pages are concatenated into the i-th
+        DataFrame. The number of the tables and their schemas are taken from the first page,
+        and the pages without any table matched are skipped. Only available with Spark 3.0+.
+
     Returns
     -------
     dfs : list of DataFrames
@@ -1265,29 +2323,133 @@ def read_html(
     read_csv
     DataFrame.to_html
     """
-    pdfs = pd.read_html(
-        io=io,
-        match=match,
-        flavor=flavor,
-        header=header,
-        index_col=index_col,
-        skiprows=skiprows,
-        attrs=attrs,
-        parse_dates=parse_dates,
-        thousands=thousands,
-        encoding=encoding,
-        decimal=decimal,
-        converters=converters,
-        na_values=na_values,
-        keep_default_na=keep_default_na,
-        displayed_only=displayed_only,
+
+    def pd_read_html(io):
+        return pd.read_html(
+            io=BytesIO(io) if isinstance(io, (bytes, bytearray)) else io,
+            match=match,
+            flavor=flavor,
+            header=header,
+            index_col=index_col,
+            skiprows=skiprows,
+            attrs=attrs,
+            parse_dates=parse_dates,
+            thousands=thousands,
+            encoding=encoding,
+            decimal=decimal,
+            converters=converters,
+            na_values=na_values,
+            keep_default_na=keep_default_na,
+            displayed_only=displayed_only,
+        )
+
+    if not distributed:
+        return cast(List[DataFrame], [from_pandas(pdf) for pdf in pd_read_html(io)])
+
+    if LooseVersion(pyspark.__version__) < LooseVersion("3.0.0"):
+        raise ValueError(
+            "distributed=True is not supported if the underlying Spark is below 3.0. "
+            "You can use `ks.from_pandas(pd.read_html(...))` as a workaround"
+        )
+
+    # 'binaryFile' format is available since Spark 3.0.0.
+    binaries = default_session().read.format("binaryFile").load(io).select("content")
+
+    def tables_in(content):
+        try:
+            return pd_read_html(content)
+        except ValueError:
+            # No tables matched in the page.
+            return []
+
+    # Infer the schemas from the tables in the first page with any table matched, parsed on
+    # an executor.
+    samples = (
+        binaries.rdd.map(lambda row: tables_in(row[0]))
+        .filter(lambda tables: len(tables) > 0)
+        .take(1)
     )
-    return cast(List[DataFrame], [from_pandas(pdf) for pdf in pdfs])
+    if len(samples) == 0:
+        raise ValueError("No tables found")
+    kdfs = [from_pandas(pdf) for pdf in samples[0]]
+    return_schemas = [
+        force_decimal_precision_scale(
+            as_nullable_spark_type(kdf._internal.spark_frame.drop(*HIDDEN_COLUMNS).schema)
+        )
+        for kdf in kdfs
+    ]
+
+    multiple_tables = len(kdfs) > 1
+    table_column = "__table__"
+    if multiple_tables:
+        return_schema = StructType(
+            [StructField(table_column, IntegerType(), nullable=False)]
+            + [
+                StructField("__{}_{}".format(i, field.name), field.dataType, nullable=True)
+                for i, schema in enumerate(return_schemas)
+                for field in schema.fields
+            ]
+        )
+    else:
+        return_schema = return_schemas[0]
+
+    def output_func(iterator):
+        for pdf in iterator:
+            for content in pdf["content"]:
+                for i, table in enumerate(tables_in(content)[: len(return_schemas)]):
+                    table = table.reset_index()
+                    for name, col in table.iteritems():
+                        dt = col.dtype
+                        if is_datetime64_dtype(dt) or is_datetime64tz_dtype(dt):
+                            continue
+                        table[name] = col.replace({np.nan: None})
+
+                    # Just positionally map the column names to given schema's.
+                    if multiple_tables:
+                        table.columns = [
+                            "__{}_{}".format(i, name) for name in return_schemas[i].names
+                        ]
+                        table.insert(0, table_column, i)
+                        for name in return_schema.names:
+                            if name not in table.columns:
+                                table[name] = pd.Series([None] * len(table), index=table.index)
+                        yield table[return_schema.names]
+                    else:
+                        table.columns = return_schema.names
+                        yield table
+
+    sdf = binaries.mapInPandas(output_func, schema=return_schema)
+    if not multiple_tables:
+        return [DataFrame(kdfs[0]._internal.with_new_sdf(sdf))]
+
+    # Parse the pages once for all the tables.
+    sdf = sdf.localCheckpoint(eager=False)
+    return [
+        DataFrame(
+            kdf._internal.with_new_sdf(
+                sdf.filter(scol_for(sdf, table_column) == i).select(
+                    [
+                        scol_for(sdf, "__{}_{}".format(i, name)).alias(name)
+                        for name in return_schemas[i].names
+                    ]
+                )
+            )
+        )
+        for i, kdf in enumerate(kdfs)
+    ]
 
 
 # TODO: add `coerce_float` and 'parse_dates' parameters
 def read_sql_table(
-    table_name, con, schema=None, index_col=None, columns=None, **options
+    table_name,
+    con,
+    schema=None,
+    index_col=None,
+    columns=None,
+    partition_column=None,
+    num_partitions=None,
+    predicates=None,
+    **options
 ) -> DataFrame:
     """
     Read SQL database table into a DataFrame.
@@ -1310,6 +2472,17 @@ def read_sql_table(
         Column(s) to set as index(MultiIndex).
     columns : list, default None
         List of column names to select from SQL table.
+    partition_column : str, optional
+        The numeric, date or timestamp column to split the reads by ranges with.
+        By default, the first column of `index_col` is used if its type is one of them.
+        The lower and upper bounds of the ranges are queried to the database, unless
+        `partitionColumn` is specified in `options`.
+    num_partitions : int, optional
+        The number of the ranges to read in parallel. By default, the default parallelism
+        of Spark.
+    predicates : list of str, optional
+        The conditions in the WHERE clause to read the partitions with, e.g., by the hash of
+        a column; one partition for each condition.
     options : dict
         All other options passed directly into Spark's JDBC data source.
 
@@ -1332,12 +2505,18 @@ def read_sql_table(
         options = options.get("options")  # type: ignore
 
     reader = default_session().read
-    reader.option("dbtable", table_name)
-    reader.option("url", con)
     if schema is not None:
         reader.schema(schema)
-    reader.options(**options)
-    sdf = reader.format("jdbc").load()
+    sdf = _read_jdbc(
+        reader,
+        con,
+        table_name,
+        index_col=index_col,
+        partition_column=partition_column,
+        num_partitions=num_partitions,
+        predicates=predicates,
+        options=options,
+    )
     index_spark_columns, index_names = _get_index_map(sdf, index_col)
     kdf = DataFrame(
         InternalFrame(
@@ -1352,7 +2531,9 @@ def read_sql_table(
 
 
 # TODO: add `coerce_float`, `params`, and 'parse_dates' parameters
-def read_sql_query(sql, con, index_col=None, **options) -> DataFrame:
+def read_sql_query(
+    sql, con, index_col=None, partition_column=None, num_partitions=None, predicates=None, **options
+) -> DataFrame:
     """Read SQL query into a DataFrame.
 
     Returns a DataFrame corresponding to the result set of the query
@@ -1372,6 +2553,17 @@ def read_sql_query(sql, con, index_col=None, **options) -> DataFrame:
 
     index_col : string or list of strings, optional, default: None
         Column(s) to set as index(MultiIndex).
+    partition_column : str, optional
+        The numeric, date or timestamp column to split the reads by ranges with.
+        By default, the first column of `index_col` is used if its type is one of them.
+        The lower and upper bounds of the ranges are queried to the database, unless
+        `partitionColumn` is specified in `options`.
+    num_partitions : int, optional
+        The number of the ranges to read in parallel. By default, the default parallelism
+        of Spark.
+    predicates : list of str, optional
+        The conditions in the WHERE clause to read the partitions with, e.g., by the hash of
+        a column; one partition for each condition.
     options : dict
         All other options passed directly into Spark's JDBC data source.
 
@@ -1391,11 +2583,16 @@ def read_sql_query(sql, con, index_col=None, **options) -> DataFrame:
     if "options" in options and isinstance(options.get("options"), dict) and len(options) == 1:
         options = options.get("options")  # type: ignore
 
-    reader = default_session().read
-    reader.option("query", sql)
-    reader.option("url", con)
-    reader.options(**options)
-    sdf = reader.format("jdbc").load()
+    sdf = _read_jdbc(
+        default_session().read,
+        con,
+        "({}) KOALAS_QUERY".format(sql),
+        index_col=index_col,
+        partition_column=partition_column,
+        num_partitions=num_partitions,
+        predicates=predicates,
+        options=options,
+    )
     index_spark_columns, index_names = _get_index_map(sdf, index_col)
     return DataFrame(
         InternalFrame(
@@ -1405,7 +2602,16 @@ def read_sql_query(sql, con, index_col=None, **options) -> DataFrame:
 
 
 # TODO: add `coerce_float`, `params`, and 'parse_dates' parameters
-def read_sql(sql, con, index_col=None, columns=None, **options) -> DataFrame:
+def read_sql(
+    sql,
+    con,
+    index_col=None,
+    columns=None,
+    partition_column=None,
+    num_partitions=None,
+    predicates=None,
+    **options
+) -> DataFrame:
     """
     Read SQL query or database table into a DataFrame.
 
@@ -1432,6 +2638,17 @@ def read_sql(sql, con, index_col=None, columns=None, **options) -> DataFrame:
     columns : list, default: None
         List of column names to select from SQL table (only used when reading
         a table).
+    partition_column : str, optional
+        The numeric, date or timestamp column to split the reads by ranges with.
+        By default, the first column of `index_col` is used if its type is one of them.
+        The lower and upper bounds of the ranges are queried to the database, unless
+        `partitionColumn` is specified in `options`.
+    num_partitions : int, optional
+        The number of the ranges to read in parallel. By default, the default parallelism
+        of Spark.
+    predicates : list of str, optional
+        The conditions in the WHERE clause to read the partitions with, e.g., by the hash of
+        a column; one partition for each condition.
     options : dict
         All other options passed directly into Spark's JDBC data source.
 
@@ -1454,9 +2671,117 @@ def read_sql(sql, con, index_col=None, columns=None, **options) -> DataFrame:
 
     striped = sql.strip()
     if " " not in striped:  # TODO: identify the table name or not more precisely.
-        return read_sql_table(sql, con, index_col=index_col, columns=columns, **options)
+        return read_sql_table(
+            sql,
+            con,
+            index_col=index_col,
+            columns=columns,
+            partition_column=partition_column,
+            num_partitions=num_partitions,
+            predicates=predicates,
+            **options
+        )
     else:
-        return read_sql_query(sql, con, index_col=index_col, **options)
+        return read_sql_query(
+            sql,
+            con,
+            index_col=index_col,
+            partition_column=partition_column,
+            num_partitions=num_partitions,
+            predicates=predicates,
+            **options
+        )
+
+
+def _read_jdbc(
+    reader: spark.DataFrameReader,
+    con: str,
+    table: str,
+    index_col: Optional[Union[str, List[str]]],
+    partition_column: Optional[str],
+    num_partitions: Optional[int],
+    predicates: Optional[List[str]],
+    options: Dict[str, Any],
+) -> spark.DataFrame:
+    """
+    Read the table or the subquery through Spark's JDBC data source, in parallel if possible.
+
+    - If `predicates` is specified, each condition is read in a partition.
+    - Otherwise, unless `partitionColumn` is specified in `options`, the ranges of
+      `partition_column`, or the first column of `index_col` if numeric, date or timestamp,
+      are read in parallel, with the bounds queried as the minimum and the maximum.
+
+    :param reader: the DataFrameReader to read with.
+    :param con: the JDBC URI.
+    :param table: the table name or the subquery with an alias, for the `dbtable` option.
+    :param index_col: the index columns.
+    :param partition_column: the column to split the reads by ranges with.
+    :param num_partitions: the number of the ranges.
+    :param predicates: the conditions of the partitions.
+    :param options: the options of Spark's JDBC data source.
+    :return: the Spark DataFrame read.
+    """
+    range_options = {"partitioncolumn", "lowerbound", "upperbound"}
+    user_partitioned = any(key.lower() in range_options for key in options)
+    if num_partitions is not None and (not isinstance(num_partitions, int) or num_partitions < 1):
+        raise ValueError("num_partitions must be a positive integer.")
+
+    if predicates is not None:
+        if user_partitioned or partition_column is not None:
+            raise ValueError("predicates cannot be used with the partition column.")
+        properties = {key: str(value) for key, value in options.items()}
+        return reader.jdbc(con, table, predicates=list(predicates), properties=properties)
+
+    reader = reader.format("jdbc").option("url", con).option("dbtable", table).options(**options)
+    if user_partitioned:
+        return reader.load()
+
+    if num_partitions is None:
+        num_partitions = next(
+            (int(value) for key, value in options.items() if key.lower() == "numpartitions"),
+            default_session().sparkContext.defaultParallelism,
+        )
+    if num_partitions <= 1 or (partition_column is None and index_col is None):
+        return reader.load()
+
+    # Resolving the schema only queries the columns.
+    sdf = reader.load()
+    if partition_column is None:
+        column = index_col if isinstance(index_col, str) else index_col[0]
+        if column not in sdf.columns or not isinstance(
+            sdf.schema[column].dataType, (NumericType, DateType, TimestampType)
+        ):
+            return sdf
+        partition_column = column
+    elif partition_column not in sdf.columns:
+        raise KeyError(partition_column)
+
+    dialect = default_session().sparkContext._jvm.org.apache.spark.sql.jdbc.JdbcDialects.get(con)
+    lower, upper = (
+        default_session()
+        .read.format("jdbc")
+        .option("url", con)
+        .options(**options)
+        .option(
+            "query",
+            "SELECT MIN({col}), MAX({col}) FROM {table}".format(
+                col=dialect.quoteIdentifier(partition_column), table=table
+            ),
+        )
+        .load()
+        .head()
+    )
+    if lower is None or lower == upper:
+        return sdf
+    if isinstance(lower, (float, decimal.Decimal)):
+        lower, upper = math.floor(lower), math.ceil(upper)
+    return (
+        reader.option("partitionColumn", partition_column)
+        .option("lowerBound", str(lower))
+        .option("upperBound", str(upper))
+        .option("numPartitions", num_partitions)
+        .load()
+    )
 
 
 def to_datetime(
@@ -1815,6 +3140,12 @@ def get_dummies(
     --------
     Series.str.get_dummies
 
+    Notes
+    -----
+    The categories are discovered from `data` on every call. To encode other data the same
+    way without discovering them again, fit an encoder once with ``ks.get_dummies.fit``,
+    which takes the same parameters, and encode with its ``transform``.
+
     Examples
     --------
     >>> s = ks.Series(list('abca'))
@@ -1857,140 +3188,35 @@ def get_dummies(
     0  1.0  0.0  0.0
     1  0.0  1.0  0.0
     2  0.0  0.0  1.0
+
+    >>> encoder = ks.get_dummies.fit(ks.Series(list('abc')))
+    >>> encoder.transform(ks.Series(list('cdb')))
+       a  b  c
+    0  0  0  1
+    1  0  0  0
+    2  0  1  0
     """
     if sparse is not False:
         raise NotImplementedError("get_dummies currently does not support sparse")
 
-    if columns is not None:
-        if not is_list_like(columns):
-            raise TypeError("Input must be a list-like for parameter `columns`")
-
-    if dtype is None:
-        dtype = "byte"
-
-    if isinstance(data, Series):
-        if prefix is not None:
-            prefix = [str(prefix)]
-        kdf = data.to_frame()
-        column_labels = kdf._internal.column_labels
-        remaining_columns = []
-    else:
-        if isinstance(prefix, str):
-            raise NotImplementedError(
-                "get_dummies currently does not support prefix as string types"
-            )
-        kdf = data.copy()
-
-        if columns is None:
-            column_labels = [
-                label
-                for label in kdf._internal.column_labels
-                if isinstance(
-                    kdf._internal.spark_type_for(label), _get_dummies_default_accept_types
-                )
-            ]
-        else:
-            if is_name_like_tuple(columns):
-                column_labels = [
-                    label
-                    for label in kdf._internal.column_labels
-                    if label[: len(columns)] == columns
-                ]
-                if len(column_labels) == 0:
-                    raise KeyError(name_like_string(columns))
-                if prefix is None:
-                    prefix = [
-                        str(label[len(columns) :])
-                        if len(label) > len(columns) + 1
-                        else label[len(columns)]
-                        if len(label) == len(columns) + 1
-                        else ""
-                        for label in column_labels
-                    ]
-            elif any(isinstance(col, tuple) for col in columns) and any(
-                not is_name_like_tuple(col) for col in columns
-            ):
-                raise ValueError(
-                    "Expected tuple, got {}".format(
-                        type(set(col for col in columns if not is_name_like_tuple(col)).pop())
-                    )
-                )
-            else:
-                column_labels = [
-                    label
-                    for key in columns
-                    for label in kdf._internal.column_labels
-                    if label == key or label[0] == key
-                ]
-        if len(column_labels) == 0:
-            if columns is None:
-                return kdf
-            raise KeyError("{} not in index".format(columns))
-
-        if prefix is None:
-            prefix = [str(label) if len(label) > 1 else label[0] for label in column_labels]
-
-        column_labels_set = set(column_labels)
-        remaining_columns = [
-            (
-                kdf[label]
-                if kdf._internal.column_labels_level == 1
-                else kdf[label].rename(name_like_string(label))
-            )
-            for label in kdf._internal.column_labels
-            if label not in column_labels_set
-        ]
+    return DummyEncoder.fit(
+        data,
+        prefix=prefix,
+        prefix_sep=prefix_sep,
+        dummy_na=dummy_na,
+        columns=columns,
+        drop_first=drop_first,
+        dtype=dtype,
+    ).transform(data)
 
-    if any(
-        not isinstance(kdf._internal.spark_type_for(label), _get_dummies_acceptable_types)
-        for label in column_labels
-    ):
-        raise NotImplementedError(
-            "get_dummies currently only accept {} values".format(
-                ", ".join([t.typeName() for t in _get_dummies_acceptable_types])
-            )
-        )
 
-    if prefix is not None and len(column_labels) != len(prefix):
-        raise ValueError(
-            "Length of 'prefix' ({}) did not match the length of "
-            "the columns being encoded ({}).".format(len(prefix), len(column_labels))
-        )
-    elif isinstance(prefix, dict):
-        prefix = [prefix[column_label[0]] for column_label in column_labels]
-
-    all_values = _reduce_spark_multi(
-        kdf._internal.spark_frame,
-        [F.collect_set(kdf._internal.spark_column_for(label)) for label in column_labels],
-    )
-    for i, label in enumerate(column_labels):
-        values = all_values[i]
-        if isinstance(values, np.ndarray):
-            values = values.tolist()
-        values = sorted(values)
-        if drop_first:
-            values = values[1:]
-
-        def column_name(value):
-            if prefix is None or prefix[i] == "":
-                return value
-            else:
-                return "{}{}{}".format(prefix[i], prefix_sep, value)
-
-        for value in values:
-            remaining_columns.append(
-                (kdf[label].notnull() & (kdf[label] == value))
-                .astype(dtype)
-                .rename(column_name(value))
-            )
-        if dummy_na:
-            remaining_columns.append(kdf[label].isnull().astype(dtype).rename(column_name(np.nan)))
-
-    return kdf[remaining_columns]
+get_dummies.fit = DummyEncoder.fit  # type: ignore
 
 
 # TODO: there are many parameters to implement and support. See pandas's pd.concat.
-def concat(objs, axis=0, join="outer", ignore_index=False, sort=False) -> Union[Series, DataFrame]:
+def concat(
+    objs, axis=0, join="outer", ignore_index=False, sort=False, checkpoint_every=None
+) -> Union[Series, DataFrame]:
     """
     Concatenate Koalas objects along a particular axis with optional set logic
     along the other axes.
@@ -2012,6 +3238,10 @@ def concat(objs, axis=0, join="outer", ignore_index=False, sort=False) -> Union[
         axes are still respected in the join.
     sort : bool, default False
         Sort non-concatenation axis if it is not already aligned.
+    checkpoint_every : int, optional
+        If set, the lineage is truncated by locally checkpointing the rows of every
+        `checkpoint_every` objects, which keeps the plan small when concatenating
+        many objects along the index (axis=0). See also `DataFrame.spark.local_checkpoint`.
 
     Returns
     -------
@@ -2161,6 +3391,11 @@ def concat(objs, axis=0, join="outer", ignore_index=False, sort=False) -> Union[
     if join not in ["inner", "outer"]:
         raise ValueError("Only can inner (intersect) or outer (union) join the other axis.")
 
+    if checkpoint_every is not None and (
+        not isinstance(checkpoint_every, int) or checkpoint_every < 1
+    ):
+        raise ValueError("checkpoint_every must be a positive integer.")
+
     axis = validate_axis(axis)
     if axis == 1:
         kdfs = [obj.to_frame() if isinstance(obj, Series) else obj for obj in objs]
@@ -2199,7 +3434,14 @@ def concat(objs, axis=0, join="outer", ignore_index=False, sort=False) -> Union[
             else:
                 kdfs_not_same_anchor.append(kdf)
 
-        if len(kdfs_not_same_anchor) > 0:
+        if len(kdfs_not_same_anchor) > 1:
+            # Co-group all the DataFrames by the index at once rather than joining them
+            # one by one.
+            concat_kdf = combine_frames_on_index(
+                [concat_kdf] + kdfs_not_same_anchor, how=("inner" if join == "inner" else "full")
+            )
+            concat_kdf = concat_kdf[column_labels]
+        elif len(kdfs_not_same_anchor) > 0:
 
             def resolve_func(kdf, this_column_labels, that_column_labels):
                 raise AssertionError("This should not happen.")
@@ -2270,7 +3512,7 @@ def concat(objs, axis=0, join="outer", ignore_index=False, sort=False) -> Union[
         idx == column_labels_of_kdfs[0] for idx in column_labels_of_kdfs
     ):
         # If all columns are in the same order and values, use it.
-        kdfs = objs
+        merged_columns = column_labels_of_kdfs[0]
     else:
         if join == "inner":
             interested_columns = set.intersection(*map(set, column_labels_of_kdfs))
@@ -2284,12 +3526,14 @@ def concat(objs, axis=0, join="outer", ignore_index=False, sort=False) -> Union[
             if (len(merged_columns) > 0 and len(merged_columns[0]) > 1) or sort:
                 # FIXME: better ordering
                 merged_columns = sorted(merged_columns, key=name_like_string)
-
-            kdfs = [kdf[merged_columns] for kdf in objs]
         elif join == "outer":
             merged_columns = []
+            seen_columns = set()
             for labels in column_labels_of_kdfs:
-                merged_columns.extend(label for label in labels if label not in merged_columns)
+                for label in labels:
+                    if label not in seen_columns:
+                        seen_columns.add(label)
+                        merged_columns.append(label)
 
             assert len(merged_columns) > 0
 
@@ -2305,61 +3549,73 @@ def concat(objs, axis=0, join="outer", ignore_index=False, sort=False) -> Union[
                 # FIXME: better ordering
                 merged_columns = sorted(merged_columns, key=name_like_string)
 
-            kdfs = []
-            for kdf in objs:
-                columns_to_add = list(set(merged_columns) - set(kdf._internal.column_labels))
-
-                # TODO: NaN and None difference for missing values. pandas seems filling NaN.
-                sdf = kdf._internal.resolved_copy.spark_frame
-                for label in columns_to_add:
-                    sdf = sdf.withColumn(name_like_string(label), F.lit(None))
-
-                data_columns = kdf._internal.data_spark_column_names + [
-                    name_like_string(label) for label in columns_to_add
-                ]
-                kdf = DataFrame(
-                    kdf._internal.copy(
-                        spark_frame=sdf,
-                        index_spark_columns=[
-                            scol_for(sdf, col) for col in kdf._internal.index_spark_column_names
-                        ],
-                        column_labels=(kdf._internal.column_labels + columns_to_add),
-                        data_spark_columns=[scol_for(sdf, col) for col in data_columns],
-                        data_dtypes=(kdf._internal.data_dtypes + ([None] * len(columns_to_add))),
-                    )
-                )
-
-                kdfs.append(kdf[merged_columns])
+    # Reconcile the schemas once: the columns missing in an object are filled with nulls
+    # of the type of the first object having them, and every object is projected only once
+    # into the same layout.
+    first_internal = objs[0]._internal
+    spark_types = {}  # type: Dict[Tuple, DataType]
+    for kdf in objs:
+        for label in kdf._internal.column_labels:
+            if label not in spark_types:
+                spark_types[label] = kdf._internal.spark_type_for(label)
 
     if ignore_index:
-        sdfs = [kdf._internal.spark_frame.select(kdf._internal.data_spark_columns) for kdf in kdfs]
+        index_spark_column_names = []  # type: List[str]
+        index_names = []  # type: List
+        index_dtypes = []  # type: List
     else:
-        sdfs = [
-            kdf._internal.spark_frame.select(
-                kdf._internal.index_spark_columns + kdf._internal.data_spark_columns
+        index_spark_column_names = first_internal.index_spark_column_names
+        index_names = first_internal.index_names
+        index_dtypes = first_internal.index_dtypes
+
+    first_column_labels = set(first_internal.column_labels)
+    data_spark_column_names = [
+        first_internal.spark_column_name_for(label)
+        if label in first_column_labels
+        else name_like_string(label)
+        for label in merged_columns
+    ]
+
+    sdfs = []
+    for kdf in objs:
+        internal = kdf._internal
+        column_labels = set(internal.column_labels)
+        # TODO: NaN and None difference for missing values. pandas seems filling NaN.
+        sdfs.append(
+            internal.spark_frame.select(
+                [
+                    scol.alias(name)
+                    for scol, name in zip(
+                        internal.index_spark_columns[: len(index_spark_column_names)],
+                        index_spark_column_names,
+                    )
+                ]
+                + [
+                    (
+                        internal.spark_column_for(label)
+                        if label in column_labels
+                        else F.lit(None).cast(spark_types[label])
+                    ).alias(name)
+                    for label, name in zip(merged_columns, data_spark_column_names)
+                ]
             )
-            for kdf in kdfs
-        ]
-    concatenated = reduce(lambda x, y: x.union(y), sdfs)
+        )
 
-    if ignore_index:
-        index_spark_column_names = []
-        index_names = []
-        index_dtypes = []
-    else:
-        index_spark_column_names = kdfs[0]._internal.index_spark_column_names
-        index_names = kdfs[0]._internal.index_names
-        index_dtypes = kdfs[0]._internal.index_dtypes
+    if checkpoint_every is not None:
+        sdfs = [
+            _union_all(sdfs[i : i + checkpoint_every]).localCheckpoint(eager=True)
+            for i in _range(0, len(sdfs), checkpoint_every)
+        ]
+    concatenated = _union_all(sdfs)
 
     result_kdf = DataFrame(
-        kdfs[0]._internal.copy(
+        first_internal.copy(
             spark_frame=concatenated,
             index_spark_columns=[scol_for(concatenated, col) for col in index_spark_column_names],
             index_names=index_names,
             index_dtypes=index_dtypes,
-            data_spark_columns=[
-                scol_for(concatenated, col) for col in kdfs[0]._internal.data_spark_column_names
-            ],
+            column_labels=merged_columns,
+            data_spark_columns=[scol_for(concatenated, col) for col in data_spark_column_names],
             data_dtypes=None,  # TODO: dtypes?
         )
     )  # type: DataFrame
@@ -2375,6 +3631,22 @@ def concat(objs, axis=0, join="outer", ignore_index=False, sort=False) -> Union[
         return result_kdf
 
 
+def _union_all(sdfs: List[spark.DataFrame]) -> spark.DataFrame:
+    """
+    Union the given Spark DataFrames in order, pairing them up as a balanced tree.
+
+    Spark flattens the unions into a single node, but every `union` call analyzes the plan
+    built so far; pairing them up keeps the total analysis `O(n log n)` instead of `O(n^2)`
+    with a chain of unions.
+    """
+    while len(sdfs) > 1:
+        sdfs = [
+            sdfs[i].union(sdfs[i + 1]) if i + 1 < len(sdfs) else sdfs[i]
+            for i in _range(0, len(sdfs), 2)
+        ]
+    return sdfs[0]
+
+
 def melt(frame, id_vars=None, value_vars=None, var_name=None, value_name="value") -> DataFrame:
     return DataFrame.melt(frame, id_vars, value_vars, var_name, value_name)
 
@@ -2548,6 +3820,7 @@ def merge(
     left_index: bool = False,
     right_index: bool = False,
     suffixes: Tuple[str, str] = ("_x", "_y"),
+    skew: Optional[Union[str, List[Any]]] = None,
 ) -> "DataFrame":
     """
     Merge DataFrame objects with a database-style join.
@@ -2590,6 +3863,9 @@ def merge(
         left_index.
     suffixes: Suffix to apply to overlapping column names in the left and right side,
         respectively.
+    skew: 'auto' or list of the skewed keys, optional.
+        The join keys which are so frequent that their rows make straggler tasks.
+        See `DataFrame.merge` for details.
 
     Returns
     -------
@@ -2668,9 +3944,545 @@ def merge(
         left_index=left_index,
         right_index=right_index,
         suffixes=suffixes,
+        skew=skew,
     )
 
 
+def merge_asof(
+    left: Union[DataFrame, Series],
+    right: Union[DataFrame, Series],
+    on: Optional[Union[Any, Tuple]] = None,
+    left_on: Optional[Union[Any, Tuple]] = None,
+    right_on: Optional[Union[Any, Tuple]] = None,
+    left_index: bool = False,
+    right_index: bool = False,
+    by: Optional[Union[Any, List[Any], Tuple, List[Tuple]]] = None,
+    left_by: Optional[Union[Any, List[Any], Tuple, List[Tuple]]] = None,
+    right_by: Optional[Union[Any, List[Any], Tuple, List[Tuple]]] = None,
+    suffixes: Tuple[str, str] = ("_x", "_y"),
+    tolerance: Optional[Any] = None,
+    allow_exact_matches: bool = True,
+    direction: str = "backward",
+) -> DataFrame:
+    """
+    Perform an asof merge.
+
+    This is similar to a left-join except that we match on nearest
+    key rather than equal keys.
+
+    For each row in the left DataFrame:
+
+      - A "backward" search selects the last row in the right DataFrame whose
+        'on' key is less than or equal to the left's key.
+
+      - A "forward" search selects the first row in the right DataFrame whose
+        'on' key is greater than or equal to the left's key.
+
+      - A "nearest" search selects the row in the right DataFrame whose 'on'
+        key is closest in absolute distance to the left's key.
+
+    Optionally match on equivalent keys with 'by' before searching with 'on'.
+
+    .. note:: Unlike pandas, the DataFrames do not have to be sorted by the key.
+        The rows are split into ranges of the key, by the approximate quantiles of the left
+        key, and matched by a sorted merge within each range (and each 'by' group), together
+        with the last (or first) row of the right DataFrame in the preceding (or following)
+        ranges. The rows of the result are not in the order of the left DataFrame.
+
+    Parameters
+    ----------
+    left : DataFrame or named Series
+    right : DataFrame or named Series
+    on : label
+        Field name to join on. Must be found in both DataFrames.
+        The data must be numeric or datetime-like.
+    left_on : label
+        Field name to join on in left DataFrame.
+    right_on : label
+        Field name to join on in right DataFrame.
+    left_index : bool
+        Use the index of the left DataFrame as the join key.
+    right_index : bool
+        Use the index of the right DataFrame as the join key.
+    by : column name or list of column names
+        Match on these columns before performing merge operation.
+    left_by : column name
+        Field names to match on in the left DataFrame.
+    right_by : column name
+        Field names to match on in the right DataFrame.
+    suffixes : 2-length sequence (tuple, list, ...)
+        Suffix to apply to overlapping column names in the left and right
+        side, respectively.
+    tolerance : int, float or Timedelta, optional, default None
+        Select asof tolerance within this range; must be compatible
+        with the merge key.
+    allow_exact_matches : bool, default True
+
+        - If True, allow matching with the same 'on' value
+          (i.e. less-than-or-equal-to / greater-than-or-equal-to)
+        - If False, don't match the same 'on' value
+          (i.e., strictly less-than / strictly greater-than).
+
+    direction : 'backward' (default), 'forward', or 'nearest'
+        Whether to search for prior, subsequent, or closest matches.
+
+    Returns
+    -------
+    merged : DataFrame
+
+    See Also
+    --------
+    merge : Merge with a database-style join.
+
+    Examples
+    --------
+    >>> left = ks.DataFrame({"a": [1, 5, 10], "left_val": ["a", "b", "c"]})
+    >>> left
+        a left_val
+    0   1        a
+    1   5        b
+    2  10        c
+
+    >>> right = ks.DataFrame({"a": [1, 2, 3, 6, 7], "right_val": [1, 2, 3, 6, 7]})
+    >>> right
+       a  right_val
+    0  1          1
+    1  2          2
+    2  3          3
+    3  6          6
+    4  7          7
+
+    >>> ks.merge_asof(left, right, on="a").sort_values("a").reset_index(drop=True)
+        a left_val  right_val
+    0   1        a          1
+    1   5        b          3
+    2  10        c          7
+
+    >>> ks.merge_asof(
+    ...     left, right, on="a", allow_exact_matches=False
+    ... ).sort_values("a").reset_index(drop=True)
+        a left_val  right_val
+    0   1        a        NaN
+    1   5        b        3.0
+    2  10        c        7.0
+
+    >>> ks.merge_asof(
+    ...     left, right, on="a", direction="forward"
+    ... ).sort_values("a").reset_index(drop=True)
+        a left_val  right_val
+    0   1        a        1.0
+    1   5        b        6.0
+    2  10        c        NaN
+
+    >>> ks.merge_asof(
+    ...     left, right, on="a", direction="nearest"
+    ... ).sort_values("a").reset_index(drop=True)
+        a left_val  right_val
+    0   1        a          1
+    1   5        b          6
+    2  10        c          7
+
+    We can use indexed DataFrames as well.
+
+    >>> left = ks.DataFrame({"left_val": ["a", "b", "c"]}, index=[1, 5, 10])
+    >>> right = ks.DataFrame({"right_val": [1, 2, 3, 6, 7]}, index=[1, 2, 3, 6, 7])
+    >>> ks.merge_asof(left, right, left_index=True, right_index=True).sort_index()
+       left_val  right_val
+    1         a          1
+    5         b          3
+    10        c          7
+
+    Here is a real-world times-series example
+
+    >>> quotes = ks.DataFrame(
+    ...     {
+    ...         "time": [
+    ...             pd.Timestamp("2016-05-25 13:30:00.023"),
+    ...             pd.Timestamp("2016-05-25 13:30:00.023"),
+    ...             pd.Timestamp("2016-05-25 13:30:00.030"),
+    ...             pd.Timestamp("2016-05-25 13:30:00.041"),
+    ...             pd.Timestamp("2016-05-25 13:30:00.048"),
+    ...             pd.Timestamp("2016-05-25 13:30:00.049"),
+    ...             pd.Timestamp("2016-05-25 13:30:00.072"),
+    ...             pd.Timestamp("2016-05-25 13:30:00.075")
+    ...         ],
+    ...         "ticker": ["GOOG", "MSFT", "MSFT", "MSFT", "GOOG", "AAPL", "GOOG", "MSFT"],
+    ...         "bid": [720.50, 51.95, 51.97, 51.99, 720.50, 97.99, 720.50, 52.01],
+    ...         "ask": [720.93, 51.96, 51.98, 52.00, 720.93, 98.01, 720.88, 52.03]
+    ...     }
+    ... )
+    >>> trades = ks.DataFrame(
+    ...     {
+    ...         "time": [
+    ...             pd.Timestamp("2016-05-25 13:30:00.023"),
+    ...             pd.Timestamp("2016-05-25 13:30:00.038"),
+    ...             pd.Timestamp("2016-05-25 13:30:00.048"),
+    ...             pd.Timestamp("2016-05-25 13:30:00.048"),
+    ...             pd.Timestamp("2016-05-25 13:30:00.048")
+    ...         ],
+    ...         "ticker": ["MSFT", "MSFT", "GOOG", "GOOG", "AAPL"],
+    ...         "price": [51.95, 51.95, 720.77, 720.92, 98.0],
+    ...         "quantity": [75, 155, 100, 100, 100]
+    ...     }
+    ... )
+
+    By default we are taking the asof of the quotes
+
+    >>> ks.merge_asof(
+    ...    trades, quotes, on="time", by="ticker"
+    ... ).sort_values(["time", "ticker", "price"]).reset_index(drop=True)
+                         time ticker   price  quantity     bid     ask
+    0 2016-05-25 13:30:00.023   MSFT   51.95        75   51.95   51.96
+    1 2016-05-25 13:30:00.038   MSFT   51.95       155   51.97   51.98
+    2 2016-05-25 13:30:00.048   AAPL   98.00       100     NaN     NaN
+    3 2016-05-25 13:30:00.048   GOOG  720.77       100  720.50  720.93
+    4 2016-05-25 13:30:00.048   GOOG  720.92       100  720.50  720.93
+
+    We only asof within 2ms between the quote time and the trade time
+
+    >>> ks.merge_asof(
+    ...     trades, quotes, on="time", by="ticker", tolerance=pd.Timedelta("2ms")
+    ... ).sort_values(["time", "ticker", "price"]).reset_index(drop=True)
+                         time ticker   price  quantity     bid     ask
+    0 2016-05-25 13:30:00.023   MSFT   51.95        75   51.95   51.96
+    1 2016-05-25 13:30:00.038   MSFT   51.95       155     NaN     NaN
+    2 2016-05-25 13:30:00.048   AAPL   98.00       100     NaN     NaN
+    3 2016-05-25 13:30:00.048   GOOG  720.77       100  720.50  720.93
+    4 2016-05-25 13:30:00.048   GOOG  720.92       100  720.50  720.93
+    """
+
+    def to_list(os: Optional[Union[Any, List[Any], Tuple, List[Tuple]]]) -> List[Tuple]:
+        if os is None:
+            return []
+        elif is_name_like_tuple(os):
+            return [os]  # type: ignore
+        elif is_name_like_value(os):
+            return [(os,)]
+        else:
+            return [o if is_name_like_tuple(o) else (o,) for o in os]
+
+    if isinstance(left, Series):
+        left = left.to_frame()
+    if isinstance(right, Series):
+        right = right.to_frame()
+
+    if direction not in ("backward", "forward", "nearest"):
+        raise ValueError("direction invalid: {}".format(direction))
+
+    if on is not None:
+        if left_on is not None or right_on is not None or left_index or right_index:
+            raise ValueError(
+                'Can only pass argument "on" OR "left_on" and "right_on", '
+                "not a combination of both."
+            )
+        left_on = right_on = on
+    if by is not None:
+        if left_by is not None or right_by is not None:
+            raise ValueError("Can only pass by OR left_by and right_by")
+        left_by = right_by = by
+
+    left_internal = left._internal.resolved_copy
+    right_internal = right._internal.resolved_copy
+
+    def resolve_key(internal, key_on, key_index, side):
+        if key_index:
+            if key_on is not None:
+                raise ValueError(
+                    'Can only pass argument "{side}_on" OR "{side}_index" not both.'.format(
+                        side=side
+                    )
+                )
+            if internal.index_level != 1:
+                raise ValueError("{} can only have one index".format(side))
+            return internal.index_spark_columns[0], None
+        labels = to_list(key_on)
+        if len(labels) == 0:
+            raise ValueError("Must pass {side}_on or {side}_index=True".format(side=side))
+        elif len(labels) > 1:
+            raise ValueError("can only asof on a key for {}".format(side))
+        return internal.spark_column_for(labels[0]), labels[0]
+
+    left_key, left_key_label = resolve_key(left_internal, left_on, left_index, "left")
+    right_key, right_key_label = resolve_key(right_internal, right_on, right_index, "right")
+
+    left_by_labels, right_by_labels = to_list(left_by), to_list(right_by)
+    if len(left_by_labels) != len(right_by_labels):
+        raise ValueError("left_by and right_by must be same length")
+    left_by_scols = [left_internal.spark_column_for(label) for label in left_by_labels]
+    right_by_scols = [right_internal.spark_column_for(label) for label in right_by_labels]
+
+    key_type = left_internal.spark_type_for(left_key)
+    right_key_type = right_internal.spark_type_for(right_key)
+    if isinstance(key_type, NumericType) and isinstance(right_key_type, NumericType):
+        if key_type != right_key_type:
+            key_type = DoubleType()
+    elif isinstance(key_type, (TimestampType, DateType)) and isinstance(
+        right_key_type, (TimestampType, DateType)
+    ):
+        if key_type != right_key_type:
+            key_type = TimestampType()
+    else:
+        raise ValueError(
+            "incompatible merge keys, both sides must have numeric or datetime-like types: "
+            "{} and {}".format(key_type.simpleString(), right_key_type.simpleString())
+        )
+
+    if isinstance(key_type, NumericType):
+        to_double = lambda scol: scol.cast(DoubleType())
+    else:
+        to_double = lambda scol: scol.cast(TimestampType()).cast(DoubleType())
+
+    if tolerance is not None:
+        if isinstance(key_type, NumericType):
+            if not isinstance(tolerance, (int, float)) or isinstance(tolerance, bool):
+                raise ValueError("key must be integer, timestamp or float")
+            tolerance_value = float(tolerance)
+        else:
+            if not isinstance(tolerance, (datetime.timedelta, np.timedelta64)):
+                raise ValueError(
+                    "incompatible tolerance {}, must be compat with type {}".format(
+                        tolerance, key_type.simpleString()
+                    )
+                )
+            tolerance_value = pd.Timedelta(tolerance).total_seconds()
+        if tolerance_value < 0:
+            raise ValueError("tolerance must be positive")
+
+    # The right columns carried to each matched left row.
+    right_payload = list(right_internal.data_spark_columns)
+    if left_index and not right_index:
+        right_payload = right_payload + list(right_internal.index_spark_columns)
+
+    lsdf = left_internal.spark_frame
+    rsdf = right_internal.spark_frame
+    left_struct = F.struct(
+        *[scol_for(lsdf, col) for col in lsdf.columns if col not in HIDDEN_COLUMNS]
+    )
+    right_struct = F.struct(
+        [right_key.cast(key_type).alias("key")]
+        + [scol.alias("_{}".format(i)) for i, scol in enumerate(right_payload)]
+    )
+    left_struct_type = lsdf.select(left_struct).schema[0].dataType
+    right_struct_type = rsdf.select(right_struct).schema[0].dataType
+    by_types = [left_internal.spark_type_for(scol) for scol in left_by_scols]
+    by_columns = ["__asof_by_{}__".format(i) for i, _ in enumerate(left_by_scols)]
+    natural_order = NATURAL_ORDER_COLUMN_NAME
+
+    # Both sides in one frame: the left rows carry their own row, the right rows the match.
+    left_rows = lsdf.select(
+        [scol.alias(col) for scol, col in zip(left_by_scols, by_columns)]
+        + [
+            left_key.cast(key_type).alias("__asof_key__"),
+            F.lit(1).alias("__asof_is_left__"),
+            scol_for(lsdf, natural_order).alias("__asof_order__"),
+            left_struct.alias("__asof_left__"),
+            F.lit(None).cast(right_struct_type).alias("__asof_right__"),
+        ]
+    )
+    right_rows = rsdf.filter(right_key.isNotNull()).select(
+        [
+            scol.cast(spark_type).alias(col)
+            for scol, spark_type, col in zip(right_by_scols, by_types, by_columns)
+        ]
+        + [
+            right_key.cast(key_type).alias("__asof_key__"),
+            F.lit(0).alias("__asof_is_left__"),
+            scol_for(rsdf, natural_order).alias("__asof_order__"),
+            F.lit(None).cast(left_struct_type).alias("__asof_left__"),
+            right_struct.alias("__asof_right__"),
+        ]
+    )
+    sdf = left_rows.union(right_rows)
+
+    # Split the key into ranges by the approximate quantiles of the left key.
+    num_buckets = int(default_session().conf.get("spark.sql.shuffle.partitions"))
+    cuts = []  # type: List[float]
+    if num_buckets > 1:
+        quantiles = left_rows.select(
+            to_double(scol_for(left_rows, "__asof_key__")).alias("__asof_key__")
+        ).approxQuantile(
+            "__asof_key__", list(np.arange(1, num_buckets) / num_buckets), 1 / (4 * num_buckets),
+        )
+        cuts = sorted(set(q for q in quantiles if q is not None and not np.isnan(q)))
+
+    def bucket_of(scol, lower, upper):
+        if lower == upper:
+            return F.lit(lower)
+        middle = (lower + upper) // 2
+        return F.when(scol < F.lit(cuts[middle]), bucket_of(scol, lower, middle)).otherwise(
+            bucket_of(scol, middle + 1, upper)
+        )
+
+    sdf = sdf.withColumn(
+        "__asof_bucket__", bucket_of(to_double(scol_for(sdf, "__asof_key__")), 0, len(cuts))
+    )
+    columns = sdf.columns
+
+    # The last (first) right row of the preceding (following) ranges are added to each range.
+    is_right = scol_for(sdf, "__asof_is_left__") == 0
+    right_row = F.struct(
+        scol_for(sdf, "__asof_key__"),
+        scol_for(sdf, "__asof_order__"),
+        scol_for(sdf, "__asof_right__"),
+    )
+    aggs = [F.max(scol_for(sdf, "__asof_is_left__")).alias("__asof_has_left__")]
+    if direction in ("backward", "nearest"):
+        aggs.append(F.max(F.when(is_right, right_row)).alias("__asof_last__"))
+    if direction in ("forward", "nearest"):
+        aggs.append(F.min(F.when(is_right, right_row)).alias("__asof_first__"))
+    ranges = sdf.groupby(*by_columns, "__asof_bucket__").agg(*aggs)
+
+    # The ranges are few per group, so a single partition is fine without 'by' keys.
+    window = Window.partitionBy(*(by_columns or [F.lit(0)])).orderBy("__asof_bucket__")
+    carries = []
+    if direction in ("backward", "nearest"):
+        carries.append(
+            F.max("__asof_last__").over(window.rowsBetween(Window.unboundedPreceding, -1))
+        )
+    if direction in ("forward", "nearest"):
+        carries.append(
+            F.min("__asof_first__").over(window.rowsBetween(1, Window.unboundedFollowing))
+        )
+    for carry in carries:
+        carried = (
+            ranges.select(
+                *by_columns, "__asof_bucket__", "__asof_has_left__", carry.alias("__asof_carry__")
+            )
+            .filter((F.col("__asof_has_left__") == 1) & F.col("__asof_carry__").isNotNull())
+            .select(
+                by_columns
+                + [
+                    F.col("__asof_carry__.__asof_key__").alias("__asof_key__"),
+                    F.lit(0).alias("__asof_is_left__"),
+                    F.col("__asof_carry__.__asof_order__").alias("__asof_order__"),
+                    F.lit(None).cast(left_struct_type).alias("__asof_left__"),
+                    F.col("__asof_carry__.__asof_right__").alias("__asof_right__"),
+                    "__asof_bucket__",
+                ]
+            )
+        )
+        sdf = sdf.union(carried.select(columns))
+
+    # Sorted merge within each range.
+    partition = Window.partitionBy(*by_columns, "__asof_bucket__")
+
+    def match(search_direction):
+        # Which side comes first among the same keys decides whether exact matches are found.
+        if (search_direction == "backward") == allow_exact_matches:
+            tie = F.col("__asof_is_left__")
+        else:
+            tie = -F.col("__asof_is_left__")
+        window = partition.orderBy("__asof_key__", tie, "__asof_order__")
+        if search_direction == "backward":
+            return F.last("__asof_right__", ignorenulls=True).over(
+                window.rowsBetween(Window.unboundedPreceding, Window.currentRow)
+            )
+        else:
+            return F.first("__asof_right__", ignorenulls=True).over(
+                window.rowsBetween(Window.currentRow, Window.unboundedFollowing)
+            )
+
+    if direction == "nearest":
+        matches = [match("backward"), match("forward")]
+    else:
+        matches = [match(direction)]
+    sdf = sdf.select(
+        ["__asof_key__", "__asof_left__"]
+        + [scol.alias("__asof_match_{}__".format(i)) for i, scol in enumerate(matches)]
+    ).filter(F.col("__asof_left__").isNotNull())
+
+    key = to_double(F.col("__asof_key__"))
+    distance = lambda scol: F.abs(key - to_double(scol["key"]))
+    matched = F.col("__asof_match_0__")
+    if direction == "nearest":
+        forward = F.col("__asof_match_1__")
+        matched = F.when(
+            forward.isNull() | (matched.isNotNull() & (distance(matched) <= distance(forward))),
+            matched,
+        ).otherwise(forward)
+    if tolerance is not None:
+        matched = F.when(distance(matched) <= F.lit(tolerance_value), matched)
+    sdf = sdf.select(
+        "__asof_left__", F.when(F.col("__asof_key__").isNotNull(), matched).alias("__asof_match__")
+    )
+
+    # The same column labelling as `DataFrame.merge`.
+    shared_labels = set()
+    if left_key_label is not None and left_key_label == right_key_label:
+        shared_labels.add(right_key_label)
+    for left_label, right_label in zip(left_by_labels, right_by_labels):
+        if left_label == right_label:
+            shared_labels.add(right_label)
+    right_labels = [label for label in right_internal.column_labels if label not in shared_labels]
+    duplicate_labels = set(left_internal.column_labels) & set(right_labels)
+
+    def suffixed(label, suffix):
+        if label in duplicate_labels:
+            return tuple([str(label[0]) + suffix] + list(label[1:]))
+        else:
+            return label
+
+    left_value = lambda scol: F.col("__asof_left__")[lsdf.select(scol).columns[0]]
+    right_value = lambda i: F.col("__asof_match__")["_{}".format(i)]
+
+    exprs = []
+    column_labels = []
+    data_dtypes = []
+    for label, scol, dtype in zip(
+        left_internal.column_labels, left_internal.data_spark_columns, left_internal.data_dtypes
+    ):
+        label = suffixed(label, suffixes[0])
+        exprs.append(left_value(scol).alias(name_like_string(label)))
+        column_labels.append(label)
+        data_dtypes.append(dtype)
+    for i, (label, dtype) in enumerate(
+        zip(right_internal.column_labels, right_internal.data_dtypes)
+    ):
+        if label in shared_labels:
+            continue
+        label = suffixed(label, suffixes[1])
+        exprs.append(right_value(i).alias(name_like_string(label)))
+        column_labels.append(label)
+        data_dtypes.append(dtype)
+
+    if left_index and not right_index:
+        offset = len(right_internal.data_spark_columns)
+        index_scols = [
+            right_value(offset + i) for i, _ in enumerate(right_internal.index_spark_columns)
+        ]
+        index_names = right_internal.index_names
+        index_dtypes = right_internal.index_dtypes
+    elif left_index or right_index:
+        index_scols = [left_value(scol) for scol in left_internal.index_spark_columns]
+        index_names = left_internal.index_names
+        index_dtypes = left_internal.index_dtypes
+    else:
+        index_scols = []
+
+    if len(index_scols) > 0:
+        index_columns = [SPARK_INDEX_NAME_FORMAT(i) for i, _ in enumerate(index_scols)]
+        sdf = sdf.select([scol.alias(col) for scol, col in zip(index_scols, index_columns)] + exprs)
+        internal = InternalFrame(
+            spark_frame=sdf,
+            index_spark_columns=[scol_for(sdf, col) for col in index_columns],
+            index_names=index_names,
+            index_dtypes=index_dtypes,
+            column_labels=column_labels,
+            data_spark_columns=[scol_for(sdf, col) for col in sdf.columns[len(index_columns) :]],
+            data_dtypes=data_dtypes,
+        )
+    else:
+        sdf = sdf.select(exprs)
+        internal = InternalFrame(
+            spark_frame=sdf,
+            index_spark_columns=None,
+            column_labels=column_labels,
+            data_spark_columns=[scol_for(sdf, col) for col in sdf.columns],
+            data_dtypes=data_dtypes,
+        )
+    return DataFrame(internal)
+
+
 def to_numeric(arg):
     """
     Convert argument to a numeric type.
@@ -2788,11 +4600,15 @@ def read_orc(
     path,
     columns: Optional[List[str]] = None,
     index_col: Optional[Union[str, List[str]]] = None,
+    filters: Optional[Union[str, spark.Column, List]] = None,
     **options
 ) -> "DataFrame":
     """
     Load an ORC object from the file path, returning a DataFrame.
 
+    The columns and the row filters are applied to the scan before the default index is
+    attached, so that Spark prunes the columns and pushes the filters down into the files.
+
     Parameters
     ----------
     path : str
@@ -2801,6 +4617,8 @@ def read_orc(
         If not None, only these columns will be read from the file.
     index_col : str or list of str, optional, default: None
         Index column of table in Spark.
+    filters : str, Column or list, default None
+        The row filters applied when reading the files. See `read_parquet`.
     options : dict
         All other options passed directly into Spark's data source.
 
@@ -2827,19 +4645,10 @@ def read_orc(
     if "options" in options and isinstance(options.get("options"), dict) and len(options) == 1:
         options = options.get("options")  # type: ignore
 
-    kdf = read_spark_io(path, format="orc", index_col=index_col, **options)
-
+    sdf = default_session().read.load(path=path, format="orc", **options)
     if columns is not None:
-        kdf_columns = kdf.columns
-        new_columns = list()
-        for column in list(columns):
-            if column in kdf_columns:
-                new_columns.append(column)
-            else:
-                raise ValueError("Unknown column name '{}'".format(column))
-        kdf = kdf[new_columns]
-
-    return kdf
+        columns = _validate_columns_to_read(sdf, columns, index_col)
+    return _to_pruned_frame(sdf, index_col, columns, filters)
 
 
 def _get_index_map(
@@ -2861,16 +4670,3 @@ def _get_index_map(
         index_names = None
 
     return index_spark_columns, index_names
-
-
-_get_dummies_default_accept_types = (DecimalType, StringType, DateType)
-_get_dummies_acceptable_types = _get_dummies_default_accept_types + (
-    ByteType,
-    ShortType,
-    IntegerType,
-    LongType,
-    FloatType,
-    DoubleType,
-    BooleanType,
-    TimestampType,
-)
@@ -25,7 +25,7 @@ import warnings
 from collections.abc import Mapping
 from distutils.version import LooseVersion
 from functools import partial, wraps, reduce
-from typing import Any, Generic, Iterable, List, Optional, Tuple, TypeVar, Union, cast
+from typing import Any, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union, cast
 
 import numpy as np
 import pandas as pd
@@ -39,6 +39,7 @@ from pyspark import sql as spark
 from pyspark.sql import functions as F, Column
 from pyspark.sql.types import (
     BooleanType,
+    DateType,
     DoubleType,
     FloatType,
     IntegerType,
@@ -47,6 +48,7 @@ from pyspark.sql.types import (
     StructType,
     IntegralType,
     ArrayType,
+    TimestampType,
 )
 from pyspark.sql.window import Window
 
@@ -56,7 +58,13 @@ from databricks.koalas.categorical import CategoricalAccessor
 from databricks.koalas.config import get_option
 from databricks.koalas.base import IndexOpsMixin
 from databricks.koalas.exceptions import SparkPandasIndexingError
-from databricks.koalas.frame import DataFrame
+from databricks.koalas.frame import (
+    DataFrame,
+    _pivot_values,
+    _render_in_batches,
+    _to_clipboard_in_batches,
+    _write_texts,
+)
 from databricks.koalas.generic import Frame
 from databricks.koalas.internal import (
     InternalFrame,
@@ -1417,11 +1425,16 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
             kseries._to_internal_pandas(), self.to_string, pd.Series.to_string, args
         )
 
-    def to_clipboard(self, excel=True, sep=None, **kwargs) -> None:
+    def to_clipboard(self, excel=True, sep=None, batch_size=None, **kwargs) -> None:
         # Docstring defined below by reusing DataFrame.to_clipboard's.
         args = locals()
         kseries = self
 
+        if batch_size is not None:
+            batches = kseries._to_internal_pandas_batches(batch_size)
+            _to_clipboard_in_batches(batches, excel, sep, kwargs)
+            return None
+
         return validate_arguments_and_invoke_function(
             kseries._to_internal_pandas(), self.to_clipboard, pd.Series.to_clipboard, args
         )
@@ -1491,10 +1504,29 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
         multicolumn=None,
         multicolumn_format=None,
         multirow=None,
+        batch_size=None,
     ) -> Optional[str]:
 
         args = locals()
         kseries = self
+
+        if batch_size is not None:
+            if longtable:
+                raise ValueError("longtable is not supported with batch_size.")
+
+            def render(pser, first):
+                batch_args = dict(args, buf=None, batch_size=None)
+                if not first:
+                    batch_args["header"] = False
+                return validate_arguments_and_invoke_function(
+                    pser, self.to_latex, pd.Series.to_latex, batch_args
+                )
+
+            batches = kseries._to_internal_pandas_batches(batch_size)
+            return _write_texts(
+                _render_in_batches(render, batches, "\\toprule\n", "\\bottomrule"), buf
+            )
+
         return validate_arguments_and_invoke_function(
             kseries._to_internal_pandas(), self.to_latex, pd.Series.to_latex, args
         )
@@ -3432,19 +3464,23 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
         Compute numerical data ranks (1 through n) along axis. Equal values are
         assigned a rank that is the average of the ranks of those values.
 
-        .. note:: the current implementation of rank uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
+        .. note:: the ranks are computed by counting the rows of each distinct value,
+            ranking the distinct values within range partitions in parallel, and joining
+            them back. This takes a few jobs, but never moves all data into a single
+            partition.
 
         Parameters
         ----------
-        method : {'average', 'min', 'max', 'first', 'dense'}
+        method : {'average', 'min', 'max', 'first', 'dense', 'approx'}
             * average: average rank of group
             * min: lowest rank in group
             * max: highest rank in group
             * first: ranks assigned in order they appear in the array
             * dense: like 'min', but rank always increases by 1 between groups
+            * approx: the rank estimated from 1000 approximate quantiles of numeric values,
+              within 0.11% of the number of rows plus one from the 'min' rank: 0.1% from
+              the quantiles and 0.01% from their accuracy. Missing values are not ranked.
+              It takes a single aggregation and no join.
         ascending : boolean, default True
             False for ranks by high (1) to low (N)
 
@@ -3504,8 +3540,17 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
         2    2.0
         3    3.0
         Name: A, dtype: float64
+
+        If method is set to 'approx', the ranks are estimated from the quantiles.
+
+        >>> s.rank(method='approx')
+        0    1.0
+        1    2.0
+        2    2.0
+        3    4.0
+        Name: A, dtype: float64
         """
-        return self._rank(method, ascending).spark.analyzed
+        return first_series(self.to_frame().rank(method, ascending)).rename(self.name)
 
     def _rank(self, method="average", ascending=True, *, part_cols=()):
         if method not in ["average", "min", "max", "first", "dense"]:
@@ -5082,34 +5127,67 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
         >>> s.asof(30)
         2.0
         """
-        should_return_series = True
         if isinstance(self.index, ks.MultiIndex):
             raise ValueError("asof is not supported for a MultiIndex")
         if isinstance(where, (ks.Index, ks.Series, DataFrame)):
             raise ValueError("where cannot be an Index, Series or a DataFrame")
+        key_directory = self._kdf._internal.key_directory
+        if key_directory is not None and not is_list_like(where):
+            result = key_directory.asof(self._kdf._internal, self.spark.column, where)
+            if result is not None:
+                return result
         if not self.index.is_monotonic_increasing:
             raise ValueError("asof requires a sorted index")
-        if not is_list_like(where):
-            should_return_series = False
-            where = [where]
         index_scol = self._internal.index_spark_columns[0]
         index_type = self._internal.spark_type_for(index_scol)
-        cond = [
-            F.max(F.when(index_scol <= F.lit(index).cast(index_type), self.spark.column))
-            for index in where
-        ]
-        sdf = self._internal.spark_frame.select(cond)
-        if not should_return_series:
+        not_null = self.spark.column.isNotNull()
+        if isinstance(self.spark.data_type, (FloatType, DoubleType)):
+            not_null = not_null & ~F.isnan(self.spark.column)
+
+        def last_value(index):
+            # The value at the largest index not greater than `index`.
+            cond = (index_scol <= F.lit(index).cast(index_type)) & not_null
+            last = F.max(F.when(cond, F.struct(index_scol, self.spark.column.alias("value"))))
+            return last["value"]
+
+        if not is_list_like(where):
+            sdf = self._internal.spark_frame.select(last_value(where))
             with sql_conf({SPARK_CONF_ARROW_ENABLED: False}):
                 # Disable Arrow to keep row ordering.
                 result = sdf.limit(1).toPandas().iloc[0, 0]
             return result if result is not None else np.nan
 
-        # The data is expected to be small so it's fine to transpose/use default index.
-        with ks.option_context("compute.default_index_type", "distributed", "compute.max_rows", 1):
-            kdf = ks.DataFrame(sdf)  # type: DataFrame
-            kdf.columns = pd.Index(where)
-            return first_series(kdf.transpose()).rename(self.name)
+        if not isinstance(index_type, (NumericType, TimestampType, DateType)):
+            # `merge_asof` only supports numeric or datetime-like keys, so take an aggregate
+            # per point for the other index types.
+            sdf = self._internal.spark_frame.select(
+                [last_value(index).alias(str(i)) for i, index in enumerate(where)]
+            )
+            # The data is expected to be small so it's fine to transpose/use default index.
+            with ks.option_context(
+                "compute.default_index_type", "distributed", "compute.max_rows", 1
+            ):
+                kdf = ks.DataFrame(sdf)  # type: DataFrame
+                kdf.columns = pd.Index(where)
+                return first_series(kdf.transpose()).rename(self.name)
+
+        # Match all the `where` points at once by an as-of merge, rather than
+        # an aggregate per point.
+        kdf = ks.DataFrame({"__where__": list(where)})  # type: DataFrame
+        kdf["__where__"] = kdf["__where__"].spark.transform(lambda scol: scol.cast(index_type))
+        right = self.rename("__value__").dropna().to_frame()
+        internal = (
+            ks.merge_asof(kdf, right, left_on="__where__", right_index=True).sort_index()._internal
+        )
+        internal = internal.copy(
+            index_spark_columns=[internal.spark_column_for(("__where__",))],
+            index_names=[None],
+            index_dtypes=[internal.dtype_for(("__where__",))],
+            column_labels=[("__value__",)],
+            data_spark_columns=[internal.spark_column_for(("__value__",))],
+            data_dtypes=[internal.dtype_for(("__value__",))],
+        )
+        return first_series(DataFrame(internal)).rename(self.name)
 
     def mad(self) -> float:
         """
@@ -5193,6 +5271,8 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
                 )
             )
 
+        pivot_values = _pivot_values(self._internal, self._internal.index_spark_columns[level])
+
         internal = self._internal.resolved_copy
 
         index_map = list(zip(internal.index_spark_column_names, internal.index_names))
@@ -5201,7 +5281,11 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
         col = internal.data_spark_column_names[0]
 
         sdf = internal.spark_frame
-        sdf = sdf.groupby(list(index_scol_names)).pivot(pivot_col).agg(F.first(scol_for(sdf, col)))
+        sdf = (
+            sdf.groupby(list(index_scol_names))
+            .pivot(pivot_col, pivot_values)
+            .agg(F.first(scol_for(sdf, col)))
+        )
         internal = InternalFrame(  # TODO: dtypes?
             spark_frame=sdf,
             index_spark_columns=[scol_for(sdf, col) for col in index_scol_names],
@@ -6160,6 +6244,15 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
         """
         return self._kdf._internal.to_pandas_frame[self.name]
 
+    def _to_internal_pandas_batches(self, batch_size: int) -> Iterator[pd.Series]:
+        """
+        Return pandas Series of at most `batch_size` rows in order, loading only a partition
+        into the driver at a time.
+
+        This method is for internal use only.
+        """
+        return (pdf[self.name] for pdf in self._kdf._to_internal_pandas_batches(batch_size))
+
     def __repr__(self):
         max_display_count = get_option("display.max_rows")
         if max_display_count is None:
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import glob
+import io
 import os
 import shutil
 import tempfile
@@ -22,6 +24,7 @@ import pandas as pd
 import numpy as np
 
 from databricks import koalas as ks
+from databricks.koalas.namespace import _INFERRED_SCHEMAS
 from databricks.koalas.testing.utils import ReusedSQLTestCase, TestUtils
 
 
@@ -267,6 +270,19 @@ class CsvTest(ReusedSQLTestCase, TestUtils):
             ValueError, "parse_dates", lambda: ks.read_csv("path", parse_dates=True)
         )
 
+        csv_text = normalize_text(
+            """
+            name,date
+            Alice,2020-01-01 00:00:00
+            Bob,2020-01-02 12:30:00
+            """
+        )
+        with self.csv_file(csv_text) as fn:
+            self.assert_eq(
+                ks.read_csv(fn, parse_dates=["date"]), pd.read_csv(fn, parse_dates=["date"])
+            )
+            self.assert_eq(ks.read_csv(fn, parse_dates=[1]), pd.read_csv(fn, parse_dates=[1]))
+
     def test_read_csv_with_dtype(self):
         with self.csv_file(self.csv_text) as fn:
             self.assert_eq(ks.read_csv(fn), pd.read_csv(fn), almost=True)
@@ -276,6 +292,36 @@ class CsvTest(ReusedSQLTestCase, TestUtils):
                 pd.read_csv(fn, dtype={"amount": "int64"}),
             )
 
+    def test_read_csv_with_infer_schema(self):
+        with self.csv_file(self.csv_text) as fn:
+            self.assert_eq(
+                ks.read_csv(fn, infer_schema="sample", sampling_ratio=1.0), pd.read_csv(fn)
+            )
+            self.assert_eq(ks.read_csv(fn, infer_schema=False), pd.read_csv(fn, dtype=str))
+
+            with self.temp_dir() as schema_cache:
+                _INFERRED_SCHEMAS.clear()
+                self.assert_eq(ks.read_csv(fn, schema_cache=schema_cache), pd.read_csv(fn))
+                self.assertEqual(len(_INFERRED_SCHEMAS), 1)
+                self.assertEqual(len(glob.glob(os.path.join(schema_cache, "*.json"))), 1)
+
+                _INFERRED_SCHEMAS.clear()
+                self.assert_eq(ks.read_csv(fn, schema_cache=schema_cache), pd.read_csv(fn))
+                self.assertEqual(len(_INFERRED_SCHEMAS), 1)
+                self.assertEqual(len(glob.glob(os.path.join(schema_cache, "*.json"))), 1)
+
+                pdf = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+                ks.from_pandas(pdf).to_json(os.path.join(self.tmp_dir, "json"), num_files=1)
+                self.assert_eq(
+                    ks.read_json(os.path.join(self.tmp_dir, "json"), schema_cache=schema_cache),
+                    pdf,
+                )
+                self.assertEqual(len(glob.glob(os.path.join(schema_cache, "*.json"))), 2)
+
+        self.assertRaisesRegex(
+            ValueError, "infer_schema", lambda: ks.read_csv("path", infer_schema="all")
+        )
+
     def test_read_csv_with_quotechar(self):
         with self.csv_file(self.q_quoted_csv_text) as fn:
             self.assert_eq(
@@ -418,3 +464,69 @@ class CsvTest(ReusedSQLTestCase, TestUtils):
             output_path = "%s/%s/%s" % (self.tmp_dir, partition_path, output_paths[0])
             with open(output_path) as f:
                 self.assertEqual(f.read(), expected)
+
+    def test_to_csv_with_single_file(self):
+        pdf = pd.DataFrame({"a": list(range(100)), "b": [str(i) for i in range(100)]})
+        kdf = ks.from_pandas(pdf)
+
+        path = "{}/single.csv".format(self.tmp_dir)
+        kdf.to_csv(path, num_files=4, single_file=True)
+        self.assertTrue(os.path.isfile(path))
+        with open(path) as f:
+            self.assertEqual(f.read(), pdf.to_csv(index=False))
+
+        kdf.to_csv(path, num_files=4, single_file=True, sep="|", header=False, columns=["b"])
+        expected = pdf.to_csv(index=False, sep="|", header=False, columns=["b"])
+        with open(path) as f:
+            self.assertEqual(f.read(), expected)
+        self.assertEqual(sorted(os.listdir(self.tmp_dir)), ["single.csv"])
+
+        kdf.to_csv(path, num_files=4, single_file=True, compression="gzip")
+        self.assert_eq(pd.read_csv(path, compression="gzip"), pdf)
+        self.assertEqual(sorted(os.listdir(self.tmp_dir)), ["single.csv"])
+
+        kdf.to_csv(path, single_file=True, mode="ignore")
+        self.assert_eq(pd.read_csv(path, compression="gzip"), pdf)
+
+        with self.assertRaises(FileExistsError):
+            kdf.to_csv(path, single_file=True, mode="error")
+        with self.assertRaisesRegex(ValueError, "mode 'append' is not supported"):
+            kdf.to_csv(path, single_file=True, mode="append")
+        with self.assertRaisesRegex(ValueError, "partition_cols is not supported"):
+            kdf.to_csv(path, single_file=True, partition_cols="b")
+
+        path = "{}/single.json".format(self.tmp_dir)
+        kdf.to_json(path, num_files=4, single_file=True)
+        self.assert_eq(pd.read_json(path, lines=True, dtype=False), pdf)
+
+    def test_to_csv_with_buffer(self):
+        pdf = pd.DataFrame({"a": [1, 2, 3, None, 5], "b": ["a", "b", None, "d", "e"]})
+        kdf = ks.from_pandas(pdf)
+
+        for batch_size in [None, 1, 2]:
+            buf = io.StringIO()
+            kdf.to_csv(buf, na_rep="null", batch_size=batch_size)
+            self.assertEqual(buf.getvalue(), pdf.to_csv(index=False, na_rep="null"))
+
+            buf = io.StringIO()
+            kdf.b.to_csv(buf, header=False, batch_size=batch_size)
+            self.assertEqual(buf.getvalue(), pdf.b.to_csv(index=False, header=False))
+
+        # The nullable integral columns without missing values are written as integers.
+        big = 2 ** 53 + 1
+        kdf2 = ks.DataFrame(
+            self.spark.createDataFrame([(1, "x"), (big, None)], "a bigint, b string")
+        )
+        for batch_size in [None, 1]:
+            buf = io.StringIO()
+            kdf2.to_csv(buf, batch_size=batch_size)
+            self.assertEqual(buf.getvalue(), "a,b\n1,x\n{},\n".format(big))
+
+        buf = io.StringIO()
+        with self.assertRaisesRegex(ValueError, "index_col cannot be specified"):
+            kdf.to_csv(buf, index_col="index")
+        with self.assertRaisesRegex(ValueError, "num_files, mode cannot be specified"):
+            kdf.to_csv(buf, num_files=1, mode="append")
+        with self.assertRaisesRegex(ValueError, "compression cannot be specified"):
+            kdf.to_csv(buf, compression="gzip")
+        self.assertEqual(buf.getvalue(), "")
@@ -16,9 +16,12 @@
 from datetime import datetime
 from distutils.version import LooseVersion
 import inspect
+from itertools import product
+import os
 import sys
 import unittest
 from io import StringIO
+from urllib.parse import urlparse
 
 import numpy as np
 import pandas as pd
@@ -31,7 +34,8 @@ from pyspark.sql import functions as F
 from databricks import koalas as ks
 from databricks.koalas.config import option_context
 from databricks.koalas.exceptions import PandasNotImplementedError
-from databricks.koalas.frame import CachedDataFrame
+from databricks.koalas.frame import CachedDataFrame, _PIVOT_VALUES
+from databricks.koalas.join_planner import SALT_COLUMN_NAME
 from databricks.koalas.missing.frame import _MissingPandasLikeDataFrame
 from databricks.koalas.typedef.typehints import (
     extension_dtypes,
@@ -2151,6 +2155,120 @@ class DataFrameTest(ReusedSQLTestCase, SQLTestUtils):
             pdf.sort_values(by=list(pdf.columns)).reset_index(drop=True),
         )
 
+    def test_merge_bucketed(self):
+        left_pdf = pd.DataFrame({"k": [1, 2, 3, 4, 5], "a": list("abcde")}, index=[9, 8, 7, 6, 5])
+        right_pdf = pd.DataFrame({"k": [2, 4, 6], "b": [20.0, 40.0, 60.0]})
+        left_kdf = ks.from_pandas(left_pdf)
+        right_kdf = ks.from_pandas(right_pdf)
+
+        def num_shuffles(kdf):
+            plan = kdf._internal.spark_frame._jdf.queryExecution().executedPlan().toString()
+            return plan.count("Exchange hashpartitioning")
+
+        with self.sql_conf({"spark.sql.autoBroadcastJoinThreshold": -1}), self.table(
+            "left_bucketed", "right_bucketed"
+        ):
+            left_bucketed = left_kdf.koalas.bucket_by("k", 4, "left_bucketed")
+            self.assert_eq(left_bucketed.sort_index(), left_pdf.sort_index())
+
+            for how in ["inner", "left", "right", "outer"]:
+                with self.subTest(how=how):
+                    kdf = left_bucketed.merge(right_kdf, on="k", how=how)
+                    pdf = left_pdf.merge(right_pdf, on="k", how=how)
+                    self.assert_eq(
+                        kdf.sort_values("k").reset_index(drop=True),
+                        pdf.sort_values("k").reset_index(drop=True),
+                    )
+                    # Only the other side is shuffled.
+                    self.assertEqual(num_shuffles(kdf), 1)
+
+            right_bucketed = right_kdf.koalas.bucket_by("k", 4, "right_bucketed")
+            kdf = left_bucketed.merge(right_bucketed, on="k")
+            pdf = left_pdf.merge(right_pdf, on="k")
+            self.assert_eq(
+                kdf.sort_values("k").reset_index(drop=True),
+                pdf.sort_values("k").reset_index(drop=True),
+            )
+            self.assertEqual(num_shuffles(kdf), 0)
+
+            # The layout is recognized when reading the table again with the index restored.
+            kdf = ks.read_table("left_bucketed", index_col="__index_level_0__").merge(
+                right_bucketed, on="k"
+            )
+            self.assertEqual(num_shuffles(kdf), 0)
+
+            # Not bucketed by the join keys.
+            kdf = left_bucketed.merge(right_kdf, left_index=True, right_on="k")
+            self.assertEqual(num_shuffles(kdf), 2)
+
+        self.assertRaises(KeyError, lambda: left_kdf.koalas.bucket_by("x", 4, "left_bucketed"))
+        self.assertRaises(ValueError, lambda: left_kdf.koalas.bucket_by("k", 0, "left_bucketed"))
+
+    def test_merge_broadcast_by_size(self):
+        left_kdf = ks.DataFrame({"k": [1, 2, 3], "a": list("abc")})
+        right_kdf = ks.DataFrame({"k": [2, 3, 4], "b": list("xyz")})
+
+        plan = left_kdf.merge(right_kdf, on="k")._internal.spark_frame._jdf.queryExecution()
+        self.assertIn("ResolvedHint", plan.analyzed().toString())
+
+        with self.sql_conf({"spark.sql.autoBroadcastJoinThreshold": -1}):
+            plan = left_kdf.merge(right_kdf, on="k")._internal.spark_frame._jdf.queryExecution()
+            self.assertNotIn("ResolvedHint", plan.analyzed().toString())
+
+    def test_merge_skew(self):
+        left_pdf = pd.DataFrame(
+            {"k": [-1] * 300 + list(range(100)), "a": range(400)}, index=range(1000, 1400)
+        )
+        right_pdf = pd.DataFrame({"k": [-1, 1, 2, 3, 200], "b": list("vwxyz")})
+        left_kdf = ks.from_pandas(left_pdf)
+        right_kdf = ks.from_pandas(right_pdf)
+
+        with self.sql_conf({"spark.sql.autoBroadcastJoinThreshold": -1}):
+            for how, skew in product(["inner", "left", "right", "outer"], ["auto", [-1], [-1, 3]]):
+                with self.subTest(how=how, skew=skew):
+                    kdf = left_kdf.merge(right_kdf, on="k", how=how, skew=skew)
+                    pdf = left_pdf.merge(right_pdf, on="k", how=how)
+                    self.assert_eq(
+                        kdf.sort_values(["k", "a"]).reset_index(drop=True),
+                        pdf.sort_values(["k", "a"]).reset_index(drop=True),
+                    )
+
+                    kdf = right_kdf.merge(left_kdf, on="k", how=how, skew=skew)
+                    pdf = right_pdf.merge(left_pdf, on="k", how=how)
+                    self.assert_eq(
+                        kdf.sort_values(["k", "a"]).reset_index(drop=True),
+                        pdf.sort_values(["k", "a"]).reset_index(drop=True),
+                    )
+
+            kdf = left_kdf.merge(right_kdf, on="k", skew=[-1])
+            self.assertIn(
+                SALT_COLUMN_NAME, kdf._internal.spark_frame._jdf.queryExecution().toString()
+            )
+
+            # The skewed keys with a single row on the larger side miss most of the salts,
+            # while the rows of the smaller side are preserved.
+            with self.sql_conf({"spark.sql.shuffle.partitions": 8}):
+                for how in ["left", "outer"]:
+                    with self.subTest(how=how):
+                        kdf = right_kdf.merge(left_kdf, on="k", how=how, skew=[-1, 1, 2, 3])
+                        pdf = right_pdf.merge(left_pdf, on="k", how=how)
+                        self.assert_eq(
+                            kdf.sort_values(["k", "a"]).reset_index(drop=True),
+                            pdf.sort_values(["k", "a"]).reset_index(drop=True),
+                        )
+
+            right_pdf = pd.DataFrame({"k": [-1, -1, 1], "a": [0, 5, 301], "b": list("xyz")})
+            right_kdf = ks.from_pandas(right_pdf)
+            kdf = left_kdf.merge(right_kdf, on=["k", "a"], how="outer", skew=[(-1, 0), (-1, 1)])
+            pdf = left_pdf.merge(right_pdf, on=["k", "a"], how="outer")
+            self.assert_eq(
+                kdf.sort_values(["k", "a"]).reset_index(drop=True),
+                pdf.sort_values(["k", "a"]).reset_index(drop=True),
+            )
+
+        self.assertRaises(ValueError, lambda: left_kdf.merge(right_kdf, on="k", skew="x"))
+        self.assertRaises(ValueError, lambda: left_kdf.merge(right_kdf, on="k", skew=[(1, 2)]))
+
     def test_merge_raises(self):
         left = ks.DataFrame(
             {"value": [1, 2, 3, 5, 6], "x": list("abcde")},
@@ -2234,6 +2352,18 @@ class DataFrameTest(ReusedSQLTestCase, SQLTestUtils):
             pdf.append(pdf, ignore_index=True, verify_integrity=True),
         )
 
+        # Assert appending a list of DataFrames
+        self.assert_eq(
+            kdf.append([other_kdf, kdf], ignore_index=True),
+            pdf.append([other_pdf, pdf], ignore_index=True),
+        )
+        self.assert_eq(
+            kdf.append([other_kdf, kdf], ignore_index=True, checkpoint_every=2),
+            pdf.append([other_pdf, pdf], ignore_index=True),
+        )
+        with self.assertRaises(ValueError, msg=msg):
+            kdf.append([other_kdf, kdf], verify_integrity=True)
+
         # Assert appending multi-index DataFrames
         multi_index_pdf = pd.DataFrame([[1, 2], [3, 4]], columns=list("AB"), index=[[2, 3], [4, 5]])
         multi_index_kdf = ks.from_pandas(multi_index_pdf)
@@ -2951,6 +3081,49 @@ class DataFrameTest(ReusedSQLTestCase, SQLTestUtils):
             almost=True,
         )
 
+    def test_pivot_table_pivot_values(self):
+        pdf = pd.DataFrame(
+            {"a": [4, 2, 3, 4, 8, 6], "b": [1, 2, 2, 4, 2, 4], "c": [1, 2, 9, 4, 7, 4]},
+        )
+        kdf = ks.from_pandas(pdf)
+
+        self.assert_eq(
+            kdf.pivot_table(index=["c"], columns="a", values="b", pivot_values=[4, 2]).sort_index(),
+            pdf.pivot_table(index=["c"], columns="a", values="b")[[4, 2]].sort_index(),
+            almost=True,
+        )
+
+        # The discovered values are cached for the DataFrame.
+        kdf.pivot_table(index=["c"], columns="a", values="b")
+        key = kdf._internal.spark_column_for(("a",))._jc.toString()
+        self.assertEqual(_PIVOT_VALUES[kdf._internal.spark_frame][1][key], [2, 3, 4, 6, 8])
+        self.assert_eq(
+            kdf.pivot_table(index=["c"], columns="a", values="b").sort_index(),
+            pdf.pivot_table(index=["c"], columns="a", values="b").sort_index(),
+            almost=True,
+        )
+
+        # The cached values are discarded when the input files change.
+        with self.temp_dir() as tmp:
+            path = "{}/pivot".format(tmp)
+            kdf.to_parquet(path)
+            kdf = ks.read_parquet(path)
+            kdf.pivot_table(index=["c"], columns="a", values="b")
+            sdf = kdf._internal.spark_frame
+            files, cache = _PIVOT_VALUES[sdf]
+            self.assertEqual(cache[key], [2, 3, 4, 6, 8])
+
+            for file, _, modified in files:
+                os.utime(urlparse(file).path, (modified / 1000 + 10, modified / 1000 + 10))
+            kdf.pivot_table(index=["c"], columns="a", values="b")
+            self.assertIsNot(_PIVOT_VALUES[sdf][1], cache)
+
+        self.assertRaisesRegex(
+            ValueError,
+            "pivot_values should be a list of values.",
+            lambda: kdf.pivot_table(index=["c"], columns="a", values="b", pivot_values=1),
+        )
+
     def test_pivot_table_and_index(self):
         # https://github.com/databricks/koalas/issues/805
         pdf = pd.DataFrame(
@@ -3045,6 +3218,25 @@ class DataFrameTest(ReusedSQLTestCase, SQLTestUtils):
 
         self.assert_eq(kdf.unstack().sort_index(), pdf.unstack().sort_index(), almost=True)
 
+    def test_reshape_wide(self):
+        pdf = pd.DataFrame(
+            np.arange(3 * 300).reshape(3, 300),
+            columns=pd.MultiIndex.from_tuples(
+                [("c{}".format(i // 10), i % 10) for i in range(300)], names=["x", "y"]
+            ),
+            index=pd.Index([10, 20, 30], name="idx"),
+        )
+        kdf = ks.from_pandas(pdf)
+
+        self.assert_eq(
+            kdf.melt().sort_values(["x", "y", "value"]).reset_index(drop=True),
+            pdf.melt().sort_values(["x", "y", "value"]).reset_index(drop=True),
+        )
+        self.assert_eq(kdf.unstack().sort_index(), pdf.unstack().sort_index())
+        self.assert_eq(
+            kdf.unstack().unstack().sort_index(), pdf.unstack().unstack().sort_index(),
+        )
+
     def test_pivot_errors(self):
         kdf = ks.range(10)
 
@@ -3163,6 +3355,15 @@ class DataFrameTest(ReusedSQLTestCase, SQLTestUtils):
         with option_context("compute.max_rows", None):
             self.assert_eq(pdf3.transpose().sort_index(), kdf3.transpose().sort_index())
 
+        # More rows than 'compute.max_rows' are transposed in a distributed manner.
+        with option_context("compute.max_rows", 1):
+            self.assert_eq(pdf3.transpose().sort_index(), kdf3.transpose().sort_index())
+
+        pdf4 = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}, index=[10, 10, 20])
+        kdf4 = ks.from_pandas(pdf4)
+        with option_context("compute.max_rows", None):
+            self.assert_eq(pdf4.transpose().sort_index(), kdf4.transpose().sort_index())
+
     def _test_cummin(self, pdf, kdf):
         self.assert_eq(pdf.cummin(), kdf.cummin())
         self.assert_eq(pdf.cummin(skipna=False), kdf.cummin(skipna=False))
@@ -3832,7 +4033,7 @@ class DataFrameTest(ReusedSQLTestCase, SQLTestUtils):
         self.assert_eq(pdf.rank(method="first").sort_index(), kdf.rank(method="first").sort_index())
         self.assert_eq(pdf.rank(method="dense").sort_index(), kdf.rank(method="dense").sort_index())
 
-        msg = "method must be one of 'average', 'min', 'max', 'first', 'dense'"
+        msg = "method must be one of 'average', 'min', 'max', 'first', 'dense', 'approx'"
         with self.assertRaisesRegex(ValueError, msg):
             kdf.rank(method="nothing")
 
@@ -3842,6 +4043,30 @@ class DataFrameTest(ReusedSQLTestCase, SQLTestUtils):
         kdf.columns = columns
         self.assert_eq(pdf.rank().sort_index(), kdf.rank().sort_index())
 
+    def test_rank_many_values(self):
+        pdf = pd.DataFrame(
+            {"a": [i % 37 for i in range(1000)], "b": [float(i % 101) for i in range(1000)]},
+            index=np.random.rand(1000),
+        )
+        pdf.loc[pdf.index[::7], "b"] = np.nan
+        kdf = ks.from_pandas(pdf)
+
+        for method in ["average", "min", "max", "first", "dense"]:
+            for ascending in [True, False]:
+                self.assert_eq(
+                    pdf[["a"]].rank(method=method, ascending=ascending).sort_index(),
+                    kdf[["a"]].rank(method=method, ascending=ascending).sort_index(),
+                )
+
+        expected = pdf.rank(method="min")
+        actual = kdf.rank(method="approx").to_pandas().loc[expected.index]
+        # Within 0.1% of the rows by the 1000 quantiles and 0.01% by their accuracy, plus one.
+        self.assertTrue(((actual - expected).abs().max() <= 1000 * 0.0011 + 1).all())
+        self.assertTrue(actual["b"][pdf["b"].isnull()].isnull().all())
+
+        with self.assertRaisesRegex(TypeError, "only supports numeric columns"):
+            ks.DataFrame({"a": ["x", "y"]}).rank(method="approx")
+
     def test_round(self):
         pdf = pd.DataFrame(
             {
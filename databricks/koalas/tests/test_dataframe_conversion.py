@@ -151,8 +151,10 @@ class DataFrameConversionTest(ReusedSQLTestCase, SQLTestUtils, TestUtils):
             kdf.to_json(lines=False)
 
     def test_read_json_negative(self):
-        with self.assertRaises(NotImplementedError):
-            ks.read_json("invalid", lines=False)
+        with self.assertRaisesRegex(ValueError, "split_size is only supported with lines=False"):
+            ks.read_json("invalid", split_size=10)
+        with self.assertRaisesRegex(ValueError, "split_size must be a positive integer"):
+            ks.read_json("invalid", lines=False, split_size=0)
 
     def test_to_json_with_path(self):
         pdf = pd.DataFrame({"a": [1], "b": ["a"]})
@@ -215,6 +217,66 @@ class DataFrameConversionTest(ReusedSQLTestCase, SQLTestUtils, TestUtils):
         if LooseVersion(pd.__version__) < LooseVersion("1.0.0"):
             self.assert_eq(kdf.to_latex(encoding="ascii"), pdf.to_latex(encoding="ascii"))
 
+    def test_to_in_batches(self):
+        pdf = pd.DataFrame(
+            {"a": [1, 2, 3, 4, 5], "b": ["one", "two", None, "four", "five"]},
+            index=[0, 1, 3, 4, 6],
+        )
+        kdf = ks.from_pandas(pdf)
+
+        for batch_size in [1, 2, 10]:
+            self.assert_eq(
+                self.strip_all_whitespace(kdf.to_html(batch_size=batch_size)),
+                self.strip_all_whitespace(pdf.to_html()),
+            )
+            self.assert_eq(
+                self.strip_all_whitespace(kdf.to_latex(batch_size=batch_size, index=False)),
+                self.strip_all_whitespace(pdf.to_latex(index=False)),
+            )
+            self.assert_eq(
+                self.strip_all_whitespace(kdf.b.to_latex(batch_size=batch_size)),
+                self.strip_all_whitespace(pdf.b.to_latex()),
+            )
+
+            with self.temp_dir() as dirpath:
+                pandas_location = dirpath + "/" + "output1.xlsx"
+                koalas_location = dirpath + "/" + "output2.xlsx"
+                kdf.to_excel(koalas_location, batch_size=batch_size, na_rep="null")
+                pdf.to_excel(pandas_location, na_rep="null")
+                dataframes = self.get_excel_dfs(koalas_location, pandas_location)
+                self.assert_eq(dataframes["got"], dataframes["expected"])
+
+        self.assert_eq(
+            self.strip_all_whitespace(kdf[kdf.a > 10].to_html(batch_size=2)),
+            self.strip_all_whitespace(pdf[pdf.a > 10].to_html()),
+        )
+
+        # The batches without missing values have the same dtypes as the others.
+        kdf = ks.DataFrame(self.spark.createDataFrame([(1,), (2,), (None,)], "a int"))
+        batches = list(kdf._internal.to_pandas_frame_batches(1))
+        self.assertEqual([batch.a.dtype for batch in batches], [np.dtype("float64")] * 3)
+        self.assert_eq(
+            self.strip_all_whitespace(kdf.to_html(batch_size=1)),
+            self.strip_all_whitespace(kdf.to_pandas().to_html()),
+        )
+
+        # The nullable integral columns without missing values keep the integral dtypes.
+        big = 2 ** 53 + 1
+        kdf = ks.DataFrame(self.spark.createDataFrame([(1,), (2,), (big,)], "a bigint"))
+        self.assertTrue(kdf._internal.spark_frame.schema["a"].nullable)
+        batches = list(kdf._internal.to_pandas_frame_batches(1))
+        self.assertEqual([batch.a.dtype for batch in batches], [np.dtype("int64")] * 3)
+        self.assertEqual(batches[2].a.iloc[0], big)
+        self.assert_eq(
+            self.strip_all_whitespace(kdf.to_html(batch_size=2)),
+            self.strip_all_whitespace(kdf.to_pandas().to_html()),
+        )
+
+        with self.assertRaisesRegex(ValueError, "batch_size must be a positive integer"):
+            kdf.to_html(batch_size=0)
+        with self.assertRaisesRegex(ValueError, "show_dimensions is not supported"):
+            kdf.to_html(batch_size=2, show_dimensions=True)
+
     def test_to_records(self):
         if LooseVersion(pd.__version__) >= LooseVersion("0.24.0"):
             pdf = pd.DataFrame({"A": [1, 2], "B": [0.5, 0.75]}, index=["a", "b"])
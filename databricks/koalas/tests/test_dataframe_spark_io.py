@@ -17,14 +17,17 @@
 from distutils.version import LooseVersion
 import unittest
 import glob
+import json
 import os
 
 import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyspark
+from pyspark.sql import functions as F
 
 from databricks import koalas as ks
+from databricks.koalas.namespace import _PARQUET_PANDAS_METADATA, _read_excel_rows
 from databricks.koalas.testing.utils import ReusedSQLTestCase, TestUtils
 
 
@@ -122,6 +125,23 @@ class DataFrameSparkIOTest(ReusedSQLTestCase, TestUtils):
 
             self.assert_eq(ks.read_parquet(path3, pandas_metadata=True), expected3)
 
+    def test_parquet_read_pandas_metadata_cache(self):
+        with self.temp_dir() as tmp:
+            pdf = self.test_pdf.set_index("i32")
+
+            path = "{}/dataset".format(tmp)
+            os.makedirs(path)
+            open("{}/_SUCCESS".format(path), "w").close()
+            pdf.to_parquet("{}/part-00000.parquet".format(path))
+
+            _PARQUET_PANDAS_METADATA.clear()
+            self.assert_eq(ks.read_parquet(path, pandas_metadata=True).sort_index(), pdf)
+            self.assertEqual(len(_PARQUET_PANDAS_METADATA), 1)
+            self.assertEqual(list(_PARQUET_PANDAS_METADATA.values()), [(["i32"], ["i32"])])
+
+            self.assert_eq(ks.read_parquet(path, pandas_metadata=True).sort_index(), pdf)
+            self.assertEqual(len(_PARQUET_PANDAS_METADATA), 1)
+
     def test_parquet_write(self):
         with self.temp_dir() as tmp:
             pdf = self.test_pdf
@@ -378,6 +398,136 @@ class DataFrameSparkIOTest(ReusedSQLTestCase, TestUtils):
             else:
                 self.assertRaises(ValueError, lambda: ks.read_excel(tmp))
 
+    def test_read_json_array(self):
+        records = [
+            {"a": i, "s": ["x, y", '"]}', "[{,", "\\", "é,"][i % 5] * (i % 3), "n": {"x": [i, i]}}
+            for i in range(30)
+        ]
+        expected = pd.DataFrame({"a": [r["a"] for r in records], "s": [r["s"] for r in records]})
+
+        with self.temp_dir() as tmp:
+            with open("{}/file1.json".format(tmp), "w") as f:
+                json.dump(records[:20], f, indent=2)
+            with open("{}/file2.json".format(tmp), "w") as f:
+                json.dump(records[20:], f)
+            with open("{}/file3.json".format(tmp), "w") as f:
+                f.write(" [ ] ")
+
+            for split_size in [40, 1000000]:
+                actual = ks.read_json(tmp, lines=False, split_size=split_size)
+                self.assert_eq(actual[["a", "s"]], expected)
+                self.assertEqual(
+                    [list(n["x"]) for n in actual.n.to_pandas()], [[i, i] for i in range(30)]
+                )
+
+            self.assert_eq(
+                ks.read_json("{}/file2.json".format(tmp), lines=False).sort_values("a")[["a", "s"]],
+                expected[20:],
+            )
+
+    @unittest.skipIf(
+        LooseVersion(pyspark.__version__) < LooseVersion("3.0.0"),
+        "The test only works with Spark>=3.0",
+    )
+    def test_read_html_distributed(self):
+        pdf1 = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        pdf2 = pd.DataFrame({"c": [1.5, 2.5]})
+
+        with self.temp_dir() as tmp:
+            for i in range(3):
+                with open("{}/page{}.html".format(tmp, i), "w") as f:
+                    f.write("<html><body>")
+                    f.write(pdf1.assign(a=pdf1.a + i * 10).to_html(index=False))
+                    f.write((pdf2 * (i + 1)).to_html(index=False))
+                    f.write("</body></html>")
+            with open("{}/page3.html".format(tmp), "w") as f:
+                f.write("<html><body>No tables</body></html>")
+
+            expected = [pd.read_html("{}/page{}.html".format(tmp, i)) for i in range(3)]
+            kdfs = ks.read_html(tmp, distributed=True)
+            self.assertEqual(len(kdfs), 2)
+            for i, kdf in enumerate(kdfs):
+                self.assert_eq(
+                    kdf.to_pandas().sort_values(list(kdf.columns)).reset_index(drop=True),
+                    pd.concat([pdfs[i] for pdfs in expected])
+                    .sort_values(list(kdf.columns))
+                    .reset_index(drop=True),
+                )
+
+            kdfs = ks.read_html("{}/page1.html".format(tmp), distributed=True, match="x")
+            self.assertEqual(len(kdfs), 1)
+            self.assert_eq(kdfs[0], expected[1][0])
+
+    @unittest.skipIf(
+        LooseVersion(pyspark.__version__) < LooseVersion("3.0.0"),
+        "The test only works with Spark>=3.0",
+    )
+    def test_read_excel_rows_per_task(self):
+        with self.temp_dir() as tmp:
+            pdf = pd.DataFrame({"a": range(25), "b": [str(i) for i in range(25)]})
+            path = "{}/file1.xlsx".format(tmp)
+            with pd.ExcelWriter(path) as writer:
+                pdf.to_excel(writer, sheet_name="Sheet_name_1", index=False)
+                pdf[["a"]].to_excel(writer, sheet_name="Sheet_name_2")
+
+            kdf = ks.read_excel(path, sheet_name="Sheet_name_1", rows_per_task=4)
+            self.assert_eq(kdf.sort_index(), pd.read_excel(path, sheet_name="Sheet_name_1"))
+            # Only the paths and the ranges are shuffled, not the contents of the files.
+            plan = kdf._internal.spark_frame._jdf.queryExecution().executedPlan().toString()
+            self.assertIn("Exchange hashpartitioning(path", plan)
+            self.assertNotIn("content", plan)
+
+            # A range is read after the header, without the rows before it.
+            expected = pd.read_excel(path, sheet_name="Sheet_name_1")
+            for start, end in [(5, 10), (20, None)]:
+                self.assert_eq(
+                    _read_excel_rows(path, "Sheet_name_1", 1, start, end, header=0),
+                    expected[start:end].reset_index(drop=True),
+                )
+
+            for header in [0, None]:
+                pdfs = pd.read_excel(path, sheet_name=None, header=header, index_col=0)
+                kdfs = ks.read_excel(
+                    path, sheet_name=None, header=header, index_col=0, rows_per_task=7
+                )
+                for sheet_name in ["Sheet_name_1", "Sheet_name_2"]:
+                    self.assert_eq(kdfs[sheet_name].sort_index(), pdfs[sheet_name].sort_index())
+
+            self.assert_eq(
+                ks.read_excel(path, sheet_name=1, skiprows=[1, 2], rows_per_task=4).sort_index(),
+                pd.read_excel(path, sheet_name=1, skiprows=[1, 2]),
+            )
+
+            with self.assertRaisesRegex(ValueError, "rows_per_task must be a positive integer"):
+                ks.read_excel(path, rows_per_task=0)
+
+    def test_read_sql(self):
+        url = "jdbc:derby:memory:koalas_read_sql;create=true"
+        pdf = pd.DataFrame(
+            {"id": range(100), "value": [float(i % 7) for i in range(100)]},
+            columns=["id", "value"],
+        )
+        ks.from_pandas(pdf).to_spark().write.jdbc(url, "test_table", mode="overwrite")
+
+        kdf = ks.read_sql_table("test_table", url, index_col="id", num_partitions=4)
+        self.assertEqual(kdf.to_spark().rdd.getNumPartitions(), 4)
+        self.assert_eq(kdf.sort_index(), pdf.set_index("id"))
+
+        kdf = ks.read_sql(
+            "SELECT * FROM test_table", url, partition_column="value", num_partitions=3
+        )
+        self.assertEqual(kdf.to_spark().rdd.getNumPartitions(), 3)
+        self.assert_eq(kdf.sort_values("id").reset_index(drop=True), pdf)
+
+        kdf = ks.read_sql(
+            "test_table", url, index_col="id", predicates=['MOD("id", 2) = 0', 'MOD("id", 2) = 1'],
+        )
+        self.assertEqual(kdf.to_spark().rdd.getNumPartitions(), 2)
+        self.assert_eq(kdf.sort_index(), pdf.set_index("id"))
+
+        with self.assertRaisesRegex(ValueError, "predicates cannot be used"):
+            ks.read_sql_table("test_table", url, partition_column="id", predicates=["1 = 1"])
+
     def test_read_orc(self):
         with self.temp_dir() as tmp:
             path = "{}/file1.orc".format(tmp)
@@ -425,6 +575,238 @@ class DataFrameSparkIOTest(ReusedSQLTestCase, TestUtils):
             with self.assertRaises(ValueError, msg=msg):
                 ks.read_orc(path, columns=["i34", "i64"])
 
+    def test_read_with_filters(self):
+        pdf = pd.DataFrame(
+            {
+                "i32": np.arange(20, dtype=np.int32) % 3,
+                "i64": np.arange(20, dtype=np.int64),
+                "f": np.arange(20, dtype=np.float64),
+                "bhello": ["hello", "yo", "people", "koalas"] * 5,
+            }
+        )
+
+        def check(kdf, expected):
+            self.assert_eq(
+                kdf.sort_values(by="i64").to_pandas().reset_index(drop=True),
+                expected.reset_index(drop=True),
+            )
+
+        with self.temp_dir() as tmp:
+            parquet_path = "{}/data.parquet".format(tmp)
+            orc_path = "{}/data.orc".format(tmp)
+            sdf = self.spark.createDataFrame(pdf)
+            sdf.write.partitionBy("i32").parquet(parquet_path)
+            sdf.write.orc(orc_path)
+
+            for read in [ks.read_parquet, ks.read_orc]:
+                path = parquet_path if read is ks.read_parquet else orc_path
+                check(
+                    read(path, columns=["i64", "f"], filters=[("i32", "=", 1)]),
+                    pdf[pdf.i32 == 1][["i64", "f"]],
+                )
+                check(
+                    read(path, filters=[[("i64", "<", 3)], [("bhello", "in", ["yo"])]])[
+                        pdf.columns
+                    ],
+                    pdf[(pdf.i64 < 3) | (pdf.bhello == "yo")],
+                )
+                check(
+                    read(path, columns=["i64"], filters="f >= 15 AND bhello != 'koalas'"),
+                    pdf[(pdf.f >= 15) & (pdf.bhello != "koalas")][["i64"]],
+                )
+                check(read(path, columns=["i64"], filters=F.col("f") < 2), pdf[pdf.f < 2][["i64"]])
+
+                actual = read(path, index_col="i64", columns=["f"], filters=[("i64", ">", 17)])
+                self.assert_eq(actual.sort_index(), pdf[pdf.i64 > 17].set_index("i64")[["f"]])
+
+                with self.assertRaisesRegex(ValueError, "op must be one of"):
+                    read(path, filters=[("i64", "~", 1)])
+                with self.assertRaisesRegex(TypeError, "filters should be"):
+                    read(path, filters=[])
+
+            def executed_plan(kdf):
+                return kdf.to_spark()._jdf.queryExecution().executedPlan().toString()
+
+            # The filter on the partition column prunes the partitions in the scan.
+            plan = executed_plan(
+                ks.read_parquet(parquet_path, columns=["f"], filters=[("i32", "=", 1)])
+            )
+            self.assertIn("PartitionFilters: [isnotnull(i32", plan)
+            self.assertIn("ReadSchema: struct<f:double>", plan)
+
+            # With index_col, the filters after reading reach the scan as well.
+            kdf = ks.read_parquet(parquet_path, index_col="i64", columns=["f"])
+            self.assertIn("LessThan(f,2.0)", executed_plan(kdf[kdf.f < 2]))
+
+            def executed_plan_with_index(kdf):
+                sdf = kdf.to_spark(index_col="index")
+                return sdf._jdf.queryExecution().executedPlan().toString()
+
+            # Without the lazy default index, the filters after reading do not reach the scan
+            # once the default index is used.
+            kdf = ks.read_parquet(parquet_path)
+            plan = executed_plan_with_index(kdf[kdf.f < 2][["i64", "f"]])
+            self.assertNotIn("LessThan(f,2.0)", plan)
+
+            # With the lazy default index, the filters and the columns selected after reading
+            # reach the scan, and the default index is attached to the rows filtered.
+            with ks.option_context("compute.lazy_default_index", True):
+                for read in [ks.read_parquet, ks.read_orc]:
+                    path = parquet_path if read is ks.read_parquet else orc_path
+                    kdf = read(path)
+                    kdf = kdf[kdf.f < 5][["i64", "f", "i32"]]
+                    kdf = kdf[kdf.i32 == 1][["i64", "f"]]
+                    plan = executed_plan_with_index(kdf)
+                    self.assertIn("LessThan(f,5.0)", plan)
+                    self.assertNotIn("bhello", plan)
+                    check(kdf, pdf[(pdf.f < 5) & (pdf.i32 == 1)][["i64", "f"]])
+                    self.assert_eq(kdf.index.sort_values(), pd.Index([0, 1]))
+
+                    # The filters on the index are applied after the default index.
+                    kdf = read(path)
+                    self.assert_eq(kdf[kdf.index > 17].index.sort_values(), pd.Index([18, 19]))
+
+                # With the other default index type, the filters are applied as before.
+                with ks.option_context("compute.default_index_type", "distributed-sequence"):
+                    kdf = ks.read_parquet(parquet_path)
+                    expected = kdf.to_pandas()
+                    self.assert_eq(
+                        kdf[kdf.f < 5].sort_index(), expected[expected.f < 5].sort_index()
+                    )
+
+    def test_read_delta_changes(self):
+        with self.temp_dir() as tmp:
+            path = "{}/delta".format(tmp)
+
+            def write(ids, partition, mode, **options):
+                pdf = pd.DataFrame({"id": ids, "p": [partition] * len(ids)})
+                ks.from_pandas(pdf).to_delta(path, mode=mode, partition_cols="p", **options)
+
+            def check(start_version, end_version, inserted, deleted):
+                kdf = ks.read_delta_changes(path, start_version, end_version)
+                self.assert_eq(
+                    kdf[["id", "p", "_change_type"]]
+                    .sort_values(["_change_type", "id"])
+                    .to_pandas()
+                    .reset_index(drop=True),
+                    pd.DataFrame(
+                        [(i, p, "delete") for i, p in deleted]
+                        + [(i, p, "insert") for i, p in inserted],
+                        columns=["id", "p", "_change_type"],
+                    ).astype({"id": np.int64}),
+                )
+
+            write([1, 2], "a", "overwrite")  # version 0
+            write([3, 4], "b", "append")  # version 1
+            # Version 2: compaction which rewrites the files without changing the data.
+            (
+                self.spark.read.format("delta")
+                .load(path)
+                .repartition(1)
+                .write.format("delta")
+                .option("dataChange", "false")
+                .mode("overwrite")
+                .save(path)
+            )
+            write([5], "c", "append")  # version 3
+            write([6], "c", "overwrite", replaceWhere="p = 'c'")  # version 4
+            write([2], "a", "overwrite", replaceWhere="p = 'a'")  # version 5
+
+            check(0, 1, inserted=[(3, "b"), (4, "b")], deleted=[])
+            check(0, 3, inserted=[(3, "b"), (4, "b"), (5, "c")], deleted=[])
+            # The files of all the partitions are read in one scan.
+            kdf = ks.read_delta_changes(path, 0, 3)
+            plan = kdf._internal.spark_frame._jdf.queryExecution().executedPlan().toString()
+            self.assertEqual(plan.count("FileScan parquet"), 1)
+            check(1, 2, inserted=[], deleted=[])
+            # The file added in version 3 and removed in version 4 is not read.
+            check(2, 4, inserted=[(6, "c")], deleted=[])
+            check(4, None, inserted=[], deleted=[(1, "a")])
+            check(0, None, inserted=[(3, "b"), (4, "b"), (6, "c")], deleted=[(1, "a")])
+
+            with self.assertRaisesRegex(ValueError, "must not be greater"):
+                ks.read_delta_changes(path, 3, 2)
+
+    def test_cache_to_disk(self):
+        pdf = pd.DataFrame(
+            {
+                "a": [1, 2, 3, 4],
+                "b": pd.Categorical(["x", "y", "x", "z"]),
+                "c": [1.0, None, 3.0, 4.0],
+            },
+            index=pd.Index([10, 20, 30, 40], name="idx"),
+        )
+        pdf.columns = pd.MultiIndex.from_tuples([("x", "a"), ("x", "b"), ("y", "c")])
+        pdf.columns.names = ["l1", "l2"]
+
+        with self.temp_dir() as tmp:
+            data_path = "{}/data.parquet".format(tmp)
+            cache_path = "{}/cache".format(tmp)
+            ks.range(10).to_parquet(data_path)
+
+            kdf = ks.read_parquet(data_path)
+            kdf = kdf[kdf.id > 3].assign(x=kdf.id * 2)
+            expected = kdf.to_pandas()
+
+            cached = kdf.koalas.cache_to_disk(path=cache_path)
+            self.assert_eq(cached.sort_index(), expected.sort_index())
+            self.assertEqual(len(os.listdir(cache_path)), 1)
+
+            # The same lineage reads the cache.
+            kdf = ks.read_parquet(data_path)
+            kdf = kdf[kdf.id > 3].assign(x=kdf.id * 2)
+            self.assert_eq(kdf.koalas.cache_to_disk(path=cache_path).sort_index(), expected)
+            self.assertEqual(len(os.listdir(cache_path)), 1)
+
+            # A different computation or changed input files invalidate the cache.
+            kdf = ks.read_parquet(data_path)
+            kdf = kdf[kdf.id > 4].assign(x=kdf.id * 2)
+            kdf.koalas.cache_to_disk(path=cache_path)
+            self.assertEqual(len(os.listdir(cache_path)), 2)
+
+            ks.range(5).to_parquet(data_path)
+            kdf = ks.read_parquet(data_path)
+            kdf = kdf[kdf.id > 3].assign(x=kdf.id * 2)
+            self.assert_eq(
+                kdf.koalas.cache_to_disk(path=cache_path).sort_index(),
+                pd.DataFrame({"id": [4], "x": [8]}, index=[4]),
+            )
+            self.assertEqual(len(os.listdir(cache_path)), 3)
+
+            # The plans only different in the last column of a wide DataFrame are not truncated.
+            wide_path = "{}/wide.parquet".format(tmp)
+            ks.DataFrame({"c{}".format(i): [i] for i in range(30)}).to_parquet(wide_path)
+            for n in [2, 3]:
+                kdf = ks.read_parquet(wide_path)
+                kdf = kdf.assign(c29=kdf.c29 * n)
+                self.assert_eq(
+                    kdf.koalas.cache_to_disk(path=cache_path).sort_index(),
+                    kdf.to_pandas().sort_index(),
+                )
+                self.assertEqual(kdf.koalas.cache_to_disk(path=cache_path).c29.to_list(), [29 * n])
+            self.assertEqual(len(os.listdir(cache_path)), 5)
+
+            # The index, the column labels and the dtypes are restored.
+            kdf = ks.from_pandas(pdf)
+            with self.assertRaisesRegex(ValueError, "key should be specified"):
+                kdf.koalas.cache_to_disk(path=cache_path)
+            with ks.option_context("compute.disk_cache_path", cache_path):
+                self.assert_eq(kdf.koalas.cache_to_disk(key="pdf").sort_index(), pdf)
+                self.assert_eq(ks.range(1).koalas.cache_to_disk(key="pdf").sort_index(), pdf)
+
+            # The metadata is plain JSON.
+            with open("{}/pdf/_koalas_metadata.json".format(cache_path)) as f:
+                metadata = json.load(f)
+            self.assertEqual(metadata["index_names"], [["idx"]])
+            self.assertEqual(metadata["column_labels"], [["x", "a"], ["x", "b"], ["y", "c"]])
+            self.assertEqual(
+                metadata["data_dtypes"],
+                ["int64", {"categories": ["x", "y", "z"], "ordered": False}, "float64"],
+            )
+
+            with self.assertRaisesRegex(ValueError, "path should be specified"):
+                kdf.koalas.cache_to_disk(key="pdf")
+
     def test_orc_write(self):
         with self.temp_dir() as tmp:
             pdf = self.test_pdf
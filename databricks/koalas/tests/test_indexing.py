@@ -269,6 +269,93 @@ class IndexingTest(ReusedSQLTestCase):
 
         self.assert_eq(kdf.at["B", (0, 1)], pdf.at["B", (0, 1)])
 
+    def test_build_index(self):
+        pdf = pd.DataFrame(
+            {
+                "k": [5, 3, 9, 1, 7, 3, 8, 2, 6, 4],
+                "s": ["e", "c", "i", "a", "g", "c", "h", "b", "f", "d"],
+                "a": [50, 30, 90, 10, 70, 31, 80, 20, 60, 40],
+                "b": [5.0, np.nan, 9.0, 1.0, np.nan, 3.0, 8.0, 2.0, 6.0, np.nan],
+            }
+        )
+        kdf = ks.from_pandas(pdf)
+        sc = self.spark.sparkContext
+
+        def tasks_of(func):
+            sc.setJobGroup("test_build_index", "test_build_index")
+            try:
+                func()
+                job_ids = sc.statusTracker().getJobIdsForGroup("test_build_index")
+                stage_ids = sum(
+                    [list(sc.statusTracker().getJobInfo(job_id).stageIds) for job_id in job_ids],
+                    [],
+                )
+                return [sc.statusTracker().getStageInfo(s).numTasks for s in stage_ids]
+            finally:
+                sc.setLocalProperty("spark.jobGroup.id", None)
+
+        for kind in ["hash", "sorted"]:
+            with self.subTest(kind=kind):
+                indexed = kdf.koalas.build_index("k", kind=kind, num_partitions=4)
+                ppdf = pdf.set_index("k")
+                self.assertIsNotNone(indexed._internal.key_directory)
+                self.assert_eq(indexed.sort_index(), ppdf.sort_index())
+
+                for key in [1, 5, 9]:
+                    self.assert_eq(indexed.at[key, "a"], ppdf.at[key, "a"])
+                    self.assert_eq(indexed.a.at[key], ppdf.a.at[key])
+                    self.assert_eq(indexed.loc[key], ppdf.loc[key])
+                    self.assert_eq(indexed.loc[key, "s"], ppdf.loc[key, "s"])
+                    self.assert_eq(indexed.a.loc[key], ppdf.a.loc[key])
+                    self.assert_eq(indexed.a.get(key), ppdf.a.get(key))
+                self.assert_eq(indexed.loc[3], ppdf.loc[3])
+                self.assert_eq(indexed.loc[3, ["s", "a"]], ppdf.loc[3, ["s", "a"]])
+                self.assert_eq(list(indexed.at[3, "a"]), list(ppdf.at[3, "a"]))
+                self.assert_eq(indexed.a.get(10, -1), -1)
+                self.assertRaises(KeyError, lambda: indexed.at[10, "a"])
+                self.assertRaises(KeyError, lambda: indexed.loc[10])
+                self.assertRaises(KeyError, lambda: indexed.loc[0])
+
+                # The rows looked up stay distributed in the partitions which can hold the key.
+                key_directory = indexed._internal.key_directory
+                internal = key_directory.lookup(indexed._internal, (5,))
+                self.assertEqual(
+                    internal.spark_frame.rdd.getNumPartitions(),
+                    len(key_directory.partitions_for((5,))),
+                )
+
+                if kind == "hash":
+                    num_tasks = tasks_of(lambda: indexed.at[5, "a"])
+                    self.assertTrue(len(num_tasks) > 0 and all(n <= 1 for n in num_tasks))
+
+                # Any derived DataFrame scans as usual.
+                self.assertIsNone(indexed.sort_index()._internal.key_directory)
+                self.assertIsNone((indexed.a + 1)._kdf._internal.key_directory)
+
+        indexed = kdf.koalas.build_index("k", kind="sorted", num_partitions=4)
+        ppdf = pdf.set_index("k").sort_index()
+        for where in [0, 1, 3, 5, 5.5, 10]:
+            self.assert_eq(indexed.b.asof(where), ppdf.b.asof(where))
+            self.assert_eq(indexed.a.asof(where), ppdf.a.asof(where))
+        self.assert_eq(indexed.b.asof([0, 5]), ppdf.b.asof([0, 5]))
+
+        # Multi-index and key prefixes.
+        indexed = kdf.koalas.build_index(["s", "k"], kind="sorted", num_partitions=3)
+        ppdf = pdf.set_index(["s", "k"])
+        self.assert_eq(indexed.at[("e", 5), "a"], 50)
+        self.assert_eq(indexed.loc[("c", 3), :], ppdf.loc[("c", 3), :])
+        self.assert_eq(indexed.loc["g"], ppdf.loc["g"])
+        self.assert_eq(indexed.a.loc[("i",)], ppdf.a.loc[("i",)])
+        self.assertRaises(KeyError, lambda: indexed.loc[("z", 1)])
+
+        indexed = kdf.koalas.build_index(["s", "k"], kind="hash", num_partitions=3)
+        self.assert_eq(indexed.at[("e", 5), "a"], 50)
+        self.assert_eq(indexed.loc[("c", 3), :], ppdf.loc[("c", 3), :])
+        self.assert_eq(indexed.loc["g"], ppdf.loc["g"])
+
+        self.assertRaises(ValueError, lambda: kdf.koalas.build_index("k", kind="btree"))
+        self.assertRaises(ValueError, lambda: kdf.koalas.build_index("k", num_partitions=0))
+
     def test_iat(self):
         pdf = self.pdf
         kdf = self.kdf
@@ -426,6 +513,39 @@ class IndexingTest(ReusedSQLTestCase):
         kdf = ks.from_pandas(pdf)
         self.assert_eq(kdf.loc[20:20], pdf.loc[20:20])
 
+    def test_loc_with_index_statistics(self):
+        pdf = pd.DataFrame(
+            {"x": range(100)}, index=pd.date_range("2011-01-01", freq="D", periods=100)
+        )
+        kdf = ks.from_pandas(pdf).spark.repartition(4).sort_index()
+
+        stats = kdf._internal.index_statistics
+        self.assertEqual(stats["count"].sum(), 100)
+        self.assertTrue(kdf._internal.is_index_monotonic("increasing"))
+        self.assertFalse(kdf._internal.is_index_monotonic("decreasing"))
+
+        self.assert_eq(kdf.loc["2011-01-15":"2011-02-10"], pdf.loc["2011-01-15":"2011-02-10"])
+        self.assert_eq(kdf.x.loc["2011-03-01":], pdf.x.loc["2011-03-01":])
+        self.assert_eq(
+            kdf.loc[pd.Timestamp("2012-01-01") : pd.Timestamp("2013-01-01")],
+            pdf.loc[pd.Timestamp("2012-01-01") : pd.Timestamp("2013-01-01")],
+        )
+        # The statistics are cached and reused.
+        self.assertIs(kdf._internal.index_statistics, stats)
+
+        pdf = pd.DataFrame({"x": range(10)}, index=[9, 8, 7, 7, 5, 4, 3, 2, 1, 0])
+        kdf = ks.from_pandas(pdf)
+        self.assertTrue(kdf._internal.is_index_monotonic("decreasing"))
+        self.assert_eq(kdf.loc[7:3], pdf.loc[7:3])
+        self.assert_eq(kdf.loc[6:-1], pdf.loc[6:-1])
+        self.assert_eq(kdf.loc[100:50], pdf.loc[100:50])
+
+        pdf = pd.DataFrame({"x": range(4)}, index=[1.0, np.nan, 2.0, 3.0])
+        kdf = ks.from_pandas(pdf)
+        self.assertFalse(kdf._internal.is_index_monotonic("increasing"))
+        self.assertFalse(kdf._internal.is_index_monotonic("decreasing"))
+        self.assert_eq(kdf.loc[1.0:2.0], pdf.loc[1.0:2.0])
+
     def test_loc_with_series(self):
         kdf = self.kdf
         pdf = self.pdf
@@ -985,6 +1105,39 @@ class IndexingTest(ReusedSQLTestCase):
                     kdf.iloc[rows_sel, :1].sort_index(), pdf.iloc[rows_sel, :1].sort_index()
                 )
 
+    def test_iloc_with_partition_row_counts(self):
+        with ks.option_context("compute.default_index_type", "distributed"):
+            kdf = ks.range(50, num_partitions=7)
+        kdf["B"] = kdf.id * 2
+        pdf = kdf.to_pandas()
+        self.assertEqual(kdf._internal.spark_frame.rdd.getNumPartitions(), 7)
+
+        counts = kdf._internal.partition_row_counts
+        self.assertEqual(sum(counts.values()), 50)
+
+        for rows_sel in [
+            slice(-5, None),
+            slice(None, -45),
+            slice(3, 44, 7),
+            slice(40, 2, -3),
+            slice(100, None),
+            [0, 48, -1, 25],
+            [-50],
+        ]:
+            with self.subTest(rows_sel=rows_sel):
+                self.assert_eq(kdf.iloc[rows_sel].sort_index(), pdf.iloc[rows_sel].sort_index())
+
+        for i in [0, 13, 49, -1, -50]:
+            with self.subTest(i=i):
+                self.assert_eq(kdf.iloc[i], pdf.iloc[i])
+                self.assert_eq(kdf.B.iloc[i], pdf.B.iloc[i])
+
+        self.assertRaises(KeyError, lambda: kdf.iloc[50])
+        self.assertRaises(KeyError, lambda: kdf.iloc[-51])
+
+        # The row counts are cached and reused.
+        self.assertIs(kdf._internal.partition_row_counts, counts)
+
     def test_frame_loc_setitem(self):
         pdf = pd.DataFrame(
             [[1, 2], [4, 5], [7, 8]],
@@ -13,8 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import numpy as np
 import pandas as pd
+from pyspark.sql import functions as F
+from pyspark.sql.types import DoubleType, IntegerType, StringType
 
+from databricks import koalas as ks
 from databricks.koalas.internal import (
     InternalFrame,
     SPARK_DEFAULT_INDEX_NAME,
@@ -87,3 +91,47 @@ class InternalFrameTest(ReusedSQLTestCase, SQLTestUtils):
         self.assertTrue(internal.spark_column_for(("x", "b"))._jc.equals(sdf["(x, b)"]._jc))
 
         self.assert_eq(internal.to_pandas_frame, pdf)
+
+    def test_analyzed_fields(self):
+        pdf = pd.DataFrame({"a": [1, 2, None], "b": ["x", "y", "z"]})
+        kdf = ks.from_pandas(pdf)
+        internal = kdf._internal
+
+        self.assertEqual(internal.spark_type_for(("a",)), DoubleType())
+        self.assertEqual(internal.spark_type_for(internal.spark_column_for(("b",))), StringType())
+        self.assertEqual(internal.spark_column_name_for(("b",)), "b")
+        self.assertEqual(
+            internal.spark_column_name_for(internal.index_spark_columns[0]),
+            SPARK_DEFAULT_INDEX_NAME,
+        )
+        self.assertEqual(internal.spark_type_for(F.lit(1)), IntegerType())
+        self.assertEqual(internal.dtype_for(("b",)), np.dtype("object"))
+        self.assertRaises(KeyError, lambda: internal.spark_column_for(("c",)))
+        self.assertRaises(KeyError, lambda: internal.dtype_for(("c",)))
+
+        # The InternalFrames derived on the same Spark DataFrame share the analyzed fields.
+        copied = internal.copy(column_labels=[("x",), ("y",)])
+        self.assertIs(copied._spark_field_cache, internal._spark_field_cache)
+        self.assertEqual(copied.spark_type_for(("x",)), DoubleType())
+
+        # The new Spark Columns are analyzed.
+        added = internal.with_new_columns(
+            internal.data_spark_columns + [F.lit("s")],
+            column_labels=internal.column_labels + [("c",)],
+        )
+        self.assertEqual(added.spark_type_for(("c",)), StringType())
+        self.assertEqual(added.dtype_for(("c",)), np.dtype("object"))
+
+        reordered = internal.with_new_columns(
+            [internal.spark_column_for(("a",)) + 1], column_labels=[("a",)], keep_order=False
+        )
+        self.assertEqual(reordered.data_spark_column_names, ["(a + 1)"])
+        self.assertEqual(reordered.spark_type_for(("a",)), DoubleType())
+
+        # The fields are carried over through the filter, but the nullability is re-analyzed.
+        filtered = internal.with_filter(internal.spark_column_for(("a",)).isNotNull())
+        self.assertEqual(filtered.spark_type_for(("a",)), DoubleType())
+        self.assertEqual(filtered.data_spark_column_names, ["a", "b"])
+        self.assertFalse(filtered.spark_column_nullable_for(("a",)))
+        self.assertTrue(internal.spark_column_nullable_for(("a",)))
+        self.assert_eq(ks.DataFrame(filtered), pdf.dropna())
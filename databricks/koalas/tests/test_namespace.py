@@ -236,6 +236,36 @@ class NamespaceTest(ReusedSQLTestCase, SQLTestUtils):
             lambda: ks.concat([kdf.A, kdf4.A], join="inner", axis=1),
         )
 
+    def test_concat_many(self):
+        pdfs = [
+            pd.DataFrame({"A": [i, i + 1], "B" if i % 2 == 0 else "C": [i * 10, i * 20]})
+            for i in range(7)
+        ]
+        kdfs = [ks.from_pandas(pdf) for pdf in pdfs]
+
+        for join in ["inner", "outer"]:
+            for ignore_index in [True, False]:
+                self.assert_eq(
+                    ks.concat(kdfs, join=join, ignore_index=ignore_index),
+                    pd.concat(pdfs, join=join, ignore_index=ignore_index),
+                )
+                for checkpoint_every in [1, 3, 10]:
+                    self.assert_eq(
+                        ks.concat(
+                            kdfs,
+                            join=join,
+                            ignore_index=ignore_index,
+                            checkpoint_every=checkpoint_every,
+                        ),
+                        pd.concat(pdfs, join=join, ignore_index=ignore_index),
+                    )
+
+        self.assertRaisesRegex(
+            ValueError,
+            "checkpoint_every must be a positive integer.",
+            lambda: ks.concat(kdfs, checkpoint_every=0),
+        )
+
     def test_concat_column_axis(self):
         pdf1 = pd.DataFrame({"A": [0, 2, 4], "B": [1, 3, 5]}, index=[1, 2, 3])
         pdf1.columns.names = ["AB"]
@@ -303,6 +333,91 @@ class NamespaceTest(ReusedSQLTestCase, SQLTestUtils):
         with self.assertRaisesRegex(ValueError, expected_error_message):
             ks.broadcast(kser)
 
+    def test_merge_asof(self):
+        pleft = pd.DataFrame(
+            {
+                "t": [1, 3, 3, 5, 8, 10, 12, 15, 18, 21, 22, 30],
+                "g": ["a", "b", "a", "a", "b", "a", "b", "b", "a", "a", "b", "a"],
+                "v": ["l0", "l1", "l2", "l3", "l4", "l5", "l6", "l7", "l8", "l9", "l10", "l11"],
+            }
+        )
+        pright = pd.DataFrame(
+            {
+                "t": [0, 2, 3, 3, 6, 9, 11, 14, 20, 25],
+                "g": ["b", "a", "a", "b", "a", "b", "a", "a", "b", "b"],
+                "v": [0.0, 2.0, 3.0, 3.5, 6.0, 9.0, 11.0, 14.0, 20.0, 25.0],
+            }
+        )
+        kleft = ks.from_pandas(pleft)
+        kright = ks.from_pandas(pright)
+
+        def check(kleft, kright, pleft, pright, **kwargs):
+            actual = ks.merge_asof(kleft, kright, **kwargs).to_pandas()
+            expected = pd.merge_asof(pleft, pright, **kwargs)
+            columns = list(expected.columns)
+            self.assert_eq(
+                actual.sort_values(columns).reset_index(drop=True),
+                expected.sort_values(columns).reset_index(drop=True),
+            )
+
+        for direction in ["backward", "forward", "nearest"]:
+            for allow_exact_matches in [True, False]:
+                kwargs = dict(direction=direction, allow_exact_matches=allow_exact_matches)
+                with self.subTest(**kwargs):
+                    check(kleft, kright, pleft, pright, on="t", **kwargs)
+                    check(kleft, kright, pleft, pright, on="t", by="g", **kwargs)
+                    check(kleft, kright, pleft, pright, on="t", by="g", tolerance=2, **kwargs)
+
+        # left_on/right_on, and indexes.
+        check(
+            kleft,
+            kright.rename(columns={"t": "rt"}),
+            pleft,
+            pright.rename(columns={"t": "rt"}),
+            left_on="t",
+            right_on="rt",
+            suffixes=("_l", "_r"),
+        )
+        check(
+            kleft.set_index("t"),
+            kright,
+            pleft.set_index("t"),
+            pright,
+            left_index=True,
+            right_on="t",
+        )
+        check(
+            kleft,
+            kright.set_index("t"),
+            pleft,
+            pright.set_index("t"),
+            left_on="t",
+            right_index=True,
+        )
+        check(
+            kleft.set_index("t"),
+            kright.set_index("t"),
+            pleft.set_index("t"),
+            pright.set_index("t"),
+            left_index=True,
+            right_index=True,
+            by="g",
+        )
+
+        # Datetime keys.
+        pleft["t"] = pd.Timestamp("2020-01-01") + pd.to_timedelta(pleft.t, unit="s")
+        pright["t"] = pd.Timestamp("2020-01-01") + pd.to_timedelta(pright.t, unit="s")
+        kleft = ks.from_pandas(pleft)
+        kright = ks.from_pandas(pright)
+        check(kleft, kright, pleft, pright, on="t", by="g")
+        check(kleft, kright, pleft, pright, on="t", tolerance=pd.Timedelta("1s"))
+
+        self.assertRaises(ValueError, lambda: ks.merge_asof(kleft, kright, on="t", direction="x"))
+        self.assertRaises(ValueError, lambda: ks.merge_asof(kleft, kright, on="t", tolerance=1))
+        self.assertRaises(ValueError, lambda: ks.merge_asof(kleft, kright, on="v"))
+        self.assertRaises(ValueError, lambda: ks.merge_asof(kleft, kright, left_on="t"))
+        self.assertRaises(ValueError, lambda: ks.merge_asof(kleft, kright, on="t", left_by="g"))
+
     def test_get_index_map(self):
         kdf = ks.DataFrame({"year": [2015, 2016], "month": [2, 3], "day": [4, 5]})
         sdf = kdf.to_spark()
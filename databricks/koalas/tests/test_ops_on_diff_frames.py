@@ -32,6 +32,7 @@ from databricks.koalas.typedef.typehints import (
     extension_float_dtypes_available,
     extension_object_dtypes_available,
 )
+from databricks.koalas.utils import combine_frames, combine_frames_on_index, same_anchor
 
 
 class OpsOnDiffFramesEnabledTest(ReusedSQLTestCase, SQLTestUtils):
@@ -611,6 +612,49 @@ class OpsOnDiffFramesEnabledTest(ReusedSQLTestCase, SQLTestUtils):
                         repr(expected.sort_values(list(expected.columns)).reset_index(drop=True)),
                     )
 
+    def test_concat_column_axis_many(self):
+        pdfs = [
+            pd.DataFrame({"A": [0, 2, 4], "B": [1, 3, 5]}, index=[1, 2, 3]),
+            pd.DataFrame({"C": [1, 2, 3]}, index=[1, 3, 5]),
+            pd.DataFrame({"D": [7, 8, 9], "E": ["x", "y", "z"]}, index=[3, 1, 7]),
+            pd.DataFrame({"F": [1.5, None]}, index=[1, 3]),
+        ]
+        kdfs = [ks.from_pandas(pdf) for pdf in pdfs]
+
+        for ignore_index, join in product([True, False], ["inner", "outer"]):
+            with self.subTest(ignore_index=ignore_index, join=join):
+                actual = ks.concat(kdfs, axis=1, ignore_index=ignore_index, join=join)
+                expected = pd.concat(pdfs, axis=1, ignore_index=ignore_index, join=join)
+                self.assert_eq(
+                    repr(actual.sort_values(list(actual.columns)).reset_index(drop=True)),
+                    repr(expected.sort_values(list(expected.columns)).reset_index(drop=True)),
+                )
+
+    def test_combine_frames_on_index(self):
+        kdf1 = ks.DataFrame({"A": [1.0, 2.0, 3.0]}, index=[1, 1, None])
+        kdf2 = ks.DataFrame({"B": [4.0, 5.0]}, index=[1, None])
+        kdf3 = ks.DataFrame({"C": [6.0, 7.0]}, index=[1, 2])
+
+        # The rows with null in the index never match.
+        combined = combine_frames_on_index([kdf1, kdf2, kdf3])
+        expected = pd.DataFrame(
+            {
+                "A": [1.0, 2.0, 3.0, None, None],
+                "B": [4.0, 4.0, None, 5.0, None],
+                "C": [6.0, 6.0, None, None, 7.0],
+            },
+            index=[1, 1, None, None, 2],
+        )
+        self.assert_eq(
+            combined.to_pandas().sort_values(["A", "B", "C"]),
+            expected.sort_values(["A", "B", "C"]),
+        )
+
+        combined = combine_frames_on_index([kdf1, kdf2, kdf3], how="inner")
+        self.assert_eq(
+            combined.to_pandas().sort_values("A"), expected.dropna().sort_values("A"),
+        )
+
     def test_combine_first(self):
         pser1 = pd.Series({"falcon": 330.0, "eagle": 160.0})
         pser2 = pd.Series({"falcon": 345.0, "eagle": 200.0, "duck": 30.0})
@@ -901,6 +945,51 @@ class OpsOnDiffFramesEnabledTest(ReusedSQLTestCase, SQLTestUtils):
 
         self.assert_eq((kdf1 + kdf4).sort_index(), (pdf1 + pdf4).sort_index(), almost=True)
 
+    def test_shared_join(self):
+        kdf1 = self.kdf1
+        kdf2 = self.kdf2
+        pdf1 = self.pdf1
+        pdf2 = self.pdf2
+
+        kser1 = kdf1.a + kdf2.b
+        kser2 = kdf1.b - kdf2.a
+        self.assertTrue(same_anchor(kser1, kser2))
+        self.assert_eq(
+            (kser1 * kser2).sort_index(), ((pdf1.a + pdf2.b) * (pdf1.b - pdf2.a)).sort_index()
+        )
+
+        # The derived columns are not the columns of the anchor as they are.
+        kser3 = (kdf1.a + 1) + kdf2.b
+        self.assertFalse(same_anchor(kser1, kser3))
+        self.assert_eq(kser3.sort_index(), ((pdf1.a + 1) + pdf2.b).sort_index())
+
+    def test_zip_on_default_index(self):
+        kdf1 = ks.range(10)
+        kdf2 = DataFrame(kdf1.assign(x=kdf1.id * 2)._internal.resolved_copy)
+        pdf1 = kdf1.to_pandas()
+        pdf2 = kdf2.to_pandas()
+
+        for how in ["full", "inner", "left"]:
+            combined = combine_frames(kdf1, kdf2, how=how)
+            self.assertNotIn(
+                "Join", combined._internal.spark_frame._jdf.queryExecution().analyzed().toString()
+            )
+            combined = combine_frames(kdf2, kdf1, how=how, preserve_order_column=True)
+            self.assertNotIn(
+                "Join", combined._internal.spark_frame._jdf.queryExecution().analyzed().toString()
+            )
+
+        self.assert_eq((kdf1.id + kdf2.x).sort_index(), (pdf1.id + pdf2.x).sort_index())
+        self.assert_eq((kdf2.x - kdf1.id).sort_index(), (pdf2.x - pdf1.id).sort_index())
+
+        # The index from pandas may not be unique.
+        kdf1 = ks.from_pandas(pdf1)
+        kdf2 = DataFrame(kdf1._internal.resolved_copy)
+        combined = combine_frames(kdf1, kdf2)
+        self.assertIn(
+            "Join", combined._internal.spark_frame._jdf.queryExecution().analyzed().toString()
+        )
+
     def test_assignment_series(self):
         kdf = ks.from_pandas(self.pdf1)
         pdf = self.pdf1
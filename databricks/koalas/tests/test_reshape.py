@@ -53,6 +53,60 @@ class ReshapeTest(ReusedSQLTestCase):
         ):
             ks.get_dummies(kser, sparse=True)
 
+    def test_get_dummies_fit(self):
+        pdf = pd.DataFrame({"a": [1, 2, 3, 4, 4, 3, 2, 1], "b": list("abcdabcd")})
+        kdf = ks.from_pandas(pdf)
+
+        encoder = ks.get_dummies.fit(kdf, columns=["a", "b"], drop_first=True)
+        self.assertEqual(encoder.categories, {"a": [1, 2, 3, 4], "b": ["a", "b", "c", "d"]})
+        self.assert_eq(
+            encoder.transform(kdf),
+            pd.get_dummies(pdf, columns=["a", "b"], drop_first=True, dtype=np.int8),
+        )
+
+        # The values not seen in fitting have no dummy set.
+        pdf2 = pd.DataFrame({"a": [1, 5], "b": ["d", "e"]})
+        self.assert_eq(
+            encoder.transform(ks.from_pandas(pdf2)),
+            pd.DataFrame(
+                [[0, 0, 0, 0, 0, 1], [0, 0, 0, 0, 0, 0]],
+                columns=["a_2", "a_3", "a_4", "b_b", "b_c", "b_d"],
+                dtype=np.int8,
+            ),
+        )
+        self.assertRaises(KeyError, lambda: encoder.transform(kdf[["a"]]))
+
+        # Only the most frequent categories are kept.
+        kser = ks.Series(list("abcaaccd"))
+        encoder = ks.get_dummies.fit(kser, max_categories=2)
+        self.assertEqual(encoder.categories, {0: ["a", "c"]})
+        self.assertRaises(ValueError, lambda: ks.get_dummies.fit(kser, max_categories=0))
+
+        # Each column is encoded into a column of sparse vectors.
+        kser = ks.Series(["a", "c", None, "b"])
+        encoder = ks.get_dummies.fit(kser, dummy_na=True)
+        vectors = encoder.transform(kser, sparse=True).sort_index()[0].to_numpy()
+        self.assertEqual(
+            [vector.toArray().tolist() for vector in vectors],
+            [
+                [1.0, 0.0, 0.0, 0.0],
+                [0.0, 0.0, 1.0, 0.0],
+                [0.0, 0.0, 0.0, 1.0],
+                [0.0, 1.0, 0.0, 0.0],
+            ],
+        )
+
+        # The values not in the categories have no dummy set, and the vectors are built
+        # without a Python UDF.
+        kdf = encoder.transform(ks.Series(["a", "d"]), sparse=True)
+        self.assertEqual(
+            [vector.toArray().tolist() for vector in kdf.sort_index()[0].to_numpy()],
+            [[1.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0]],
+        )
+        self.assertNotIn(
+            "BatchEvalPython", kdf._internal.spark_frame._jdf.queryExecution().toString()
+        )
+
     def test_get_dummies_object(self):
         pdf = pd.DataFrame(
             {
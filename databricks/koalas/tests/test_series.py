@@ -1355,7 +1355,7 @@ class SeriesTest(ReusedSQLTestCase, SQLTestUtils):
         self.assert_eq(pser.rank(method="first"), kser.rank(method="first").sort_index())
         self.assert_eq(pser.rank(method="dense"), kser.rank(method="dense").sort_index())
 
-        msg = "method must be one of 'average', 'min', 'max', 'first', 'dense'"
+        msg = "method must be one of 'average', 'min', 'max', 'first', 'dense', 'approx'"
         with self.assertRaisesRegex(ValueError, msg):
             kser.rank(method="nothing")
 
@@ -2038,6 +2038,11 @@ class SeriesTest(ReusedSQLTestCase, SQLTestUtils):
         self.assert_eq(repr(kser.asof(-100)), repr(pser.asof(-100)))
         self.assert_eq(kser.asof([-100, 100]).sort_index(), pser.asof([-100, 100]).sort_index())
 
+        pser2 = pd.Series([5, 1, np.nan, 3, 2], index=[10, 20, 30, 40, 50], name="Koalas")
+        kser2 = ks.from_pandas(pser2)
+        self.assert_eq(kser2.asof(35), pser2.asof(35))
+        self.assert_eq(kser2.asof([55, 5, 35, 20, 30]), pser2.asof([55, 5, 35, 20, 30]))
+
         # where cannot be an Index, Series or a DataFrame
         self.assertRaises(ValueError, lambda: kser.asof(ks.Index([-100, 100])))
         self.assertRaises(ValueError, lambda: kser.asof(ks.Series([-100, 100])))
@@ -2060,6 +2065,12 @@ class SeriesTest(ReusedSQLTestCase, SQLTestUtils):
         self.assert_eq(kser.asof("2014-01-02"), pser.asof("2014-01-02"))
         self.assert_eq(repr(kser.asof("1999-01-02")), repr(pser.asof("1999-01-02")))
 
+        # The index types which `merge_asof` does not support.
+        pser = pd.Series([1, 2, np.nan, 4], index=["a", "c", "e", "g"], name="Koalas")
+        kser = ks.from_pandas(pser)
+        self.assert_eq(kser.asof("f"), pser.asof("f"))
+        self.assert_eq(kser.asof(["h", "0", "f", "c"]), pser.asof(["h", "0", "f", "c"]))
+
     def test_squeeze(self):
         # Single value
         pser = pd.Series([90])
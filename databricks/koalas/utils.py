@@ -24,12 +24,13 @@ from distutils.version import LooseVersion
 import os
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 import warnings
+from weakref import WeakKeyDictionary
 
 import pyarrow
 import pyspark
-from pyspark import sql as spark
-from pyspark.sql import functions as F
-from pyspark.sql.types import DoubleType
+from pyspark import SparkContext, sql as spark
+from pyspark.sql import functions as F, Column
+from pyspark.sql.types import DoubleType, StructField, StructType
 import pandas as pd
 from pandas.api.types import is_list_like
 
@@ -106,15 +107,13 @@ def combine_frames(this, *args, how="full", preserve_order_column=False):
     It internally performs a join operation which can be expensive in general.
     So, if `compute.ops_on_diff_frames` option is False,
     this method throws an exception.
+
+    The join is shared by the combinations of the same pair of anchors when possible, and
+    skipped when one is a projection of the other keeping the same default index.
     """
     from databricks.koalas.config import get_option
     from databricks.koalas.frame import DataFrame
-    from databricks.koalas.internal import (
-        InternalFrame,
-        HIDDEN_COLUMNS,
-        NATURAL_ORDER_COLUMN_NAME,
-        SPARK_INDEX_NAME_FORMAT,
-    )
+    from databricks.koalas.internal import InternalFrame, SPARK_INDEX_NAME_FORMAT
     from databricks.koalas.series import Series
 
     if all(isinstance(arg, Series) for arg in args):
@@ -133,120 +132,45 @@ def combine_frames(this, *args, how="full", preserve_order_column=False):
         raise AssertionError("args should be single DataFrame or " "single/multiple Series")
 
     if get_option("compute.ops_on_diff_frames"):
+        this_internal = this._internal
+        that_internal = that._internal
 
-        def resolve(internal, side):
-            rename = lambda col: "__{}_{}".format(side, col)
-            internal = internal.resolved_copy
-            sdf = internal.spark_frame
-            sdf = internal.spark_frame.select(
-                [
-                    scol_for(sdf, col).alias(rename(col))
-                    for col in sdf.columns
-                    if col not in HIDDEN_COLUMNS
-                ]
-                + list(HIDDEN_COLUMNS)
-            )
-            return internal.copy(
-                spark_frame=sdf,
-                index_spark_columns=[
-                    scol_for(sdf, rename(col)) for col in internal.index_spark_column_names
-                ],
-                data_spark_columns=[
-                    scol_for(sdf, rename(col)) for col in internal.data_spark_column_names
-                ],
-            )
-
-        this_internal = resolve(this._internal, "this")
-        that_internal = resolve(that._internal, "that")
-
-        this_index_map = list(
-            zip(
-                this_internal.index_spark_column_names,
-                this_internal.index_names,
-                this_internal.index_dtypes,
-            )
-        )
-        that_index_map = list(
-            zip(
-                that_internal.index_spark_column_names,
-                that_internal.index_names,
-                that_internal.index_dtypes,
-            )
-        )
-        assert len(this_index_map) == len(that_index_map)
-
-        join_scols = []
-        merged_index_scols = []
-
-        # Note that the order of each element in index_map is guaranteed according to the index
-        # level.
-        this_and_that_index_map = list(zip(this_index_map, that_index_map))
-
-        this_sdf = this_internal.spark_frame.alias("this")
-        that_sdf = that_internal.spark_frame.alias("that")
+        assert this_internal.index_level == that_internal.index_level
 
         # If the same named index is found, that's used.
-        index_column_names = []
-        index_use_extension_dtypes = []
-        for (
-            i,
-            ((this_column, this_name, this_dtype), (that_column, that_name, that_dtype)),
-        ) in enumerate(this_and_that_index_map):
-            if this_name == that_name:
-                # We should merge the Spark columns into one
-                # to mimic pandas' behavior.
-                this_scol = scol_for(this_sdf, this_column)
-                that_scol = scol_for(that_sdf, that_column)
-                join_scol = this_scol == that_scol
-                join_scols.append(join_scol)
-
-                column_name = SPARK_INDEX_NAME_FORMAT(i)
-                index_column_names.append(column_name)
-                index_use_extension_dtypes.append(
-                    any(isinstance(dtype, extension_dtypes) for dtype in [this_dtype, that_dtype])
-                )
-                merged_index_scols.append(
-                    F.when(this_scol.isNotNull(), this_scol).otherwise(that_scol).alias(column_name)
-                )
-            else:
+        for this_name, that_name in zip(this_internal.index_names, that_internal.index_names):
+            if this_name != that_name:
                 raise ValueError("Index names must be exactly matched currently.")
 
-        assert len(join_scols) > 0, "cannot join with no overlapping index names"
-
-        joined_df = this_sdf.join(that_sdf, on=join_scols, how=how)
-
-        if preserve_order_column:
-            order_column = [scol_for(this_sdf, NATURAL_ORDER_COLUMN_NAME)]
-        else:
-            order_column = []
+        assert this_internal.index_level > 0, "cannot join with no overlapping index names"
 
-        joined_df = joined_df.select(
-            merged_index_scols
-            + [
-                scol_for(this_sdf, this_internal.spark_column_name_for(label))
-                for label in this_internal.column_labels
-            ]
-            + [
-                scol_for(that_sdf, that_internal.spark_column_name_for(label))
-                for label in that_internal.column_labels
-            ]
-            + order_column
-        )
+        combined = _zip_spark_frames(this_internal, that_internal, preserve_order_column)
+        if combined is None:
+            combined = _join_cached_spark_frames(
+                this_internal, that_internal, how, preserve_order_column
+            )
+        if combined is None:
+            combined = _join_spark_frames(this_internal, that_internal, how, preserve_order_column)
+        joined_df, this_data_columns, that_data_columns = combined
 
-        index_spark_columns = [scol_for(joined_df, col) for col in index_column_names]
+        index_spark_columns = [
+            scol_for(joined_df, SPARK_INDEX_NAME_FORMAT(i))
+            for i in range(this_internal.index_level)
+        ]
         index_dtypes = [
-            spark_type_to_pandas_dtype(field.dataType, use_extension_dtypes=use_extension_dtypes)
-            for field, use_extension_dtypes in zip(
-                joined_df.select(index_spark_columns).schema, index_use_extension_dtypes
+            spark_type_to_pandas_dtype(
+                field.dataType,
+                use_extension_dtypes=any(
+                    isinstance(dtype, extension_dtypes) for dtype in [this_dtype, that_dtype]
+                ),
+            )
+            for field, this_dtype, that_dtype in zip(
+                joined_df.select(index_spark_columns).schema,
+                this_internal.index_dtypes,
+                that_internal.index_dtypes,
             )
         ]
 
-        index_columns = set(index_column_names)
-        new_data_columns = [
-            col
-            for col in joined_df.columns
-            if col not in index_columns and col != NATURAL_ORDER_COLUMN_NAME
-        ]
         data_dtypes = this_internal.data_dtypes + that_internal.data_dtypes
 
         level = max(this_internal.column_labels_level, that_internal.column_labels_level)
@@ -270,7 +194,9 @@ def combine_frames(this, *args, how="full", preserve_order_column=False):
                 index_names=this_internal.index_names,
                 index_dtypes=index_dtypes,
                 column_labels=column_labels,
-                data_spark_columns=[scol_for(joined_df, col) for col in new_data_columns],
+                data_spark_columns=[
+                    scol_for(joined_df, col) for col in this_data_columns + that_data_columns
+                ],
                 data_dtypes=data_dtypes,
                 column_label_names=column_label_names,
             )
@@ -279,6 +205,477 @@ def combine_frames(this, *args, how="full", preserve_order_column=False):
         raise ValueError(ERROR_MESSAGE_CANNOT_COMBINE)
 
 
+def combine_frames_on_index(kdfs: List["DataFrame"], how: str = "full") -> "DataFrame":
+    """
+    Combine the columns of the given DataFrames with different anchors aligned on the index.
+
+    Unlike chaining `combine_frames`, which performs a join for each DataFrame, the rows of
+    all the DataFrames are co-grouped by the index in a single shuffle, and the rows of each
+    DataFrame sharing an index value are paired up as the joins would do.
+
+    :param kdfs: the DataFrames to combine, which have unique column labels among them.
+    :param how: 'full' or 'inner'.
+    :return: the DataFrame which has the columns of all the DataFrames in order and
+             the merged index.
+    """
+    from databricks.koalas.config import get_option
+    from databricks.koalas.frame import DataFrame
+    from databricks.koalas.internal import InternalFrame, SPARK_INDEX_NAME_FORMAT
+
+    assert how in ("full", "inner"), how
+    assert len(kdfs) > 1
+
+    if not get_option("compute.ops_on_diff_frames"):
+        raise ValueError(ERROR_MESSAGE_CANNOT_COMBINE)
+
+    internals = [kdf._internal for kdf in kdfs]
+    index_level = internals[0].index_level
+    assert index_level > 0, "cannot join with no overlapping index names"
+    for internal in internals[1:]:
+        assert internal.index_level == index_level
+        # If the same named index is found, that's used.
+        if internal.index_names != internals[0].index_names:
+            raise ValueError("Index names must be exactly matched currently.")
+
+    index_column_names = [SPARK_INDEX_NAME_FORMAT(i) for i in range(index_level)]
+    row_column_names = ["__row_{}__".format(i) for i in range(len(internals))]
+    null_key_column_name = "__null_key__"
+
+    row_types = [
+        StructType(
+            [
+                StructField(col, internal.spark_type_for(scol))
+                for scol, col in zip(internal.data_spark_columns, internal.data_spark_column_names)
+            ]
+        )
+        for internal in internals
+    ]
+
+    # Project every DataFrame into the same layout: the index columns, and its data columns
+    # as a struct in its own row column.
+    sdfs = []
+    for i, internal in enumerate(internals):
+        sdfs.append(
+            internal.spark_frame.select(
+                [
+                    scol.alias(name)
+                    for scol, name in zip(internal.index_spark_columns, index_column_names)
+                ]
+                + [
+                    (
+                        F.struct(
+                            *[
+                                scol.alias(col)
+                                for scol, col in zip(
+                                    internal.data_spark_columns, internal.data_spark_column_names
+                                )
+                            ]
+                        )
+                        if j == i
+                        else F.lit(None).cast(row_types[j])
+                    ).alias(name)
+                    for j, name in enumerate(row_column_names)
+                ]
+            )
+        )
+    sdf = functools.reduce(lambda x, y: x.union(y), sdfs)
+
+    # The rows with null in the index never match with any rows.
+    sdf = sdf.withColumn(
+        null_key_column_name,
+        F.when(
+            functools.reduce(
+                lambda x, y: x | y, [scol_for(sdf, col).isNull() for col in index_column_names]
+            ),
+            F.monotonically_increasing_id(),
+        ),
+    )
+
+    sdf = sdf.groupby(index_column_names + [null_key_column_name]).agg(
+        *[F.collect_list(scol_for(sdf, name)).alias(name) for name in row_column_names]
+    )
+    if how == "inner":
+        sdf = sdf.filter(
+            functools.reduce(
+                lambda x, y: x & y, [F.size(scol_for(sdf, name)) > 0 for name in row_column_names],
+            )
+        )
+    else:
+        sdf = sdf.select(
+            [scol_for(sdf, col) for col in index_column_names]
+            + [
+                F.when(F.size(scol_for(sdf, name)) > 0, scol_for(sdf, name))
+                .otherwise(F.array(F.lit(None).cast(row_type)))
+                .alias(name)
+                for name, row_type in zip(row_column_names, row_types)
+            ]
+        )
+    # Pair up the rows of each DataFrame sharing the index value.
+    for name in row_column_names:
+        sdf = sdf.withColumn(name, F.explode(scol_for(sdf, name)))
+
+    data_columns = []
+    data_column_names = []  # type: List[str]
+    for i, (internal, name) in enumerate(zip(internals, row_column_names)):
+        for col in internal.data_spark_column_names:
+            new_col = col if col not in data_column_names else "__{}_{}".format(i, col)
+            data_columns.append(scol_for(sdf, name).getField(col).alias(new_col))
+            data_column_names.append(new_col)
+    sdf = sdf.select([scol_for(sdf, col) for col in index_column_names] + data_columns)
+
+    index_dtypes = [
+        spark_type_to_pandas_dtype(
+            field.dataType,
+            use_extension_dtypes=any(
+                isinstance(internal.index_dtypes[i], extension_dtypes) for internal in internals
+            ),
+        )
+        for i, field in enumerate(sdf.select(index_column_names).schema)
+    ]
+
+    return DataFrame(
+        InternalFrame(
+            spark_frame=sdf,
+            index_spark_columns=[scol_for(sdf, col) for col in index_column_names],
+            index_names=internals[0].index_names,
+            index_dtypes=index_dtypes,
+            column_labels=[label for internal in internals for label in internal.column_labels],
+            data_spark_columns=[scol_for(sdf, col) for col in data_column_names],
+            data_dtypes=[dtype for internal in internals for dtype in internal.data_dtypes],
+            column_label_names=internals[0].column_label_names,
+        )
+    )
+
+
+def _join_spark_frames(
+    this_internal: "InternalFrame",
+    that_internal: "InternalFrame",
+    how: str,
+    preserve_order_column: bool,
+) -> Tuple[spark.DataFrame, List[str], List[str]]:
+    """
+    Join the resolved Spark DataFrames of the given InternalFrames on the index.
+
+    :return: the joined Spark DataFrame which has the merged index columns named by
+             `SPARK_INDEX_NAME_FORMAT`, and the names of the data columns of `this_internal`
+             and `that_internal` in it.
+    """
+    from databricks.koalas.internal import (
+        HIDDEN_COLUMNS,
+        NATURAL_ORDER_COLUMN_NAME,
+        SPARK_INDEX_NAME_FORMAT,
+    )
+
+    def resolve(internal, side):
+        rename = lambda col: "__{}_{}".format(side, col)
+        internal = internal.resolved_copy
+        sdf = internal.spark_frame
+        sdf = internal.spark_frame.select(
+            [
+                scol_for(sdf, col).alias(rename(col))
+                for col in sdf.columns
+                if col not in HIDDEN_COLUMNS
+            ]
+            + list(HIDDEN_COLUMNS)
+        )
+        return internal.copy(
+            spark_frame=sdf,
+            index_spark_columns=[
+                scol_for(sdf, rename(col)) for col in internal.index_spark_column_names
+            ],
+            data_spark_columns=[
+                scol_for(sdf, rename(col)) for col in internal.data_spark_column_names
+            ],
+        )
+
+    this_internal = resolve(this_internal, "this")
+    that_internal = resolve(that_internal, "that")
+
+    this_sdf = this_internal.spark_frame.alias("this")
+    that_sdf = that_internal.spark_frame.alias("that")
+
+    join_scols = []
+    merged_index_scols = []
+
+    # Note that the order of each element in index_spark_column_names is guaranteed according
+    # to the index level.
+    for i, (this_column, that_column) in enumerate(
+        zip(this_internal.index_spark_column_names, that_internal.index_spark_column_names)
+    ):
+        # We should merge the Spark columns into one
+        # to mimic pandas' behavior.
+        this_scol = scol_for(this_sdf, this_column)
+        that_scol = scol_for(that_sdf, that_column)
+        join_scols.append(this_scol == that_scol)
+        merged_index_scols.append(
+            F.when(this_scol.isNotNull(), this_scol)
+            .otherwise(that_scol)
+            .alias(SPARK_INDEX_NAME_FORMAT(i))
+        )
+
+    joined_df = this_sdf.join(that_sdf, on=join_scols, how=how)
+
+    if preserve_order_column:
+        order_column = [scol_for(this_sdf, NATURAL_ORDER_COLUMN_NAME)]
+    else:
+        order_column = []
+
+    this_data_columns = this_internal.data_spark_column_names
+    that_data_columns = that_internal.data_spark_column_names
+
+    joined_df = joined_df.select(
+        merged_index_scols
+        + [scol_for(this_sdf, col) for col in this_data_columns]
+        + [scol_for(that_sdf, col) for col in that_data_columns]
+        + order_column
+    )
+    return joined_df, this_data_columns, that_data_columns
+
+
+# The Spark DataFrames joined on the index by `combine_frames`, per the pair of the Spark
+# DataFrames of the anchors. The join keeps all the columns of both Spark DataFrames so that
+# the operations between any columns of the same pair of anchors share one join, and the
+# combined DataFrames are on the same anchor.
+_JOINED_SPARK_FRAMES = (
+    WeakKeyDictionary()
+)  # type: WeakKeyDictionary[spark.DataFrame, WeakKeyDictionary]
+
+
+def _join_cached_spark_frames(
+    this_internal: "InternalFrame",
+    that_internal: "InternalFrame",
+    how: str,
+    preserve_order_column: bool,
+) -> Optional[Tuple[spark.DataFrame, List[str], List[str]]]:
+    """
+    Join the Spark DataFrames of the given InternalFrames on the index as `_join_spark_frames`,
+    reusing the join of the same pair of Spark DataFrames.
+
+    This is only possible when the index and data columns are the columns of the Spark
+    DataFrames as they are, possibly renamed; otherwise, None is returned.
+    """
+    from databricks.koalas.internal import (
+        HIDDEN_COLUMNS,
+        NATURAL_ORDER_COLUMN_NAME,
+        SPARK_INDEX_NAME_FORMAT,
+    )
+
+    this_sdf = this_internal.spark_frame
+    that_sdf = that_internal.spark_frame
+
+    this_index_columns = _spark_frame_column_names(this_sdf, this_internal.index_spark_columns)
+    that_index_columns = _spark_frame_column_names(that_sdf, that_internal.index_spark_columns)
+    this_data_columns = _spark_frame_column_names(this_sdf, this_internal.data_spark_columns)
+    that_data_columns = _spark_frame_column_names(that_sdf, that_internal.data_spark_columns)
+    if (
+        this_index_columns is None
+        or that_index_columns is None
+        or this_data_columns is None
+        or that_data_columns is None
+        or len(set(this_data_columns)) != len(this_data_columns)
+        or len(set(that_data_columns)) != len(that_data_columns)
+    ):
+        return None
+
+    key = (tuple(this_index_columns), tuple(that_index_columns), how, preserve_order_column)
+    joined_dfs = _JOINED_SPARK_FRAMES.setdefault(this_sdf, WeakKeyDictionary()).setdefault(
+        that_sdf, {}
+    )
+    if key not in joined_dfs:
+        # Rename the columns of both sides so that the columns from the same lineage are
+        # not ambiguous in the join.
+        this_renamed = this_sdf.select(
+            [
+                scol_for(this_sdf, col).alias("__this_{}".format(col))
+                for col in this_sdf.columns
+                if col not in HIDDEN_COLUMNS
+            ]
+            + [scol_for(this_sdf, NATURAL_ORDER_COLUMN_NAME).alias(NATURAL_ORDER_COLUMN_NAME)]
+        )
+        that_renamed = that_sdf.select(
+            [
+                scol_for(that_sdf, col).alias("__that_{}".format(col))
+                for col in that_sdf.columns
+                if col not in HIDDEN_COLUMNS
+            ]
+        )
+
+        join_scols = []
+        merged_index_scols = []
+        for i, (this_column, that_column) in enumerate(zip(this_index_columns, that_index_columns)):
+            this_scol = scol_for(this_renamed, "__this_{}".format(this_column))
+            that_scol = scol_for(that_renamed, "__that_{}".format(that_column))
+            join_scols.append(this_scol == that_scol)
+            merged_index_scols.append(
+                F.when(this_scol.isNotNull(), this_scol)
+                .otherwise(that_scol)
+                .alias(SPARK_INDEX_NAME_FORMAT(i))
+            )
+
+        # The order column is attached here so that InternalFrame does not attach another one
+        # with another Spark DataFrame.
+        if preserve_order_column:
+            order_column = scol_for(this_renamed, NATURAL_ORDER_COLUMN_NAME)
+        else:
+            order_column = F.monotonically_increasing_id().alias(NATURAL_ORDER_COLUMN_NAME)
+
+        joined_df = this_renamed.join(that_renamed, on=join_scols, how=how)
+        joined_dfs[key] = joined_df.select(
+            merged_index_scols
+            + [
+                scol_for(this_renamed, col)
+                for col in this_renamed.columns
+                if col != NATURAL_ORDER_COLUMN_NAME
+            ]
+            + [scol_for(that_renamed, col) for col in that_renamed.columns]
+            + [order_column]
+        )
+
+    return (
+        joined_dfs[key],
+        ["__this_{}".format(col) for col in this_data_columns],
+        ["__that_{}".format(col) for col in that_data_columns],
+    )
+
+
+def _zip_spark_frames(
+    this_internal: "InternalFrame", that_internal: "InternalFrame", preserve_order_column: bool
+) -> Optional[Tuple[spark.DataFrame, List[str], List[str]]]:
+    """
+    Combine the given InternalFrames side by side without a join, when the Spark DataFrame of
+    one is a projection of the Spark DataFrame of the other and both keep the same default
+    index, which is unique. Otherwise, None is returned.
+
+    The columns of the projection are inlined into the other Spark DataFrame, so any join
+    type gives the same result as `_join_spark_frames`.
+    """
+    from databricks.koalas.internal import (
+        NATURAL_ORDER_COLUMN_NAME,
+        SPARK_INDEX_NAME_FORMAT,
+        _DEFAULT_INDEX_SPARK_FRAMES,
+    )
+
+    if this_internal.index_level != 1:
+        return None
+
+    this_plan = this_internal.spark_frame._jdf.queryExecution().analyzed()
+    that_plan = that_internal.spark_frame._jdf.queryExecution().analyzed()
+    if that_plan.getClass().getSimpleName() == "Project" and that_plan.child().equals(this_plan):
+        base_internal, projected_internal = this_internal, that_internal
+        projected_plan = that_plan
+    elif this_plan.getClass().getSimpleName() == "Project" and this_plan.child().equals(that_plan):
+        base_internal, projected_internal = that_internal, this_internal
+        projected_plan = this_plan
+    else:
+        return None
+
+    # The index of the base must be the default index of a Spark DataFrame which the base is
+    # derived from only by projections and filters, so that it is still unique.
+    index_expr = _unwrap_alias(base_internal.index_spark_columns[0]._jc.expr())
+    if index_expr.getClass().getSimpleName() != "AttributeReference":
+        return None
+    default_index_sdf = _DEFAULT_INDEX_SPARK_FRAMES.get(index_expr.exprId().id())
+    if default_index_sdf is None:
+        return None
+    default_index_plan = default_index_sdf._jdf.queryExecution().analyzed()
+    plan = base_internal.spark_frame._jdf.queryExecution().analyzed()
+    while not plan.equals(default_index_plan):
+        if plan.getClass().getSimpleName() not in ("Project", "Filter"):
+            return None
+        plan = plan.child()
+
+    # The columns of the projection are rebound to their definitions in the projection.
+    project_list = projected_plan.projectList()
+    definitions = {}
+    for i in range(project_list.size()):
+        named_expr = project_list.apply(i)
+        definitions[named_expr.exprId().id()] = named_expr
+
+    jvm = SparkContext._active_spark_context._jvm
+
+    def inline(scol: Column) -> Optional[Column]:
+        expr = _unwrap_alias(scol._jc.expr())
+        if expr.getClass().getSimpleName() != "AttributeReference":
+            return None
+        definition = definitions.get(expr.exprId().id())
+        if definition is None:
+            return None
+        return Column(jvm.Column(definition))
+
+    projected_index_scol = inline(projected_internal.index_spark_columns[0])
+    if projected_index_scol is None or not _unwrap_alias(
+        projected_index_scol._jc.expr()
+    ).semanticEquals(index_expr):
+        return None
+
+    projected_data_spark_columns = []
+    for scol in projected_internal.data_spark_columns:
+        inlined = inline(scol)
+        if inlined is None:
+            return None
+        projected_data_spark_columns.append(inlined)
+
+    if base_internal is this_internal:
+        this_data_spark_columns = this_internal.data_spark_columns
+        that_data_spark_columns = projected_data_spark_columns
+    else:
+        this_data_spark_columns = projected_data_spark_columns
+        that_data_spark_columns = that_internal.data_spark_columns
+
+    if preserve_order_column:
+        order_scol = scol_for(this_internal.spark_frame, NATURAL_ORDER_COLUMN_NAME)
+        if base_internal is not this_internal:
+            inlined = inline(order_scol)
+            if inlined is None:
+                return None
+            order_scol = inlined
+        order_column = [order_scol.alias(NATURAL_ORDER_COLUMN_NAME)]
+    else:
+        order_column = []
+
+    this_data_columns = ["__this_{}".format(col) for col in this_internal.data_spark_column_names]
+    that_data_columns = ["__that_{}".format(col) for col in that_internal.data_spark_column_names]
+    zipped_df = base_internal.spark_frame.select(
+        [base_internal.index_spark_columns[0].alias(SPARK_INDEX_NAME_FORMAT(0))]
+        + [scol.alias(col) for scol, col in zip(this_data_spark_columns, this_data_columns)]
+        + [scol.alias(col) for scol, col in zip(that_data_spark_columns, that_data_columns)]
+        + order_column
+    )
+    return zipped_df, this_data_columns, that_data_columns
+
+
+def _unwrap_alias(jexpr):
+    """ Strip the aliases from the given Java expression. """
+    while jexpr.getClass().getSimpleName() == "Alias":
+        jexpr = jexpr.child()
+    return jexpr
+
+
+def _spark_frame_column_names(
+    sdf: spark.DataFrame, scols: List[spark.Column]
+) -> Optional[List[str]]:
+    """
+    Return the column names in the given Spark DataFrame of the given Spark Columns if all of
+    them are the columns of the Spark DataFrame as they are, possibly renamed; otherwise, None.
+    """
+    columns = sdf.columns
+    if len(set(columns)) != len(columns):
+        return None
+    names = []
+    for scol in scols:
+        expr = _unwrap_alias(scol._jc.expr())
+        if expr.getClass().getSimpleName() != "AttributeReference":
+            return None
+        name = expr.name()
+        if (
+            name not in columns
+            or scol_for(sdf, name)._jc.expr().exprId().id() != expr.exprId().id()
+        ):
+            return None
+        names.append(name)
+    return names
+
+
 def align_diff_frames(
     resolve_func,
     this: "DataFrame",
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2019 Databricks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+A benchmark of reading a few columns of a wide, date-partitioned Parquet dataset with a date
+filter: filtering after `read_parquet`, with and without 'compute.lazy_default_index', versus
+passing `columns` and `filters` to it, which are pushed down into the scan before the default
+index is attached. The default index is used in the aggregation.
+Before running this, make sure you install koalas from the current checkout by running:
+pip install -e .
+
+Usage: python dev/benchmark_read_pushdown.py [number of rows] [number of columns] [repeats]
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+
+from pyspark.sql import functions as F
+
+from databricks import koalas as ks
+
+
+def _time(name, func, repeats):
+    func()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    elapsed = (time.perf_counter() - start) / repeats
+    print("{:<40}{:>10.3f} s".format(name, elapsed))
+
+
+def _main():
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    num_columns = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    path = tempfile.mkdtemp(prefix="benchmark_read_pushdown")
+    try:
+        sdf = ks.range(num_rows).to_spark()
+        sdf = sdf.select(
+            F.expr("date_add(DATE'2024-01-01', CAST(id % 30 AS INT) - 15)").alias("date"),
+            *[(sdf["id"] + i).alias("c{}".format(i)) for i in range(num_columns)]
+        )
+        sdf.write.partitionBy("date").parquet(path, mode="overwrite")
+
+        columns = ["c0", "c1", "c2"]
+
+        def filter_after_read():
+            kdf = ks.read_parquet(path)
+            kdf = kdf[kdf.date > "2024-01-01"][columns]
+            return kdf.reset_index().sum().to_pandas()
+
+        def filter_after_read_with_lazy_default_index():
+            with ks.option_context("compute.lazy_default_index", True):
+                kdf = ks.read_parquet(path)
+            kdf = kdf[kdf.date > "2024-01-01"][columns]
+            return kdf.reset_index().sum().to_pandas()
+
+        def pushdown():
+            kdf = ks.read_parquet(path, columns=columns, filters=[("date", ">", "2024-01-01")])
+            return kdf.reset_index().sum().to_pandas()
+
+        print(
+            "{} rows, {} columns, average of {} runs, default index '{}'".format(
+                num_rows, num_columns, repeats, ks.get_option("compute.default_index_type")
+            )
+        )
+        _time("filter after read_parquet", filter_after_read, repeats)
+        _time("... with lazy default index", filter_after_read_with_lazy_default_index, repeats)
+        _time("read_parquet(columns=, filters=)", pushdown, repeats)
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2019 Databricks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+A micro-benchmark of the driver-side planning time of derived DataFrames on wide DataFrames.
+Nothing is executed on the Spark cluster; only the Koalas and Spark planning is measured.
+Before running this, make sure you install koalas from the current checkout by running:
+pip install -e .
+
+Usage: python dev/benchmark_wide_frame.py [number of columns] [number of repeats]
+"""
+
+import sys
+import time
+
+from databricks import koalas as ks
+
+
+def _time(name, func, repeats):
+    func()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    elapsed = (time.perf_counter() - start) / repeats
+    print("{:<32}{:>10.3f} s".format(name, elapsed))
+
+
+def _main():
+    num_columns = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    sdf = ks.range(10).to_spark()
+    sdf = sdf.select(*[(sdf["id"] + i).alias("c{}".format(i)) for i in range(num_columns)])
+    kdf = sdf.to_koalas()
+
+    print("{} columns, average of {} runs".format(num_columns, repeats))
+    _time("to_koalas", lambda: sdf.to_koalas(), repeats)
+    _time("dtypes", lambda: ks.DataFrame(kdf._internal.copy()).dtypes, repeats)
+    _time("arithmetic (kdf + 1)", lambda: kdf + 1, repeats)
+    _time("filter (kdf[kdf.c0 > 1])", lambda: kdf[kdf.c0 > 1], repeats)
+    _time(
+        "column selection",
+        lambda: kdf[["c{}".format(i) for i in range(0, num_columns, 2)]],
+        repeats,
+    )
+    _time("assign", lambda: kdf.assign(new=kdf.c0 * 2), repeats)
+    _time("rename", lambda: kdf.rename(columns=lambda c: c.upper()), repeats)
+
+
+if __name__ == "__main__":
+    _main()